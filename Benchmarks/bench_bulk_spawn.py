@@ -0,0 +1,60 @@
+# bench_bulk_spawn.py
+# Time spawning and deleting a grid of cubes with and without the bridge's bulk operation context.
+# Like bench_delete_actors.py this needs the editor, with the bridge initialized. Open an empty
+# level and run it from the Output Log in "Cmd" mode:
+#   py "<plugin dir>/Benchmarks/bench_bulk_spawn.py" --actors 10000
+# Every static mesh actor in the level is deleted.
+import __main__
+import argparse
+import contextlib
+import time
+
+import unreal
+
+CUBE = "/Engine/BasicShapes/Cube.Cube"
+
+
+def spawn_grid(cube, count):
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    side = int(count ** 0.5) + 1
+    for i in range(count):
+        actor = actor_subsystem.spawn_actor_from_object(cube, unreal.Vector((i % side) * 150.0, (i // side) * 150.0, 0.0))
+        actor.set_actor_label(f"Bench_Cube_{i}")
+
+
+def delete_cubes():
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    for actor in actor_subsystem.get_all_level_actors():
+        if isinstance(actor, unreal.StaticMeshActor):
+            actor_subsystem.destroy_actor(actor)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--actors', type=int, default=10000)
+    args = parser.parse_args()
+
+    # The bridge instance lives in the editor's __main__ once the bridge is started
+    bridge = __main__.mcp_bridge
+    cube = unreal.EditorAssetLibrary.load_asset(CUBE)
+    contexts = (
+        ("per actor", contextlib.nullcontext),
+        ("bulk", lambda: bridge._bulk_operation("Bench Bulk Spawn"))
+    )
+
+    for label, context in contexts:
+        start = time.perf_counter()
+        with context():
+            spawn_grid(cube, args.actors)
+        spawned = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with context():
+            delete_cubes()
+        deleted = time.perf_counter() - start
+
+        unreal.log(f"{label:<10} spawn {args.actors} actors {spawned:.2f} s, delete {deleted:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
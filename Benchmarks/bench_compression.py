@@ -0,0 +1,84 @@
+# bench_compression.py
+# CPU time against bytes on the wire for the compression formats the bridge can negotiate,
+# on get_actors and execute_python sized payloads, with the time a response would take end
+# to end over a few link speeds (compress + transfer + decompress).
+# Runs outside the editor:  python Benchmarks/bench_compression.py --actors 1000 10000 100000
+import argparse
+import json
+import math
+import random
+import time
+import zlib
+
+try:
+    import lz4.block
+except ImportError:
+    lz4 = None
+
+# Link speeds in bytes per second, from loopback down to a slow SSH tunnel
+LINKS = [("loopback", 2e9), ("1 Gbit", 125e6), ("100 Mbit", 12.5e6), ("ssh 20 Mbit", 2.5e6)]
+
+
+def actors_payload(count, rng):
+    """A get_actors response as the bridge encodes it"""
+    return json.dumps({"status": "success", "result": [{
+        "name": f"StaticMeshActor_{i}",
+        "class": "StaticMeshActor",
+        "location": [rng.uniform(-1e5, 1e5), rng.uniform(-1e5, 1e5), rng.uniform(0, 1e3)]
+    } for i in range(count)]}, separators=(',', ':')).encode('utf-8')
+
+
+def python_payload(count, rng):
+    """An execute_python result listing actor labels and bounds"""
+    return json.dumps({"status": "success", "result": "\n".join(
+        f"Tree_{i}: origin=({rng.uniform(-1e5, 1e5):.3f}, {rng.uniform(-1e5, 1e5):.3f}, 0.000) extent=(120.000, 120.000, 450.000)"
+        for i in range(count))}, separators=(',', ':')).encode('utf-8')
+
+
+def codecs():
+    """(label, compress, decompress) for each available format"""
+    found = [("none", lambda data: data, lambda data, size: data),
+             ("zlib 1", lambda data: zlib.compress(data, 1), lambda data, size: zlib.decompress(data)),
+             ("zlib 6", lambda data: zlib.compress(data, 6), lambda data, size: zlib.decompress(data))]
+    if lz4 is not None:
+        found.append(("lz4", lambda data: lz4.block.compress(data, store_size=False),
+                      lambda data, size: lz4.block.decompress(data, uncompressed_size=size)))
+    return found
+
+
+def timed(fn, *args, runs=3):
+    """Result and best time of a few runs"""
+    best = math.inf
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--actors', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    if lz4 is None:
+        print("lz4 is not installed, only zlib is timed")
+
+    rng = random.Random(args.seed)
+    for count in args.actors:
+        for label, payload in (("get_actors", actors_payload(count, rng)), ("execute_python", python_payload(count, rng))):
+            print(f"\n{label}, {count} items, {len(payload) / 1e6:.2f} MB")
+            print(f"  {'codec':<8} {'ratio':>6} {'compress':>10} {'decompress':>11}" +
+                  "".join(f"  {name:>12}" for name, _ in LINKS))
+            for name, compress, decompress in codecs():
+                packed, compress_time = timed(compress, payload)
+                unpacked, decompress_time = timed(decompress, packed, len(payload))
+                assert unpacked == payload
+                totals = [compress_time + len(packed) / speed + decompress_time for _, speed in LINKS]
+                print(f"  {name:<8} {len(payload) / len(packed):5.1f}x {compress_time * 1000:8.1f} ms {decompress_time * 1000:9.1f} ms" +
+                      "".join(f"  {total * 1000:9.1f} ms" for total in totals))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# bench_delete_actors.py
+# Compare the old one-by-one StaticMeshActor delete loop with the bulk delete_actors path.
+# Unlike the other benchmarks this one needs the editor, with the bridge initialized. Open an
+# empty level and run it from the Output Log in "Cmd" mode:
+#   py "<plugin dir>/Benchmarks/bench_delete_actors.py" --actors 50000
+# Every static mesh actor in the level is deleted.
+import __main__
+import argparse
+import time
+
+import unreal
+
+CUBE = "/Engine/BasicShapes/Cube.Cube"
+
+
+def spawn_cubes(count):
+    """Fill the level with cubes on a grid"""
+    cube = unreal.EditorAssetLibrary.load_asset(CUBE)
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    side = int(count ** 0.5) + 1
+    for i in range(count):
+        actor_subsystem.spawn_actor_from_object(cube, unreal.Vector((i % side) * 150.0, (i // side) * 150.0, 0.0))
+
+
+def delete_one_by_one():
+    """The delete_all_static_mesh_actors loop before it went through delete_actors"""
+    actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    static_mesh_actors = [actor for actor in actor_subsystem.get_all_level_actors()
+                          if isinstance(actor, unreal.StaticMeshActor)]
+    for actor in static_mesh_actors:
+        actor.get_actor_label()
+        actor_subsystem.destroy_actor(actor)
+    return len(static_mesh_actors)
+
+
+def delete_bulk():
+    # The bridge instance lives in the editor's __main__ once the bridge is started
+    matched, _ = __main__.mcp_bridge._delete_actors({"class": "StaticMeshActor"})
+    return matched
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--actors', type=int, default=50000)
+    args = parser.parse_args()
+
+    for label, delete in (("one by one", delete_one_by_one), ("delete_actors", delete_bulk)):
+        spawn_cubes(args.actors)
+        start = time.perf_counter()
+        count = delete()
+        elapsed = time.perf_counter() - start
+        unreal.log(f"{label:<14} deleted {count} actors in {elapsed:.2f} s ({elapsed / max(count, 1) * 1e6:.0f} us/actor)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# bench_encoding.py
+# Compare encoding large get_actors style results with mcp_encoding (json and orjson)
+# against the old approach of str() on every Unreal value.
+# Runs outside the editor:  python Benchmarks/bench_encoding.py --actors 10000 100000
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Content', 'Python'))
+import mcp_encoding
+from mcp_encoding import register_encoder, to_json, to_json_stdlib
+
+
+# Stand-ins for the unreal structs, with the same attributes and a repr like the real ones
+class Vector:
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+    def __str__(self):
+        return f"<Struct 'Vector' (0x0000000000000000) {{x: {self.x:f}, y: {self.y:f}, z: {self.z:f}}}>"
+
+
+class Rotator:
+    __slots__ = ('roll', 'pitch', 'yaw')
+
+    def __init__(self, roll, pitch, yaw):
+        self.roll, self.pitch, self.yaw = roll, pitch, yaw
+
+    def __str__(self):
+        return f"<Struct 'Rotator' (0x0000000000000000) {{roll: {self.roll:f}, pitch: {self.pitch:f}, yaw: {self.yaw:f}}}>"
+
+
+class LinearColor:
+    __slots__ = ('r', 'g', 'b', 'a')
+
+    def __init__(self, r, g, b, a):
+        self.r, self.g, self.b, self.a = r, g, b, a
+
+    def __str__(self):
+        return f"<Struct 'LinearColor' (0x0000000000000000) {{r: {self.r:f}, g: {self.g:f}, b: {self.b:f}, a: {self.a:f}}}>"
+
+
+# Registered the way the bridge registers the unreal types
+register_encoder(Vector, lambda v: [v.x, v.y, v.z])
+register_encoder(Rotator, lambda r: [r.roll, r.pitch, r.yaw])
+register_encoder(LinearColor, lambda c: [c.r, c.g, c.b, c.a])
+
+
+def actor_list(count, seed):
+    """Actors as _describe_actor returns them, plus a rotation and a color"""
+    rng = random.Random(seed)
+    return [{
+        "name": f"StaticMeshActor_{i}",
+        "class": "StaticMeshActor",
+        "location": Vector(rng.uniform(-1e5, 1e5), rng.uniform(-1e5, 1e5), rng.uniform(0, 1e3)),
+        "rotation": Rotator(0.0, 0.0, rng.uniform(0, 360)),
+        "color": LinearColor(rng.random(), rng.random(), rng.random(), 1.0)
+    } for i in range(count)]
+
+
+def old_encode(actors):
+    """Before mcp_encoding: every struct sent as its str()"""
+    return json.dumps({"status": "success", "result": [
+        {key: value if isinstance(value, str) else str(value) for key, value in actor.items()}
+        for actor in actors]})
+
+
+def timed(fn, *args, runs=3):
+    """Result and best time of a few runs"""
+    best = math.inf
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--actors', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    encoders = [("str() + json", old_encode),
+                ("json", lambda actors: to_json_stdlib({"status": "success", "result": actors}))]
+    if mcp_encoding.orjson is not None:
+        encoders.append(("orjson", lambda actors: to_json({"status": "success", "result": actors})))
+    else:
+        print("orjson is not installed, only the json module path is timed")
+
+    for count in args.actors:
+        actors = actor_list(count, args.seed)
+        print(f"\n{count} actors")
+        baseline = None
+        decoded = []
+        for label, encode in encoders:
+            text, elapsed = timed(encode, actors)
+            baseline = baseline or elapsed
+            print(f"  {label:<14} {elapsed * 1000:8.1f} ms  {count / elapsed / 1000:7.1f} k actors/s"
+                  f"  {len(text) / 1e6:6.2f} MB  ({baseline / elapsed:4.1f}x)")
+            if label != "str() + json":
+                decoded.append(json.loads(text))
+        # Both mcp_encoding paths must produce the same data
+        assert all(result == decoded[0] for result in decoded)
+
+
+if __name__ == '__main__':
+    main()
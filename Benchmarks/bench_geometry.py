@@ -0,0 +1,79 @@
+# bench_geometry.py
+# Compare the NumPy and pure Python paths of the bridge's bulk placement math.
+# Runs outside the editor:  python Benchmarks/bench_geometry.py --sizes 10000 100000 1000000
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Content', 'Python'))
+import mcp_geometry
+from mcp_geometry import (_grid_positions_numpy, _grid_positions_python,
+                          _rotated_bounds_numpy, _rotated_bounds_python,
+                          _segment_positions_numpy, _segment_positions_python)
+
+
+def timed(fn, *args, runs=3):
+    """Result and best time of a few runs"""
+    best = math.inf
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def compare(label, count, python_fn, numpy_fn, *args):
+    """Time both paths; numpy is timed with and without converting back to lists"""
+    slow, python_time = timed(python_fn, *args)
+    _, array_time = timed(numpy_fn, *args)
+    fast, list_time = timed(lambda *a: numpy_fn(*a).tolist(), *args)
+    print(f"  {label:<16} {count:>9}  python {python_time * 1000:8.1f} ms"
+          f"  numpy {array_time * 1000:7.1f} ms ({python_time / array_time:5.1f}x)"
+          f"  numpy + tolist {list_time * 1000:8.1f} ms ({python_time / list_time:4.1f}x)")
+    return slow, fast
+
+
+def assert_close(a, b):
+    assert len(a) == len(b)
+    for row_a, row_b in zip(a, b):
+        assert all(math.isclose(x, y, rel_tol=1e-9, abs_tol=1e-6) for x, y in zip(row_a, row_b))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    if not mcp_geometry.HAVE_NUMPY:
+        print("NumPy is not installed, only the pure Python path is available")
+        return
+
+    rng = random.Random(args.seed)
+    for count in args.sizes:
+        print(f"\n{count} placements")
+
+        side = int(math.sqrt(count))
+        slow, fast = compare("grid", side * (count // side), _grid_positions_python, _grid_positions_numpy,
+                             side, count // side, 100.0, 120.0, 0.0, 0.0)
+        assert slow == fast
+
+        slow, fast = compare("segment run", count, _segment_positions_python, _segment_positions_numpy,
+                             -3500.0, -3500.0, 3500.0, 2000.0, count)
+        assert slow == fast
+
+        xs = [rng.uniform(-1e5, 1e5) for _ in range(count)]
+        ys = [rng.uniform(-1e5, 1e5) for _ in range(count)]
+        half_xs = [rng.uniform(10.0, 500.0) for _ in range(count)]
+        half_ys = [rng.uniform(10.0, 500.0) for _ in range(count)]
+        yaws = [rng.uniform(0.0, 360.0) for _ in range(count)]
+        slow, fast = compare("rotated bounds", count, _rotated_bounds_python, _rotated_bounds_numpy,
+                             xs, ys, half_xs, half_ys, yaws, 0.0, 0.0)
+        assert_close(slow, fast)
+
+
+if __name__ == '__main__':
+    main()
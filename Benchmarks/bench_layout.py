@@ -0,0 +1,67 @@
+# bench_layout.py
+# Time layout planning for the create_town spec without the editor, and check that
+# the same seed always gives the same plan.
+#   python Benchmarks/bench_layout.py --forest 5000 --workers 4
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Content', 'Python'))
+from mcp_layout import compile_layout, layout_asset_paths
+from mcp_town import town_layout_spec
+
+
+def synthetic_footprints(spec):
+    """Rough bounds extents standing in for the real meshes"""
+    footprints = {}
+    for path in layout_asset_paths(spec):
+        name = path.rsplit('.', 1)[-1].lower()
+        if any(word in name for word in ("house", "hall", "tavern", "mill", "forge", "mine", "tower")):
+            footprints[path] = (600.0, 600.0, 800.0)
+        elif "wall" in name or "fence" in name:
+            footprints[path] = (200.0, 30.0, 150.0)
+        elif "tree" in name:
+            footprints[path] = (150.0, 150.0, 600.0)
+        else:
+            footprints[path] = (40.0, 40.0, 50.0)
+    return footprints
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--forest', type=int, default=500, help='number of forest trees')
+    parser.add_argument('--size', type=float, default=7000.0, help='town width and height')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=0, help='plan on a process pool of this size')
+    parser.add_argument('--tile-size', type=float, default=None, help='override the spec tile size, 0 disables tiling')
+    args = parser.parse_args()
+
+    spec = town_layout_spec(0, 0, args.size, args.size, seed=args.seed)
+    spec["districts"][1]["scatter"][0]["count"] = args.forest
+    if args.tile_size is not None:
+        spec["tile_size"] = args.tile_size
+    footprints = synthetic_footprints(spec)
+
+    executor = concurrent.futures.ProcessPoolExecutor(args.workers) if args.workers else None
+
+    plans = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        plans.append(compile_layout(spec, footprints, executor=executor))
+        elapsed = time.perf_counter() - start
+        plan = plans[-1]
+        print(f"planned {len(plan['placements'])} placements ({plan['dropped']} dropped) in {elapsed * 1000:.1f} ms")
+
+    if executor:
+        executor.shutdown()
+
+    encoded = {json.dumps(plan, sort_keys=True) for plan in plans}
+    print("reproducible" if len(encoded) == 1 else "NOT reproducible")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# bench_spatial_index.py
+# Compare the bridge's spatial index against a brute force scan on a synthetic level.
+# Runs outside the editor:  python Benchmarks/bench_spatial_index.py --actors 100000
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Content', 'Python'))
+from mcp_spatial import SpatialHashGrid, box_distance, boxes_overlap
+
+
+def make_level(num_actors, level_size, rng):
+    """Random props, houses and a few huge actors like a landscape"""
+    level = {}
+    for i in range(num_actors):
+        x = rng.uniform(-level_size, level_size)
+        y = rng.uniform(-level_size, level_size)
+        half = rng.choice((25.0, 50.0, 100.0, 400.0))
+        level[f"Actor_{i}"] = (x - half, y - half, 0.0, x + half, y + half, half * 2)
+    for i in range(4):
+        level[f"Landscape_{i}"] = (-level_size, -level_size, -100.0, level_size, level_size, 0.0)
+    return level
+
+
+def timed(label, queries, fn):
+    start = time.perf_counter()
+    results = [fn(*query) for query in queries]
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:10.1f} ms  ({elapsed / len(queries) * 1e6:9.1f} us/query)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--actors', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--level-size', type=float, default=100000.0)
+    parser.add_argument('--cell-size', type=float, default=1000.0)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    level = make_level(args.actors, args.level_size, rng)
+    items = list(level.items())
+
+    start = time.perf_counter()
+    index = SpatialHashGrid(cell_size=args.cell_size)
+    for key, bounds in items:
+        index.insert(key, bounds)
+    print(f"Indexed {len(index)} actors in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    points = [(rng.uniform(-args.level_size, args.level_size), rng.uniform(-args.level_size, args.level_size), 0.0)
+              for _ in range(args.queries)]
+
+    print("\nquery_radius (r=500)")
+    radius_queries = [(x, y, z, 500.0) for x, y, z in points]
+    fast = timed("index", radius_queries, index.query_radius)
+    slow = timed("brute force", radius_queries,
+                 lambda x, y, z, r: [k for k, b in items if box_distance(b, x, y, z) <= r])
+    assert all(set(a) == set(b) for a, b in zip(fast, slow))
+
+    print("\nquery_box (2000 x 2000)")
+    box_queries = [((x - 1000, y - 1000, -1e9, x + 1000, y + 1000, 1e9),) for x, y, _ in points]
+    fast = timed("index", box_queries, index.query_box)
+    slow = timed("brute force", box_queries, lambda q: [k for k, b in items if boxes_overlap(b, q)])
+    assert all(set(a) == set(b) for a, b in zip(fast, slow))
+
+    print("\nnearest_k (k=10, above the landscape)")
+    nearest_queries = [(x, y, 50.0, 10) for x, y, _ in points]
+    fast = timed("index", nearest_queries, index.nearest_k)
+    slow = timed("brute force", nearest_queries,
+                 lambda x, y, z, k: heapq.nsmallest(k, ((box_distance(b, x, y, z), key) for key, b in items)))
+    assert all([d for d, _ in a] == [d for d, _ in b] for a, b in zip(fast, slow))
+
+    print("\nincremental updates")
+    moves = [(key, rng.uniform(-args.level_size, args.level_size), rng.uniform(-args.level_size, args.level_size))
+             for key, _ in items[:10000]]
+    start = time.perf_counter()
+    for key, x, y in moves:
+        index.insert(key, (x - 50, y - 50, 0.0, x + 50, y + 50, 100.0))
+    elapsed = time.perf_counter() - start
+    print(f"  moved {len(moves)} actors in {elapsed * 1000:.1f} ms ({elapsed / len(moves) * 1e6:.1f} us/move)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# bench_transport.py
+# Round-trip latency of small commands through the client's UnrealConnection.send_command, over
+# TCP loopback and over a Unix domain socket, against the stand-in server in
+# MCPClient/mcp_reference_server.py.
+# Needs the client's dependencies (the mcp package) and a platform with AF_UNIX:
+#   python Benchmarks/bench_transport.py --calls 5000
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+CLIENT_DIR = os.path.join(os.path.dirname(__file__), '..', 'MCPClient')
+sys.path.insert(0, CLIENT_DIR)
+import unreal_mcp_client as client
+
+
+def start_server(port, socket_path):
+    """Run the reference server in its own process, so it doesn't share the GIL with the client"""
+    server = subprocess.Popen([sys.executable, os.path.join(CLIENT_DIR, 'mcp_reference_server.py'),
+                               '--port', str(port), '--socket', socket_path],
+                              stdout=subprocess.DEVNULL)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            probe.connect(socket_path)
+            probe.close()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError("Reference server did not start")
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def measure(connection, calls, warmup, command):
+    """Round-trip times in microseconds, sorted"""
+    for _ in range(warmup):
+        connection.send_command(command)
+    times = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        response = connection.send_command(command)
+        times.append((time.perf_counter() - start) * 1e6)
+        assert response.get("status") == "success", response
+    return sorted(times)
+
+
+def percentile(times, fraction):
+    return times[min(len(times) - 1, int(len(times) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=5000)
+    parser.add_argument('--warmup', type=int, default=200)
+    parser.add_argument('--command', default='get_project_dir')
+    args = parser.parse_args()
+
+    port = free_port()
+    socket_path = os.path.join(tempfile.mkdtemp(), 'unreal_mcp.sock')
+    server = start_server(port, socket_path)
+    try:
+        baseline = None
+        for label, address in (("tcp", f"127.0.0.1:{port}"), ("unix", socket_path)):
+            connection = client.UnrealConnection(label, address)
+            assert connection.connect()
+            times = measure(connection, args.calls, args.warmup, args.command)
+            connection.close()
+
+            p50 = percentile(times, 0.50)
+            baseline = baseline or p50
+            print(f"  {label:<5} p50 {p50:7.1f} us  p99 {percentile(times, 0.99):7.1f} us"
+                  f"  max {times[-1]:8.1f} us  ({baseline / p50:4.2f}x)")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# bench_wait.py
+# Round-trip latency of tiny commands when the server polls its clients with sleeps in between,
+# as the plugin did with a 10 ms sleep, against blocking until data arrives, as it does now.
+# Runs the stand-in server in MCPClient/mcp_reference_server.py in both modes and sends
+# commands through the client's UnrealConnection, paced like an agent issuing tool calls:
+#   python Benchmarks/bench_wait.py --calls 500
+import argparse
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+CLIENT_DIR = os.path.join(os.path.dirname(__file__), '..', 'MCPClient')
+sys.path.insert(0, CLIENT_DIR)
+import unreal_mcp_client as client
+
+# Server modes, as seconds of sleep between polls (0 blocks until data arrives)
+MODES = [("poll 10 ms", 0.01), ("poll 1 ms", 0.001), ("wait", 0)]
+
+
+def start_server(port, poll_interval):
+    """Run the reference server in its own process, so it doesn't share the GIL with the client"""
+    server = subprocess.Popen([sys.executable, os.path.join(CLIENT_DIR, 'mcp_reference_server.py'),
+                               '--port', str(port), '--poll-interval', str(poll_interval)],
+                              stdout=subprocess.DEVNULL)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port)).close()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError("Reference server did not start")
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def measure(connection, calls, command, gap):
+    """Round-trip times in microseconds, sorted, with random pauses between calls like an agent thinking"""
+    # Random, so calls don't fall into step with the server's polling
+    rng = random.Random(1)
+    times = []
+    for _ in range(calls):
+        time.sleep(rng.uniform(0, 2 * gap))
+        start = time.perf_counter()
+        response = connection.send_command(command)
+        times.append((time.perf_counter() - start) * 1e6)
+        assert response.get("status") == "success", response
+    return sorted(times)
+
+
+def percentile(times, fraction):
+    return times[min(len(times) - 1, int(len(times) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=500)
+    parser.add_argument('--gap', type=float, default=0.005, help="Mean seconds between calls")
+    parser.add_argument('--command', default='get_project_dir')
+    args = parser.parse_args()
+
+    for label, poll_interval in MODES:
+        port = free_port()
+        server = start_server(port, poll_interval)
+        try:
+            connection = client.UnrealConnection(label, f"127.0.0.1:{port}")
+            assert connection.connect()
+            times = measure(connection, args.calls, args.command, args.gap)
+            connection.close()
+        finally:
+            server.terminate()
+            server.wait()
+
+        print(f"  {label:<10} p50 {percentile(times, 0.50) / 1000:7.2f} ms  p99 {percentile(times, 0.99) / 1000:7.2f} ms"
+              f"  mean {sum(times) / len(times) / 1000:7.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
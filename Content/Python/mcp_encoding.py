@@ -0,0 +1,62 @@
+# mcp_encoding.py
+# JSON encoding for bridge results. Values json can't handle natively (Unreal
+# structs, objects, names...) are turned into plain numbers, lists and paths by
+# encoders registered per type, instead of being sent as str() dumps clients
+# have to pick apart. Uses orjson when it is installed. Nothing here imports
+# unreal: the bridge registers the Unreal types when it starts.
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Registered (type, encoder) pairs, checked in order for types seen for the first time
+_registered = []
+
+# Encoder by exact type, so each type only walks the registered list once
+_encoders = {}
+
+
+def register_encoder(cls, encoder):
+    """Encode instances of cls (and subclasses) as whatever encoder returns, which may nest further"""
+    _registered.append((cls, encoder))
+    _encoders.clear()
+
+
+def _fallback(obj):
+    """Maps become dicts, other iterables lists, anything else its str()"""
+    if hasattr(obj, 'items'):
+        return {str(key): value for key, value in obj.items()}
+    try:
+        return list(obj)
+    except TypeError:
+        return str(obj)
+
+
+def _default(obj):
+    encoder = _encoders.get(type(obj))
+    if encoder is None:
+        encoder = _fallback
+        for cls, candidate in _registered:
+            if isinstance(obj, cls):
+                encoder = candidate
+                break
+        _encoders[type(obj)] = encoder
+    return encoder(obj)
+
+
+def to_json_stdlib(obj):
+    """Encode with the json module only"""
+    return json.dumps(obj, default=_default, separators=(',', ':'))
+
+
+def to_json(obj):
+    """Encode a result to a compact JSON string"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default).decode('utf-8')
+        except TypeError:
+            # Non string keys, huge ints and the like, json copes with those
+            pass
+    return to_json_stdlib(obj)
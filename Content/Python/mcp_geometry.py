@@ -0,0 +1,102 @@
+# mcp_geometry.py
+# Bulk placement math for the MCP bridge: grid positions, segment runs and
+# rotated bounding boxes, computed as NumPy arrays when NumPy is installed and
+# with plain Python loops otherwise. The public functions return
+# plain lists either way, so callers (and JSON) never see the difference; the
+# _numpy variants hand back the arrays for callers that stay in NumPy. Nothing
+# here imports unreal, so it can be used and benchmarked outside the editor.
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAVE_NUMPY = np is not None
+
+# Below this many items the Python loops win over converting to and from arrays
+NUMPY_MIN_ITEMS = 64
+
+
+def _use_numpy(count):
+    return np is not None and count >= NUMPY_MIN_ITEMS
+
+
+def _grid_positions_python(count_x, count_y, step_x, step_y, origin_x, origin_y):
+    return [[origin_x + x * step_x, origin_y + y * step_y]
+            for x in range(count_x)
+            for y in range(count_y)]
+
+
+def _grid_positions_numpy(count_x, count_y, step_x, step_y, origin_x, origin_y):
+    xs = np.repeat(origin_x + np.arange(count_x) * float(step_x), count_y)
+    ys = np.tile(origin_y + np.arange(count_y) * float(step_y), count_x)
+    return np.column_stack((xs, ys))
+
+
+def grid_positions(count_x, count_y, step_x, step_y, origin_x=0.0, origin_y=0.0):
+    """[x, y] of every cell in a count_x by count_y grid, row by row along X"""
+    if _use_numpy(count_x * count_y):
+        return _grid_positions_numpy(count_x, count_y, step_x, step_y, origin_x, origin_y).tolist()
+    return _grid_positions_python(count_x, count_y, step_x, step_y, origin_x, origin_y)
+
+
+def _segment_positions_python(start_x, start_y, end_x, end_y, count):
+    dx = end_x - start_x
+    dy = end_y - start_y
+    positions = []
+    for i in range(count):
+        t = i / count
+        positions.append([start_x + t * dx, start_y + t * dy])
+    return positions
+
+
+def _segment_positions_numpy(start_x, start_y, end_x, end_y, count):
+    t = np.arange(count) / count
+    return np.column_stack((start_x + t * (end_x - start_x), start_y + t * (end_y - start_y)))
+
+
+def segment_positions(start_x, start_y, end_x, end_y, count):
+    """[x, y] of count evenly spaced points from start towards end, end excluded"""
+    if _use_numpy(count):
+        return _segment_positions_numpy(start_x, start_y, end_x, end_y, count).tolist()
+    return _segment_positions_python(start_x, start_y, end_x, end_y, count)
+
+
+def _rotated_bounds_python(xs, ys, half_xs, half_ys, yaws, min_z, max_z):
+    bounds = []
+    for x, y, half_x, half_y, yaw in zip(xs, ys, half_xs, half_ys, yaws):
+        rad_rotation = math.radians(yaw)
+        cos_rot = abs(math.cos(rad_rotation))
+        sin_rot = abs(math.sin(rad_rotation))
+        extent_x = half_x * cos_rot + half_y * sin_rot
+        extent_y = half_x * sin_rot + half_y * cos_rot
+        bounds.append([x - extent_x, y - extent_y, min_z, x + extent_x, y + extent_y, max_z])
+    return bounds
+
+
+def _rotated_bounds_numpy(xs, ys, half_xs, half_ys, yaws, min_z, max_z):
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    half_xs = np.asarray(half_xs, dtype=float)
+    half_ys = np.asarray(half_ys, dtype=float)
+    rad_rotation = np.radians(np.asarray(yaws, dtype=float))
+    cos_rot = np.abs(np.cos(rad_rotation))
+    sin_rot = np.abs(np.sin(rad_rotation))
+    extent_x = half_xs * cos_rot + half_ys * sin_rot
+    extent_y = half_xs * sin_rot + half_ys * cos_rot
+    z = np.ones_like(xs)
+    return np.column_stack((xs - extent_x, ys - extent_y, z * min_z,
+                            xs + extent_x, ys + extent_y, z * max_z))
+
+
+def rotated_bounds(xs, ys, half_xs, half_ys, yaws, min_z=0.0, max_z=0.0):
+    """
+    Axis aligned boxes around footprints rotated about Z (degrees), as
+    [min_x, min_y, min_z, max_x, max_y, max_z] lists ready for SpatialHashGrid.
+    All arguments but the Z range are sequences of the same length.
+    """
+    if _use_numpy(len(xs)):
+        return _rotated_bounds_numpy(xs, ys, half_xs, half_ys, yaws, min_z, max_z).tolist()
+    return _rotated_bounds_python(xs, ys, half_xs, half_ys, yaws, min_z, max_z)
+
@@ -0,0 +1,478 @@
+# mcp_layout.py
+# Declarative layout specs compiled into flat placement plans.
+#
+# A spec is plain JSON describing districts. Each district may hold explicit
+# placements, scatter rules, segment runs (walls and fences) and paths:
+#
+# {
+#     "seed": 42,
+#     "origin": [0, 0],
+#     "asset_base": "/Game/HandPaintedEnvironment/Assets/Models",
+#     "assets": {"tree": "Tree_1", "cube": "/Engine/BasicShapes/Cube.Cube"},
+#     "tolerance": 10.0,
+#     "search_radius": 80.0,
+#     "tile_size": 2500,
+#     "districts": [
+#         {
+#             "name": "Center",
+#             "placements": [{"asset": "cube", "x": 0, "y": 0, "rotation": 45, "label": "Cube"}],
+#             "scatter": [{"assets": ["tree"], "count": 20, "shape": "disc", "center": [0, 0], "radius": 1500,
+#                          "rotation": [0, 360], "scale": [0.8, 1.2], "label": "Tree_{i}"}],
+#             "segments": [{"asset": "cube", "rect": {"center": [0, 0], "size": [900, 900]},
+#                           "rotation_offset": 90, "gates": [1], "label": "Fence_{side}_{i}"}],
+#             "paths": [{"assets": ["cube"], "points": [[0, 0], [700, 600]], "spacing": 100,
+#                        "jitter": 20, "z": 1, "rotation": [0, 360], "label": "Path_{segment}_{i}"}]
+#         }
+#     ]
+# }
+#
+# Coordinates are relative to the origin. Numeric fields given as [low, high]
+# are sampled uniformly. Asset names without a "/" are resolved as
+# "<asset_base>/<name>.<name>". Compiling needs each asset's bounds extents
+# (the "footprints"), which the bridge reads from the loaded meshes, but
+# nothing here imports unreal so plans can be built and tested anywhere.
+import math
+import random
+
+from mcp_geometry import grid_positions, rotated_bounds, segment_positions
+from mcp_spatial import SpatialHashGrid, find_free_position, rotated_half_extents
+
+
+def resolve_asset_path(spec, asset):
+    """Turn an asset key from a spec into a full asset path"""
+    name = spec.get("assets", {}).get(asset, asset)
+    if "/" in name:
+        return name
+    return f"{spec.get('asset_base', '/Game')}/{name}.{name}"
+
+
+def layout_asset_paths(spec):
+    """All the asset paths a spec refers to, in a stable order"""
+    keys = []
+    for district in spec.get("districts", []):
+        for placement in district.get("placements", []):
+            keys.append(placement["asset"])
+        for rule in district.get("scatter", []):
+            keys.extend(rule["assets"])
+            keys.extend(rule.get("companion", {}).get("assets", []))
+        for run in district.get("segments", []):
+            keys.append(run["asset"])
+            if run.get("gate_asset"):
+                keys.append(run["gate_asset"])
+        for path in district.get("paths", []):
+            keys.extend(path["assets"])
+    return sorted({resolve_asset_path(spec, key) for key in keys})
+
+
+def _sample(rng, value):
+    """A constant, or a uniform sample for [low, high]"""
+    if isinstance(value, (list, tuple)):
+        return rng.uniform(value[0], value[1])
+    return float(value)
+
+
+def _scale(rng, value):
+    """Uniform scale from a constant or a range, or an explicit [x, y, z]"""
+    if isinstance(value, (list, tuple)) and len(value) == 3:
+        return tuple(float(v) for v in value)
+    scale = _sample(rng, value)
+    return (scale, scale, scale)
+
+
+def _candidate(asset, x, y, z, yaw, scale, label, collide=True, parent=None, relative=False, scatter=False):
+    return {
+        "asset": asset,
+        "x": x,
+        "y": y,
+        "z": z,
+        "yaw": yaw,
+        "scale": scale,
+        "label": label,
+        "collide": collide,
+        "parent": parent,
+        "relative": relative,
+        "scatter": scatter
+    }
+
+
+def _run_points(run, origin_x, origin_y, segment_length):
+    """Corner points and closed flag of a segment run"""
+    rect = run.get("rect")
+    if rect is None:
+        points = [(origin_x + x, origin_y + y) for x, y in run["points"]]
+        return points, run.get("closed", False)
+
+    # Inset the rectangle by whole segments, so walls sit inside the area they enclose
+    inset = rect.get("inset_segments", 0) * segment_length
+
+    center_x = origin_x + rect["center"][0]
+    center_y = origin_y + rect["center"][1]
+    half_width = rect["size"][0] / 2 - inset
+    half_height = rect["size"][1] / 2 - inset
+    points = [
+        (center_x - half_width, center_y - half_height),  # Bottom-left
+        (center_x + half_width, center_y - half_height),  # Bottom-right
+        (center_x + half_width, center_y + half_height),  # Top-right
+        (center_x - half_width, center_y + half_height)   # Top-left
+    ]
+    return points, True
+
+
+def _auto_gates(num_segments):
+    """Two gates on long sides, otherwise one in the middle"""
+    if num_segments > 8:
+        return [num_segments // 3, 2 * num_segments // 3]
+    return [num_segments // 2]
+
+
+def expand_district(spec, district, district_index, footprints, seed):
+    """
+    Turn one district into a list of candidate placements.
+
+    Each district draws from its own random stream derived from the seed and
+    its position in the spec, so districts expand the same way no matter which
+    order (or which worker) they are expanded in. A district can set "index"
+    to keep the stream of its position in a larger spec it was split from.
+    """
+    rng = random.Random(f"{seed}/{district.get('index', district_index)}")
+    origin_x, origin_y = spec.get("origin", (0.0, 0.0))
+    candidates = []
+
+    for placement in district.get("placements", []):
+        parent = placement.get("attach_to")
+        x = placement.get("x", 0.0)
+        y = placement.get("y", 0.0)
+        if not parent:
+            x += origin_x
+            y += origin_y
+        candidates.append(_candidate(
+            resolve_asset_path(spec, placement["asset"]),
+            x, y, placement.get("z", 0.0),
+            _sample(rng, placement.get("rotation", 0.0)),
+            _scale(rng, placement.get("scale", 1.0)),
+            placement.get("label"),
+            collide=not parent,
+            parent=parent,
+            relative=bool(parent)))
+
+    for rule in district.get("scatter", []):
+        assets = [resolve_asset_path(spec, asset) for asset in rule["assets"]]
+        center_x = origin_x + rule["center"][0]
+        center_y = origin_y + rule["center"][1]
+        shape = rule.get("shape", "disc")
+        companion = rule.get("companion")
+        label = rule.get("label", "Scatter_{i}")
+
+        for i in range(int(rule["count"])):
+            if shape == "disc":
+                angle = rng.uniform(0, 2 * math.pi)
+                distance = rng.uniform(rule.get("min_radius", 0.0), rule["radius"])
+                x = center_x + distance * math.cos(angle)
+                y = center_y + distance * math.sin(angle)
+            elif shape == "box":
+                x = center_x + rng.uniform(-rule["size"][0] / 2, rule["size"][0] / 2)
+                y = center_y + rng.uniform(-rule["size"][1] / 2, rule["size"][1] / 2)
+            else:
+                raise ValueError(f"Unknown scatter shape '{shape}'")
+
+            # Keep out of excluded areas
+            excluded = False
+            for area in rule.get("exclude", []):
+                if math.hypot(x - origin_x - area["center"][0], y - origin_y - area["center"][1]) < area["radius"]:
+                    excluded = True
+                    break
+            if excluded:
+                continue
+
+            item_label = label.format(i=i)
+            candidates.append(_candidate(
+                rng.choice(assets), x, y, _sample(rng, rule.get("z", 0.0)),
+                _sample(rng, rule.get("rotation", 0.0)),
+                _scale(rng, rule.get("scale", 1.0)),
+                item_label,
+                scatter=True))
+
+            # Companions (undergrowth, clutter) only appear if their parent gets placed
+            if companion and rng.random() < companion.get("chance", 1.0):
+                offset = companion.get("offset", 0.0)
+                candidates.append(_candidate(
+                    resolve_asset_path(spec, rng.choice(companion["assets"])),
+                    x + rng.uniform(-offset, offset),
+                    y + rng.uniform(-offset, offset),
+                    _sample(rng, companion.get("z", 0.0)),
+                    _sample(rng, companion.get("rotation", 0.0)),
+                    _scale(rng, companion.get("scale", 1.0)),
+                    companion.get("label", item_label + "_Companion").format(i=i),
+                    parent=item_label,
+                    scatter=True))
+
+    for run in district.get("segments", []):
+        asset = resolve_asset_path(spec, run["asset"])
+        if asset not in footprints:
+            continue
+
+        scale = _scale(rng, run.get("scale", 1.0))
+        z = run.get("z", 0.0)
+        rotation_offset = run.get("rotation_offset", 0.0)
+        label = run.get("label", "Segment_{side}_{i}")
+        gate_asset = resolve_asset_path(spec, run["gate_asset"]) if run.get("gate_asset") else None
+        gate_label = run.get("gate_label", "Gate_{side}_{i}")
+
+        # Segments overlap slightly so there are no gaps between them
+        segment_length = footprints[asset][0] * scale[0]
+        effective_segment_length = segment_length * (1 - run.get("overlap", 0.05))
+
+        points, closed = _run_points(run, origin_x, origin_y, segment_length)
+        num_sides = len(points) if closed else len(points) - 1
+        gate_sides = run.get("gate_sides")
+
+        for side in range(num_sides):
+            start_x, start_y = points[side]
+            end_x, end_y = points[(side + 1) % len(points)]
+            dx = end_x - start_x
+            dy = end_y - start_y
+            distance = math.sqrt(dx*dx + dy*dy)
+            angle = math.degrees(math.atan2(dy, dx))
+            num_segments = max(1, math.ceil(distance / effective_segment_length))
+
+            gates = []
+            if gate_sides is None or side in gate_sides:
+                gates = run.get("gates", [])
+                if gates == "auto":
+                    gates = _auto_gates(num_segments)
+
+            positions = segment_positions(start_x, start_y, end_x, end_y, num_segments)
+            for i, (x, y) in enumerate(positions):
+                if i in gates:
+                    continue
+                candidates.append(_candidate(
+                    asset, x, y, z,
+                    angle + rotation_offset, scale,
+                    label.format(side=side, i=i)))
+
+            if gate_asset:
+                for gate in gates:
+                    t = gate / num_segments
+                    candidates.append(_candidate(
+                        gate_asset, start_x + t * dx, start_y + t * dy, z,
+                        angle + run.get("gate_rotation_offset", 90.0), (1.0, 1.0, 1.0),
+                        gate_label.format(side=side, i=gate)))
+
+    for path in district.get("paths", []):
+        assets = [resolve_asset_path(spec, asset) for asset in path["assets"]]
+        points = [(origin_x + x, origin_y + y) for x, y in path["points"]]
+        spacing = path.get("spacing", 100.0)
+        jitter = path.get("jitter", 0.0)
+        label = path.get("label", "Path_{segment}_{i}")
+
+        for segment in range(len(points) - 1):
+            start_x, start_y = points[segment]
+            end_x, end_y = points[segment + 1]
+            dx = end_x - start_x
+            dy = end_y - start_y
+            num_tiles = int(math.sqrt(dx*dx + dy*dy) / spacing)
+
+            for i in range(num_tiles):
+                t = i / num_tiles
+                candidates.append(_candidate(
+                    rng.choice(assets),
+                    start_x + t * dx + rng.uniform(-jitter, jitter),
+                    start_y + t * dy + rng.uniform(-jitter, jitter),
+                    path.get("z", 0.0),
+                    _sample(rng, path.get("rotation", 0.0)),
+                    _scale(rng, path.get("scale", 1.0)),
+                    label.format(segment=segment, i=i)))
+
+    return candidates
+
+
+def _footprint_half_extents(footprint, scale, yaw):
+    """Half extents of a scaled footprint's axis aligned box after rotating by yaw"""
+    return rotated_half_extents(footprint[0] * scale[0] / 2, footprint[1] * scale[1] / 2, yaw)
+
+
+def resolve_placements(candidates, footprints, tolerance=10.0, search_radius=80.0, index=None, placed=None):
+    """
+    Resolve collisions between candidates in order, first come first served.
+
+    A colliding candidate moves to the closest free spot within search_radius or
+    is dropped. Candidates with a parent are dropped when the parent was, and
+    attached ones follow their parent's final position. An index and label
+    positions from earlier placements can be passed in to resolve against.
+    Returns the placement list and the number of dropped candidates.
+    """
+    if index is None:
+        index = SpatialHashGrid(cell_size=500.0)
+    if placed is None:
+        placed = {}
+    placements = []
+    dropped = 0
+
+    for candidate in candidates:
+        footprint = footprints.get(candidate["asset"])
+        parent = candidate["parent"]
+        if footprint is None or (parent and parent not in placed):
+            dropped += 1
+            continue
+
+        x = candidate["x"]
+        y = candidate["y"]
+        if candidate["relative"]:
+            parent_x, parent_y = placed[parent]
+            x += parent_x
+            y += parent_y
+
+        if candidate["collide"]:
+            half_x, half_y = _footprint_half_extents(footprint, candidate["scale"], candidate["yaw"])
+            position = find_free_position(index, half_x, half_y, x, y, search_radius, tolerance=tolerance)
+            if position is None:
+                dropped += 1
+                continue
+            x, y = position
+            index.insert(len(index), (x - half_x, y - half_y, 0.0, x + half_x, y + half_y, 0.0))
+
+        if candidate["label"]:
+            placed[candidate["label"]] = (x, y)
+        placements.append({
+            "asset": candidate["asset"],
+            "label": candidate["label"],
+            "location": [x, y, candidate["z"]],
+            "rotation": [0.0, 0.0, candidate["yaw"]],
+            "scale": list(candidate["scale"])
+        })
+
+    return placements, dropped
+
+
+def _expand_job(job):
+    """expand_district for executor.map"""
+    return expand_district(*job)
+
+
+def _resolve_tile_job(job):
+    """resolve_placements for one tile, against the boxes already placed over it"""
+    candidates, footprints, tolerance, search_radius, boxes = job
+    index = SpatialHashGrid(cell_size=500.0)
+    for key, box in enumerate(boxes):
+        index.insert(key, box)
+    return resolve_placements(candidates, footprints, tolerance, search_radius, index)
+
+
+def _resolve_tiled(candidates, footprints, tolerance, search_radius, tile_size, map_fn):
+    """
+    Resolve scatter collisions tile by tile, so tiles can be resolved in parallel.
+
+    Fixed placements, segments and paths keep their priority and are resolved
+    first, in order. Scatter candidates that could only ever touch their own
+    tile are then resolved per tile against those. Scatter candidates near a
+    tile edge, and anything with a parent, are resolved last in order against
+    everything placed so far. The result only depends on tile_size, never on
+    how many workers there are.
+    """
+    index = SpatialHashGrid(cell_size=500.0)
+    placed = {}
+    placements, dropped = resolve_placements([candidate for candidate in candidates if not candidate["scatter"]],
+                                             footprints, tolerance, search_radius, index, placed)
+
+    tiles = {}
+    border = []
+    for candidate in candidates:
+        if not candidate["scatter"]:
+            continue
+        footprint = footprints.get(candidate["asset"])
+        if footprint is None or candidate["parent"] or not candidate["collide"]:
+            border.append(candidate)
+            continue
+
+        # Furthest any part of the footprint can end up from the requested point
+        scale = candidate["scale"]
+        reach = search_radius + tolerance + (footprint[0] * scale[0] + footprint[1] * scale[1]) / 2
+
+        x = candidate["x"]
+        y = candidate["y"]
+        tile_x = math.floor(x / tile_size)
+        tile_y = math.floor(y / tile_size)
+        if (x - reach > tile_x * tile_size and x + reach < (tile_x + 1) * tile_size and
+                y - reach > tile_y * tile_size and y + reach < (tile_y + 1) * tile_size):
+            tiles.setdefault((tile_x, tile_y), []).append(candidate)
+        else:
+            border.append(candidate)
+
+    # Each tile only needs the earlier placements overlapping it
+    jobs = []
+    for tile_x, tile_y in sorted(tiles):
+        tile_box = (tile_x * tile_size, tile_y * tile_size, -math.inf,
+                    (tile_x + 1) * tile_size, (tile_y + 1) * tile_size, math.inf)
+        boxes = [index.bounds(key) for key in sorted(index.query_box(tile_box))]
+        jobs.append((tiles[(tile_x, tile_y)], footprints, tolerance, search_radius, boxes))
+
+    tile_placements = []
+    for job_placements, job_dropped in map_fn(_resolve_tile_job, jobs):
+        dropped += job_dropped
+        tile_placements.extend(job_placements)
+
+    # Index everything the tiles placed in one bulk pass
+    bounds = rotated_bounds(
+        [placement["location"][0] for placement in tile_placements],
+        [placement["location"][1] for placement in tile_placements],
+        [footprints[placement["asset"]][0] * placement["scale"][0] / 2 for placement in tile_placements],
+        [footprints[placement["asset"]][1] * placement["scale"][1] / 2 for placement in tile_placements],
+        [placement["rotation"][2] for placement in tile_placements])
+    first_key = len(index)
+    for key, (placement, box) in enumerate(zip(tile_placements, bounds), first_key):
+        index.insert(key, box)
+        if placement["label"]:
+            placed[placement["label"]] = tuple(placement["location"][:2])
+
+    border_placements, border_dropped = resolve_placements(border, footprints, tolerance, search_radius, index, placed)
+    return placements + tile_placements + border_placements, dropped + border_dropped
+
+
+def compile_layout(spec, footprints, seed=None, executor=None):
+    """
+    Compile a layout spec into a flat, collision resolved placement plan.
+
+    footprints maps asset paths to their bounds extents (x, y, z). Rotation in
+    the plan is (roll, pitch, yaw) in degrees. The seed used is returned with
+    the plan, so any plan can be reproduced.
+
+    With a concurrent.futures executor, districts are expanded in parallel,
+    and if the spec sets a "tile_size" collisions are resolved per tile in
+    parallel too. Process pools work as everything here is picklable.
+    """
+    if seed is None:
+        seed = spec.get("seed")
+    if seed is None:
+        seed = random.randrange(2**32)
+
+    map_fn = executor.map if executor else map
+
+    districts = spec.get("districts", [])
+    jobs = [(spec, district, district_index, footprints, seed) for district_index, district in enumerate(districts)]
+    candidates = []
+    for district_candidates in map_fn(_expand_job, jobs):
+        candidates.extend(district_candidates)
+
+    tolerance = spec.get("tolerance", 10.0)
+    search_radius = spec.get("search_radius", 80.0)
+    if spec.get("tile_size"):
+        placements, dropped = _resolve_tiled(candidates, footprints, tolerance, search_radius,
+                                             float(spec["tile_size"]), map_fn)
+    else:
+        placements, dropped = resolve_placements(candidates, footprints, tolerance, search_radius)
+    return {"seed": seed, "placements": placements, "dropped": dropped}
+
+
+def plan_grid(asset, tile_width, tile_length, grid_width, grid_length):
+    """Placements for a grid of tiles laid out from the origin along +X and +Y"""
+    positions = grid_positions(grid_width, grid_length, tile_width, tile_length)
+    return [
+        {
+            "asset": asset,
+            "label": f"FloorTile_{i // grid_length}_{i % grid_length}",
+            "location": [x, y, 0.0],
+            "rotation": [0.0, 0.0, 0.0],
+            "scale": [1.0, 1.0, 1.0]
+        }
+        for i, (x, y) in enumerate(positions)
+    ]
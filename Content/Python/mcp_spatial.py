@@ -0,0 +1,254 @@
+# mcp_spatial.py
+# Pure Python spatial index used by the MCP bridge. Nothing here imports unreal,
+# so it can be used and benchmarked outside the editor.
+import functools
+import heapq
+import math
+
+
+def box_distance(bounds, x, y, z):
+    """Distance from a point to an axis aligned box (0 when the point is inside)"""
+    min_x, min_y, min_z, max_x, max_y, max_z = bounds
+    dx = max(min_x - x, 0.0, x - max_x)
+    dy = max(min_y - y, 0.0, y - max_y)
+    dz = max(min_z - z, 0.0, z - max_z)
+    return math.sqrt(dx*dx + dy*dy + dz*dz)
+
+
+def boxes_overlap(a, b):
+    """Check if two (min_x, min_y, min_z, max_x, max_y, max_z) boxes overlap"""
+    return (a[0] <= b[3] and a[3] >= b[0] and
+            a[1] <= b[4] and a[4] >= b[1] and
+            a[2] <= b[5] and a[5] >= b[2])
+
+
+def rotated_half_extents(half_x, half_y, rotation_z):
+    """Half extents of the axis aligned box around a footprint rotated about Z (degrees)"""
+    rad_rotation = math.radians(rotation_z)
+    cos_rot = abs(math.cos(rad_rotation))
+    sin_rot = abs(math.sin(rad_rotation))
+    return half_x * cos_rot + half_y * sin_rot, half_x * sin_rot + half_y * cos_rot
+
+
+class SpatialHashGrid:
+    """
+    Uniform grid over the XY plane holding 3D bounding boxes by key.
+
+    Each box is registered in every cell it overlaps. Boxes covering more than
+    max_cells_per_item cells (landscapes, sky spheres...) are kept in a separate
+    list that every query checks, so they don't flood the grid.
+    """
+
+    def __init__(self, cell_size=1000.0, max_cells_per_item=256):
+        self.cell_size = float(cell_size)
+        self.max_cells_per_item = max_cells_per_item
+        self._bounds = {}
+        self._cells = {}
+        self._large = set()
+
+        # Occupied cell extents, only ever grown, used to bound nearest_k
+        self._cell_extent = None
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def __contains__(self, key):
+        return key in self._bounds
+
+    def bounds(self, key):
+        """Get the bounds stored for a key, or None"""
+        return self._bounds.get(key)
+
+    def _cell_range(self, min_x, min_y, max_x, max_y):
+        size = self.cell_size
+        return (int(math.floor(min_x / size)), int(math.floor(min_y / size)),
+                int(math.floor(max_x / size)), int(math.floor(max_y / size)))
+
+    def insert(self, key, bounds):
+        """Insert or move a (min_x, min_y, min_z, max_x, max_y, max_z) box"""
+        if key in self._bounds:
+            self.remove(key)
+
+        bounds = tuple(float(v) for v in bounds)
+        self._bounds[key] = bounds
+
+        cx0, cy0, cx1, cy1 = self._cell_range(bounds[0], bounds[1], bounds[3], bounds[4])
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > self.max_cells_per_item:
+            self._large.add(key)
+            return
+
+        extent = self._cell_extent
+        if extent is None:
+            self._cell_extent = [cx0, cy0, cx1, cy1]
+        else:
+            extent[0] = min(extent[0], cx0)
+            extent[1] = min(extent[1], cy0)
+            extent[2] = max(extent[2], cx1)
+            extent[3] = max(extent[3], cy1)
+
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = cell = set()
+                cell.add(key)
+
+    def remove(self, key):
+        """Remove a key, ignoring keys that aren't indexed"""
+        bounds = self._bounds.pop(key, None)
+        if bounds is None:
+            return
+
+        if key in self._large:
+            self._large.discard(key)
+            return
+
+        cells = self._cells
+        cx0, cy0, cx1, cy1 = self._cell_range(bounds[0], bounds[1], bounds[3], bounds[4])
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(key)
+                    if not cell:
+                        del cells[(cx, cy)]
+
+    def clear(self):
+        self._bounds.clear()
+        self._cells.clear()
+        self._large.clear()
+        self._cell_extent = None
+
+    @staticmethod
+    def _ring_cells(origin_x, origin_y, ring):
+        """Cells on the outline of the square ring cells away from the origin cell"""
+        if ring == 0:
+            yield origin_x, origin_y
+            return
+        for cx in range(origin_x - ring, origin_x + ring + 1):
+            yield cx, origin_y - ring
+            yield cx, origin_y + ring
+        for cy in range(origin_y - ring + 1, origin_y + ring):
+            yield origin_x - ring, cy
+            yield origin_x + ring, cy
+
+    def _candidates(self, min_x, min_y, max_x, max_y):
+        """Keys registered in the cells overlapping an XY rectangle"""
+        found = set(self._large)
+        cells = self._cells
+        cx0, cy0, cx1, cy1 = self._cell_range(min_x, min_y, max_x, max_y)
+
+        # A huge query is cheaper to answer from the occupied cells than by walking the rectangle
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            for (cx, cy), cell in cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    found.update(cell)
+            return found
+
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    def query_box(self, bounds):
+        """Keys whose boxes overlap the query box"""
+        all_bounds = self._bounds
+        return [key for key in self._candidates(bounds[0], bounds[1], bounds[3], bounds[4])
+                if boxes_overlap(all_bounds[key], bounds)]
+
+    def is_box_free(self, bounds):
+        """Check that nothing in the index overlaps the box"""
+        all_bounds = self._bounds
+        for key in self._candidates(bounds[0], bounds[1], bounds[3], bounds[4]):
+            if boxes_overlap(all_bounds[key], bounds):
+                return False
+        return True
+
+    def query_radius(self, x, y, z, radius):
+        """Keys whose boxes come within radius of a point"""
+        all_bounds = self._bounds
+        return [key for key in self._candidates(x - radius, y - radius, x + radius, y + radius)
+                if box_distance(all_bounds[key], x, y, z) <= radius]
+
+    def nearest_k(self, x, y, z, k=1):
+        """The k nearest keys to a point as a sorted list of (distance, key)"""
+        if k <= 0 or not self._bounds:
+            return []
+
+        all_bounds = self._bounds
+        seen = set(self._large)
+        best = [(box_distance(all_bounds[key], x, y, z), key) for key in self._large]
+
+        size = self.cell_size
+        cells = self._cells
+        origin_x = int(math.floor(x / size))
+        origin_y = int(math.floor(y / size))
+
+        # Stop expanding once the rings have passed every occupied cell
+        max_ring = -1
+        if self._cell_extent is not None:
+            min_cx, min_cy, max_cx, max_cy = self._cell_extent
+            max_ring = max(origin_x - min_cx, max_cx - origin_x, origin_y - min_cy, max_cy - origin_y)
+
+        ring = 0
+        while ring <= max_ring:
+            for cell_key in self._ring_cells(origin_x, origin_y, ring):
+                cell = cells.get(cell_key)
+                if not cell:
+                    continue
+                for key in cell:
+                    if key not in seen:
+                        seen.add(key)
+                        best.append((box_distance(all_bounds[key], x, y, z), key))
+
+            # Anything in a further ring is at least this far away
+            if len(best) >= k and heapq.nsmallest(k, best)[-1][0] <= ring * size:
+                break
+            ring += 1
+
+        return heapq.nsmallest(k, best)
+
+
+@functools.lru_cache(maxsize=32)
+def _spiral_offsets(rings):
+    """Lattice offsets within a circle of the given number of rings, nearest first"""
+    offsets = [(i, j)
+               for i in range(-rings, rings + 1)
+               for j in range(-rings, rings + 1)
+               if i*i + j*j <= rings*rings]
+    offsets.sort(key=lambda o: (o[0]*o[0] + o[1]*o[1], math.atan2(o[1], o[0])))
+    return offsets
+
+
+def find_free_position(index, half_x, half_y, near_x, near_y, radius,
+                       min_z=-math.inf, max_z=math.inf, step=None, tolerance=0.0, max_rings=256):
+    """
+    Find the free spot closest to (near_x, near_y) for a footprint.
+
+    Candidates are tried on a lattice spiralling out from the requested point, so
+    the same index and arguments always give the same answer. Only boxes reaching
+    into the [min_z, max_z] slab count as obstacles. Returns (x, y) or None when
+    nothing within radius is free.
+    """
+    if not step or step <= 0:
+        step = max(min(half_x, half_y), 1.0)
+        # A footprint wider than the search circle would leave no rings beyond the requested point
+        if radius > 0:
+            step = min(step, radius / 8)
+
+    rings = int(radius // step)
+    if rings > max_rings:
+        step = radius / max_rings
+        rings = max_rings
+
+    extent_x = half_x + tolerance
+    extent_y = half_y + tolerance
+    for i, j in _spiral_offsets(rings):
+        x = near_x + i * step
+        y = near_y + j * step
+        if index.is_box_free((x - extent_x, y - extent_y, min_z, x + extent_x, y + extent_y, max_z)):
+            return x, y
+    return None
@@ -0,0 +1,283 @@
+# mcp_town.py
+# The create_town layout expressed as a spec for mcp_layout.
+
+
+def town_layout_spec(town_center_x=1250, town_center_y=1250, town_width=7000, town_height=7000, seed=None):
+    """Layout spec for the HandPaintedEnvironment fantasy town"""
+
+    # Place streetlights around the town square, skipping the middle of each side for the entrances
+    square_size = 90
+    light_spacing = 30
+    square_lights = []
+    for i in range(4):
+        for j in (0, 2):
+            if i == 0:  # North side
+                x, y, rot = -square_size/2 + j * light_spacing, -square_size/2, 0
+            elif i == 1:  # East side
+                x, y, rot = square_size/2, -square_size/2 + j * light_spacing, 90
+            elif i == 2:  # South side
+                x, y, rot = square_size/2 - j * light_spacing, square_size/2, 180
+            else:  # West side
+                x, y, rot = -square_size/2, square_size/2 - j * light_spacing, 270
+            square_lights.append({"asset": "lamppost", "x": x, "y": y, "rotation": rot, "label": f"Square_Light_{i}_{j}"})
+
+    # Gardens next to the houses
+    garden_houses = [(-2000, -1900), (-1300, -2000), (2400, 1200), (-1200, 1950)]
+    gardens = [
+        {
+            "assets": ["flowers_1", "flowers_2", "plant", "bush_1"],
+            "shape": "box",
+            "center": [house_x + 250, house_y + 250],
+            "size": [200, 200],
+            "count": 5,
+            "rotation": [0, 360],
+            "label": f"Garden_{idx}_Plant_{{i}}"
+        }
+        for idx, (house_x, house_y) in enumerate(garden_houses)
+    ]
+
+    # Fenced gardens, with a gate in the front
+    fenced_gardens = [
+        ((-1800, -1900), (30, 30), "fence", "North_House_1_Garden"),
+        ((2400, 1200), (25, 30), "fence_1", "East_House_1_Garden"),
+        ((1300, 2200), (35, 35), "fence_2", "South_LargeHouse_Garden")
+    ]
+    fences = [
+        {
+            "asset": fence_type,
+            "rect": {"center": list(center), "size": list(size)},
+            "rotation_offset": 90,
+            "gates": [1],
+            "gate_sides": [0],
+            "label": f"{name}_Fence_{{side}}_{{i}}"
+        }
+        for center, size, fence_type, name in fenced_gardens
+    ]
+
+    # Town square with entrances on all sides
+    fences.append({
+        "asset": "stone_fence",
+        "rect": {"center": [0, 0], "size": [90, 90]},
+        "rotation_offset": 90,
+        "gates": [1],
+        "label": "Town_Square_Fence_{side}_{i}"
+    })
+
+    return {
+        "seed": seed,
+        "origin": [town_center_x, town_center_y],
+        "asset_base": "/Game/HandPaintedEnvironment/Assets/Models",
+        "assets": {
+            "town_hall": "Town_Hall",
+            "large_house": "Large_house",
+            "small_house": "Small_house",
+            "baker_house": "Baker_house",
+            "tavern": "Tavern",
+            "witch_house": "Witch_house",
+            "tower": "Tower",
+            "mill": "Mill",
+            "mill_wings": "Mill_wings",
+            "woodmill": "Woodmill",
+            "woodmill_saw": "Woodmill_Saw",
+            "forge": "Forge",
+            "mine": "Mine",
+            "tree_1": "Tree_1",
+            "tree_2": "Tree_2",
+            "tree_4": "Tree_4",
+            "pine_tree": "Pine_tree",
+            "pine_tree_2": "Pine_tree_2",
+            "bush_1": "Bush_1",
+            "bush_2": "Bush_2",
+            "fern": "Fern",
+            "flowers_1": "Flowers_1",
+            "flowers_2": "Flowers_2",
+            "plant": "Plant",
+            "rock_1": "Rock_1",
+            "rock_2": "Rock_2",
+            "rock_3": "Rock_3",
+            "rock_4": "Rock_4",
+            "mushroom_1": "Mushroom_1",
+            "mushroom_2": "Mushroom_2",
+            "fence": "Fence",
+            "fence_1": "Fence_1",
+            "fence_2": "Fence_2",
+            "stone_fence": "Stone_fence",
+            "wall_1": "Wall_1",
+            "anvil": "Anvil",
+            "barrel": "Barrel",
+            "chest": "Chest",
+            "cauldron": "Cauldron",
+            "altar": "Altar",
+            "well": "Well",
+            "trolley": "Trolley",
+            "lamppost": "Lamppost",
+            "tile_1": "Tile_1",
+            "tile_2": "Tile_2",
+            "tile_3": "Tile_3",
+            "tile_4": "Tile_4",
+            "tile_5": "Tile_5",
+            "tile_6": "Tile_6",
+            "tile_7": "Tile_7"
+        },
+        "tolerance": 10.0,
+        "search_radius": 80.0,
+        "tile_size": 2500,
+        "districts": [
+            {
+                "name": "Buildings",
+                "placements": [
+                    {"asset": "town_hall", "x": 0, "y": 0, "rotation": 0, "label": "Central_TownHall"},
+                    {"asset": "tavern", "x": 800, "y": 600, "rotation": 135, "label": "Tavern"},
+
+                    # North district
+                    {"asset": "small_house", "x": -1800, "y": -1900, "rotation": 45, "label": "North_House_1"},
+                    {"asset": "baker_house", "x": -2100, "y": -2200, "rotation": 30, "label": "North_BakerHouse"},
+                    {"asset": "small_house", "x": -1300, "y": -2000, "rotation": 15, "label": "North_House_2"},
+
+                    # East district
+                    {"asset": "large_house", "x": 2200, "y": -1300, "rotation": 270, "label": "East_LargeHouse"},
+                    {"asset": "small_house", "x": 2400, "y": 1200, "rotation": 300, "label": "East_House_1"},
+                    {"asset": "small_house", "x": 1900, "y": -1700, "rotation": 315, "label": "East_House_2"},
+
+                    # South district
+                    {"asset": "large_house", "x": 1300, "y": 2100, "rotation": 180, "label": "South_LargeHouse"},
+                    {"asset": "small_house", "x": -1200, "y": 1950, "rotation": 135, "label": "South_House_1"},
+
+                    # West district
+                    {"asset": "large_house", "x": -2000, "y": 1100, "rotation": 90, "label": "West_LargeHouse"},
+                    {"asset": "small_house", "x": -2300, "y": 1500, "rotation": 45, "label": "West_House_1"},
+
+                    # Special buildings, with their moving parts attached
+                    {"asset": "tower", "x": -3000, "y": -2900, "rotation": 45, "label": "North_Tower"},
+                    {"asset": "witch_house", "x": 3000, "y": 2900, "rotation": 215, "label": "WitchHouse"},
+                    {"asset": "mill", "x": 2900, "y": -3000, "rotation": 270, "label": "Watermill"},
+                    {"asset": "mill_wings", "attach_to": "Watermill", "rotation": 270, "label": "Watermill_Wings"},
+                    {"asset": "woodmill", "x": -2900, "y": -2400, "rotation": 135, "label": "Woodmill"},
+                    {"asset": "woodmill_saw", "attach_to": "Woodmill", "rotation": 135, "label": "Woodmill_Saw"},
+                    {"asset": "forge", "x": 1600, "y": -1500, "rotation": 330, "label": "Forge"},
+                    {"asset": "mine", "x": -2900, "y": 2900, "rotation": 135, "label": "Mine"}
+                ]
+            },
+            {
+                "name": "Nature",
+                "scatter": [
+                    # Forest near the witch's house
+                    {
+                        "assets": ["tree_1", "tree_2", "tree_4", "pine_tree", "pine_tree_2"],
+                        "shape": "disc",
+                        "center": [2900, 2200],
+                        "radius": 1500,
+                        "count": 500,
+                        "rotation": [0, 360],
+                        "scale": [0.8, 1.2],
+                        "label": "Forest_Tree_{i}",
+                        "companion": {
+                            "chance": 0.6,
+                            "assets": ["bush_1", "bush_2", "fern", "mushroom_1", "mushroom_2"],
+                            "offset": 100,
+                            "rotation": [0, 360],
+                            "scale": [0.7, 1.0],
+                            "label": "Forest_Undergrowth_{i}"
+                        }
+                    },
+                    # Scattered trees around town, outside the forest
+                    {
+                        "assets": ["tree_1", "tree_2", "tree_4"],
+                        "shape": "disc",
+                        "center": [0, 0],
+                        "min_radius": 3000,
+                        "radius": 3000,
+                        "count": 100,
+                        "rotation": [0, 360],
+                        "scale": [0.9, 1.1],
+                        "exclude": [{"center": [2900, 2200], "radius": 1500}],
+                        "label": "Town_Tree_{i}"
+                    },
+                    # Rocks
+                    {
+                        "assets": ["rock_1", "rock_2", "rock_3", "rock_4"],
+                        "shape": "disc",
+                        "center": [0, 0],
+                        "min_radius": 3000,
+                        "radius": 3000,
+                        "count": 15,
+                        "rotation": [0, 360],
+                        "scale": [0.8, 1.5],
+                        "label": "Rock_{i}"
+                    }
+                ] + gardens
+            },
+            {
+                "name": "Fences",
+                "segments": fences
+            },
+            {
+                "name": "Walls",
+                "segments": [
+                    {
+                        "asset": "wall_1",
+                        "rect": {"center": [0, 0], "size": [town_width, town_height], "inset_segments": 1},
+                        "gates": "auto",
+                        "gate_asset": "tower",
+                        "gate_rotation_offset": 90,
+                        "label": "Town_Wall_Wall1_{side}_{i}",
+                        "gate_label": "Gate_Tower_{side}_{i}"
+                    }
+                ]
+            },
+            {
+                "name": "Props",
+                "placements": [
+                    {"asset": "well", "x": 150, "y": -150, "rotation": 0, "label": "Town_Center_Well"}
+                ] + square_lights + [
+                    # Forge
+                    {"asset": "anvil", "x": 650, "y": -580, "rotation": 45, "label": "Forge_Anvil"},
+                    {"asset": "barrel", "x": 530, "y": -560, "rotation": 0, "label": "Forge_Barrel"},
+
+                    # Tavern
+                    {"asset": "chest", "x": 600, "y": 720, "rotation": 45, "label": "Tavern_Chest"},
+
+                    # Witch's house
+                    {"asset": "altar", "x": 1950, "y": 1600, "rotation": 215, "label": "Witch_Altar"},
+                    {"asset": "cauldron", "x": 1720, "y": 1620, "rotation": 0, "label": "Witch_Cauldron"},
+
+                    # Mine
+                    {"asset": "trolley", "x": -2050, "y": 1700, "rotation": 45, "label": "Mine_Trolley"}
+                ],
+                "scatter": [
+                    {
+                        "assets": ["barrel"],
+                        "shape": "box",
+                        "center": [700, 600],
+                        "size": [300, 300],
+                        "count": 3,
+                        "rotation": [0, 360],
+                        "label": "Tavern_Barrel_{i}"
+                    }
+                ]
+            },
+            {
+                "name": "Paths",
+                "paths": [
+                    {
+                        "assets": ["tile_1", "tile_2", "tile_3", "tile_4", "tile_5", "tile_6", "tile_7"],
+                        "points": [
+                            [0, 0],            # Town center
+                            [700, 600],        # Tavern
+                            [600, -500],       # Forge
+                            [-1000, -1700],    # Tower
+                            [1700, -1200],     # Watermill
+                            [-1800, -400],     # Woodmill
+                            [-2200, 1800],     # Mine
+                            [1800, 1500]       # Witch house
+                        ],
+                        "spacing": 100,
+                        "jitter": 20,
+                        "z": 1,
+                        "rotation": [0, 360],
+                        "label": "Path_Tile_{segment}_{i}"
+                    }
+                ]
+            }
+        ]
+    }
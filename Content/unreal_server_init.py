@@ -1,25 +1,683 @@
 import unreal
 import json
+import os
 import sys
 import traceback
+import time
+import bisect
+import cProfile
+import pstats
+import contextlib
+import fnmatch
+import concurrent.futures
+import multiprocessing
+from collections import OrderedDict, deque
+from itertools import islice
+
+# Pure Python helpers shipped in the plugin's Content/Python folder
+from mcp_spatial import SpatialHashGrid, find_free_position, rotated_half_extents
+from mcp_layout import compile_layout, layout_asset_paths, plan_grid
+from mcp_town import town_layout_spec
+from mcp_encoding import register_encoder, to_json
+
+# Results carry Unreal values as numbers, lists and paths rather than their str()
+register_encoder(unreal.Vector, lambda v: [v.x, v.y, v.z])
+register_encoder(unreal.Vector2D, lambda v: [v.x, v.y])
+register_encoder(unreal.Rotator, lambda r: [r.roll, r.pitch, r.yaw])  # Same order as spawn_actor's rotation_x/y/z
+register_encoder(unreal.Quat, lambda q: [q.x, q.y, q.z, q.w])
+register_encoder(unreal.Transform, lambda t: {"location": t.translation, "rotation": t.rotation.rotator(), "scale": t.scale3d})
+register_encoder(unreal.Color, lambda c: [c.r, c.g, c.b, c.a])
+register_encoder(unreal.LinearColor, lambda c: [c.r, c.g, c.b, c.a])
+register_encoder(unreal.Name, str)
+register_encoder(unreal.Text, str)
+register_encoder(unreal.EnumBase, lambda e: e.name)
+register_encoder(unreal.Object, lambda o: o.get_path_name())
 
 class MCPUnrealBridge:
 
+    # Level change journal, fed with editor actor events captured by FPythonBridge
+    _level_version = 0
+    _journal_floor = 0
+    _change_journal = deque(maxlen=10000)
+
+    # Actor bounds index for spatial queries, built on first use and patched from the journal
+    _spatial_index = None
+    _spatial_dirty = set()
+
+    # Layout planning pool, and background layout jobs waiting to be spawned from a Slate tick
+    _planning_pool = None
+    _job_runner = None
+    _layout_jobs = {}
+    _next_layout_job = 1
+    _layout_tick_handle = None
+
+    # Bumped whenever assets are added, deleted, renamed or reimported, reported by ping
+    _asset_version = 0
+
+    # Loaded assets by path, least recently used first, invalidated by the asset events FPythonBridge captures
+    _asset_cache = OrderedDict()
+    _asset_cache_size = 256
+
+    # Async load requests started by prefetch_assets, collected into the cache by later commands
+    _prefetch_requests = set()
+
+    # Value converters for modify_actors by (class name, property name), picked once from the property's type
+    _property_converters = {}
+
+    # Bound Blueprint functions and their argument converters by (blueprint, function), dropped on recompile
+    _blueprint_callables = {}
+
+    # Result item iterators of streamed commands by stream id, read a chunk at a time by FPythonBridge
+    _streams = {}
+    _stream_chunk_items = 500
+
     @staticmethod
-    def get_actors():
-        """Get all actors in the current level"""
+    def _describe_actor(actor):
+        """Summarize an actor the same way get_actors does"""
+        return {
+            "name": actor.get_name(),
+            "class": actor.get_class().get_name(),
+            "location": actor.get_actor_location()
+        }
+
+    @staticmethod
+    def _record_change(kind, path):
+        """Append an actor change to the journal and bump the level version"""
+        journal = MCPUnrealBridge._change_journal
+        MCPUnrealBridge._level_version += 1
+
+        # Once the journal is full the oldest entry falls off, so older versions can no longer be diffed
+        if len(journal) == journal.maxlen:
+            MCPUnrealBridge._journal_floor = journal[0][0]
+        journal.append((MCPUnrealBridge._level_version, kind, path))
+
+        if MCPUnrealBridge._spatial_index is not None:
+            MCPUnrealBridge._spatial_dirty.add(path)
+
+    @staticmethod
+    def _record_actor_events(events, overflowed=False):
+        """Called from C++ before each command with the editor actor events queued since the last one"""
+        for kind, path in events:
+            MCPUnrealBridge._record_change(kind, path)
+
+        # Events were dropped on the C++ side, so every client has to resync from a full snapshot
+        if overflowed:
+            MCPUnrealBridge._level_version += 1
+            MCPUnrealBridge._journal_floor = MCPUnrealBridge._level_version
+            MCPUnrealBridge._spatial_index = None
+            MCPUnrealBridge._spatial_dirty.clear()
+
+    @staticmethod
+    def _record_asset_events(paths, overflowed=False, blueprints_compiled=False):
+        """Called from C++ before each command with the assets added, deleted, renamed or reimported since the last one"""
+        MCPUnrealBridge._asset_version += 1
+        cache = MCPUnrealBridge._asset_cache
+        callables = MCPUnrealBridge._blueprint_callables
+        if overflowed:
+            cache.clear()
+            callables.clear()
+            return
+        if blueprints_compiled:
+            callables.clear()
+
+        # Assets can be cached under their object path or their package name
+        stale = set()
+        for path in paths:
+            stale.add(path)
+            stale.add(path.split('.', 1)[0])
+        for key in [key for key in cache if key in stale or key.split('.', 1)[0] in stale]:
+            del cache[key]
+        for key in [key for key, entry in callables.items() if entry[2].split('.', 1)[0] in stale]:
+            del callables[key]
+
+    @staticmethod
+    def _cached_asset(asset_path):
+        """Get an asset from the cache, or None"""
+        cache = MCPUnrealBridge._asset_cache
+        asset = cache.get(asset_path)
+        if asset is not None:
+            # Force deleted assets can slip past the events, so check before handing one out
+            if unreal.SystemLibrary.is_valid(asset):
+                cache.move_to_end(asset_path)
+                return asset
+            del cache[asset_path]
+        return None
+
+    @staticmethod
+    def _cache_asset(asset_path, asset):
+        """Add a loaded asset to the cache, evicting the least recently used one when full"""
+        cache = MCPUnrealBridge._asset_cache
+        cache[asset_path] = asset
+        cache.move_to_end(asset_path)
+        if len(cache) > MCPUnrealBridge._asset_cache_size:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _collect_prefetched():
+        """Move assets that finished loading for prefetch_assets into the cache"""
+        library = unreal.MCPBridgeEditorLibrary
+        for request_id in list(MCPUnrealBridge._prefetch_requests):
+            for path, asset in library.take_loaded_assets(request_id).items():
+                if asset:
+                    MCPUnrealBridge._cache_asset(path, asset)
+            if not library.is_async_load_pending(request_id):
+                MCPUnrealBridge._prefetch_requests.discard(request_id)
+
+    @staticmethod
+    def _load_asset(asset_path, loader=None):
+        """Load an asset through the cache, returning None when it can't be loaded"""
+        if MCPUnrealBridge._prefetch_requests:
+            MCPUnrealBridge._collect_prefetched()
+
+        asset = MCPUnrealBridge._cached_asset(asset_path)
+        if asset is None:
+            asset = (loader or unreal.EditorAssetLibrary.load_asset)(asset_path)
+            if asset:
+                MCPUnrealBridge._cache_asset(asset_path, asset)
+        return asset
+
+    @staticmethod
+    def _load_assets(asset_paths, on_ready=None, timeout=60.0):
+        """
+        Load many assets at once, returning the loaded ones by path.
+        Uncached assets are all requested up front and load concurrently, so the
+        wait is close to the slowest single load rather than the sum of them.
+        on_ready(path, asset) is called as each one arrives.
+        """
+        if MCPUnrealBridge._prefetch_requests:
+            MCPUnrealBridge._collect_prefetched()
+
+        assets = {}
+        missing = []
+        for path in asset_paths:
+            asset = MCPUnrealBridge._cached_asset(path)
+            if asset is None:
+                missing.append(path)
+            else:
+                assets[path] = asset
+                if on_ready:
+                    on_ready(path, asset)
+
+        library = getattr(unreal, "MCPBridgeEditorLibrary", None)
+        request_id = library.request_async_load(missing) if library and missing else 0
+        if request_id:
+            deadline = time.perf_counter() + timeout
+            while True:
+                for path, asset in library.take_loaded_assets(request_id).items():
+                    if asset:
+                        MCPUnrealBridge._cache_asset(path, asset)
+                        assets[path] = asset
+                        if on_ready:
+                            on_ready(path, asset)
+                if not library.is_async_load_pending(request_id):
+                    break
+                if time.perf_counter() > deadline:
+                    library.release_async_load(request_id)
+                    break
+
+                # The command holds the game thread, so loading only progresses when pumped
+                library.process_async_loading(0.005)
+
+        # Whatever didn't load asynchronously gets one synchronous attempt
+        for path in missing:
+            if path not in assets:
+                asset = MCPUnrealBridge._load_asset(path)
+                if asset:
+                    assets[path] = asset
+                    if on_ready:
+                        on_ready(path, asset)
+        return assets
+
+    @staticmethod
+    def prefetch_assets(asset_paths):
+        """Start loading assets in the background so later commands using them don't wait on a cold load"""
+        try:
+            if isinstance(asset_paths, str):
+                asset_paths = [path.strip() for path in asset_paths.split(',') if path.strip()]
+
+            if MCPUnrealBridge._prefetch_requests:
+                MCPUnrealBridge._collect_prefetched()
+
+            missing = [path for path in asset_paths if MCPUnrealBridge._cached_asset(path) is None]
+            if missing:
+                request_id = unreal.MCPBridgeEditorLibrary.request_async_load(missing)
+                if request_id:
+                    MCPUnrealBridge._prefetch_requests.add(request_id)
+
+            return to_json({
+                "status": "success",
+                "result": {"cached": len(asset_paths) - len(missing), "loading": len(missing)}
+            })
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
+
+    @staticmethod
+    def _actor_bounds(actor):
+        """Get an actor's world bounding box as (min_x, min_y, min_z, max_x, max_y, max_z)"""
+        origin, extent = actor.get_actor_bounds(False)
+        return (origin.x - extent.x, origin.y - extent.y, origin.z - extent.z,
+                origin.x + extent.x, origin.y + extent.y, origin.z + extent.z)
+
+    @staticmethod
+    def _get_spatial_index():
+        """Get the actor bounds index, building it or applying pending changes first"""
+        index = MCPUnrealBridge._spatial_index
+        if index is None:
+            index = SpatialHashGrid()
+            actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+            for actor in actor_subsystem.get_all_level_actors():
+                index.insert(actor.get_path_name(), MCPUnrealBridge._actor_bounds(actor))
+            MCPUnrealBridge._spatial_index = index
+            MCPUnrealBridge._spatial_dirty.clear()
+            return index
+
+        for path in MCPUnrealBridge._spatial_dirty:
+            actor = unreal.find_object(None, path)
+            if actor:
+                index.insert(path, MCPUnrealBridge._actor_bounds(actor))
+            else:
+                index.remove(path)
+        MCPUnrealBridge._spatial_dirty.clear()
+        return index
+
+    @staticmethod
+    def _describe_paths(paths):
+        """Summarize the actors behind a list of indexed paths, skipping any that are gone"""
         result = []
+        for path in paths:
+            actor = unreal.find_object(None, path)
+            if actor:
+                result.append(MCPUnrealBridge._describe_actor(actor))
+        return result
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _bulk_operation(description):
+        """
+        Run a batch of edits as one undo step, with per-actor viewport redraws, selection
+        notifications and navigation rebuilds held back until the end. Nests safely, and
+        code sent through execute_python can opt in too:
+
+            with mcp_bridge._bulk_operation("Scatter rocks"):
+                ...
+        """
+        library = getattr(unreal, "MCPBridgeEditorLibrary", None)
+        with unreal.ScopedEditorTransaction(description):
+            if library:
+                library.begin_bulk_operation()
+            try:
+                yield
+            finally:
+                if library:
+                    library.end_bulk_operation()
+
+    @staticmethod
+    def _find_actors(actor_filter):
+        """
+        Level actors matching every criterion of a filter dict:
+            class   - class name, e.g. "StaticMeshActor" or a Blueprint's "BP_Tree_C"
+            label   - glob on the actor label, e.g. "Forest_Tree_*"
+            folder  - outliner folder, including its subfolders
+            tag     - actor tag
+            names   - list of actor names
+            bounds  - [min_x, min_y, min_z, max_x, max_y, max_z] box the actor's bounds overlap
+        """
+        known = {"class", "label", "folder", "tag", "names", "bounds"}
+        unknown = set(actor_filter) - known
+        if unknown:
+            raise ValueError(f"Unknown filter keys: {', '.join(sorted(unknown))}")
+        if not actor_filter:
+            raise ValueError("The filter needs at least one of: " + ", ".join(sorted(known)))
+
+        # Narrow down through the spatial index first when there is a box
+        if "bounds" in actor_filter:
+            actors = []
+            for path in MCPUnrealBridge._get_spatial_index().query_box([float(v) for v in actor_filter["bounds"]]):
+                actor = unreal.find_object(None, path)
+                if actor:
+                    actors.append(actor)
+        else:
+            actors = unreal.get_editor_subsystem(unreal.EditorActorSubsystem).get_all_level_actors()
+
+        if "names" in actor_filter:
+            names = set(actor_filter["names"])
+            actors = [actor for actor in actors if actor.get_name() in names]
+
+        if "class" in actor_filter:
+            class_name = actor_filter["class"]
+            actor_class = getattr(unreal, class_name, None)
+            if isinstance(actor_class, type):
+                actors = [actor for actor in actors if isinstance(actor, actor_class)]
+            else:
+                actors = [actor for actor in actors if actor.get_class().get_name() == class_name]
+
+        if "tag" in actor_filter:
+            tag = actor_filter["tag"]
+            actors = [actor for actor in actors if actor.actor_has_tag(tag)]
+
+        if "folder" in actor_filter:
+            folder = actor_filter["folder"].strip("/")
+            actors = [actor for actor in actors
+                      if str(actor.get_folder_path()) == folder or str(actor.get_folder_path()).startswith(folder + "/")]
+
+        if "label" in actor_filter:
+            pattern = actor_filter["label"]
+            actors = [actor for actor in actors if fnmatch.fnmatchcase(actor.get_actor_label(), pattern)]
+
+        return list(actors)
+
+    @staticmethod
+    def _delete_actors(actor_filter):
+        """Destroy every actor matching a filter in one bulk call and one undo transaction"""
+        actors = MCPUnrealBridge._find_actors(actor_filter)
+        if not actors:
+            return 0, 0
+
+        with MCPUnrealBridge._bulk_operation("MCP Delete Actors"):
+            unreal.get_editor_subsystem(unreal.EditorActorSubsystem).destroy_actors(actors)
+
+        deleted = sum(1 for actor in actors if not unreal.SystemLibrary.is_valid(actor))
+        return len(actors), deleted
+
+    @staticmethod
+    def delete_actors(actor_filter):
+        """Delete the actors matching a filter, see _find_actors for the criteria"""
+        try:
+            if isinstance(actor_filter, str):
+                actor_filter = json.loads(actor_filter)
+
+            matched, deleted = MCPUnrealBridge._delete_actors(actor_filter)
+            return to_json({ "status": "success", "result": {"matched": matched, "deleted": deleted} })
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
+
+    @staticmethod
+    def _stream(stream_id, items):
+        """Hand a command's result items out a chunk at a time, starting with the first chunk"""
+        MCPUnrealBridge._streams[stream_id] = iter(items)
+        return MCPUnrealBridge.read_stream(stream_id)
+
+    @staticmethod
+    def read_stream(stream_id):
+        """
+        Next chunk of a streamed result. done comes first so FPythonBridge can tell
+        whether to keep reading without parsing the chunk.
+        """
+        items = MCPUnrealBridge._streams.get(stream_id)
+        if items is None:
+            return to_json({"done": True, "status": "error", "message": f"Stream {stream_id} not found"})
+
+        try:
+            chunk = list(islice(items, MCPUnrealBridge._stream_chunk_items))
+        except Exception as e:
+            del MCPUnrealBridge._streams[stream_id]
+            return to_json({"done": True, "status": "error", "message": str(e)})
+
+        done = len(chunk) < MCPUnrealBridge._stream_chunk_items
+        if done:
+            del MCPUnrealBridge._streams[stream_id]
+        return to_json({"done": done, "status": "success", "result": chunk})
+
+    @staticmethod
+    def close_stream(stream_id):
+        """Drop a stream the client stopped reading"""
+        MCPUnrealBridge._streams.pop(stream_id, None)
+
+    @staticmethod
+    def _profile(handler, options, /, **params):
+        """
+        Run a command under a profiler, for requests carrying the profile flag, and add the functions
+        with the most cumulative time to its response. options may hold top (how many functions, 20 by
+        default), sampler (sample with pyinstrument, when installed, instead of tracing every call with
+        cProfile) and save (true or a file path, to write the raw stats under Saved/Profiling by default).
+        """
+        top = int(options.get("top", 20))
+        profile = {"profiler": "cProfile"}
+        sampler = None
+        if options.get("sampler"):
+            try:
+                import pyinstrument
+                sampler = pyinstrument.Profiler(interval=0.001)
+                profile["profiler"] = "pyinstrument"
+            except ImportError:
+                profile["note"] = "pyinstrument is not installed, used cProfile"
+
+        tracer = cProfile.Profile() if sampler is None else None
+        start = time.perf_counter()
+        try:
+            if sampler is not None:
+                sampler.start()
+                try:
+                    result = handler(**params)
+                finally:
+                    session = sampler.stop()
+            else:
+                result = tracer.runcall(handler, **params)
+        except Exception as e:
+            result = to_json({"status": "error", "message": str(e), "traceback": traceback.format_exc()})
+        profile["wall_time"] = time.perf_counter() - start
+
+        if sampler is not None:
+            profile["functions"] = MCPUnrealBridge._sampled_functions(session.root_frame(), top)
+        else:
+            stats = pstats.Stats(tracer).sort_stats("cumulative")
+            profile["functions"] = [{
+                "function": f"{name} ({os.path.basename(file)}:{line})",
+                "calls": stats.stats[(file, line, name)][1],
+                "total_time": stats.stats[(file, line, name)][2],
+                "cumulative_time": stats.stats[(file, line, name)][3]
+            } for file, line, name in stats.fcn_list[:top]]
+
+        save = options.get("save")
+        if save:
+            if not isinstance(save, str):
+                extension = "pyisession" if sampler is not None else "prof"
+                save = os.path.join(unreal.Paths.project_saved_dir(), "Profiling",
+                                    f"{handler.__name__}_{time.strftime('%Y%m%d_%H%M%S')}.{extension}")
+            os.makedirs(os.path.dirname(os.path.abspath(save)), exist_ok=True)
+            if sampler is not None:
+                session.save(save)
+            else:
+                stats.dump_stats(save)
+            profile["stats_file"] = save
+
+        try:
+            response = json.loads(result)
+        except (TypeError, ValueError):
+            response = None
+        if not isinstance(response, dict):
+            response = {"status": "success", "result": result}
+        response["profile"] = profile
+        return to_json(response)
+
+    @staticmethod
+    def _sampled_functions(root_frame, top):
+        """Functions with the most cumulative time in a pyinstrument frame tree, recursion counted once"""
+        totals = {}
+
+        def visit(frame, ancestors):
+            key = f"{frame.function} ({os.path.basename(frame.file_path or '')}:{frame.line_no})"
+            # Leave out pyinstrument's [self] and similar frames, and this wrapper
+            counted = not getattr(frame, "is_synthetic", False) and frame.function != "_profile"
+            if counted and key not in ancestors:
+                totals[key] = totals.get(key, 0.0) + frame.time
+            for child in frame.children:
+                visit(child, ancestors | {key})
+
+        if root_frame is not None:
+            visit(root_frame, frozenset())
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+        return [{"function": function, "cumulative_time": seconds} for function, seconds in ranked]
+
+    @staticmethod
+    def _iter_actors():
+        """Describe the level's actors one at a time, skipping any destroyed since the scan started"""
         actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem) #unreal.EditorActorSubsystem().get_editor_subsystem()
-        actors = actor_subsystem.get_all_level_actors()
-        
-        for actor in actors:
-            result.append({
-                "name": actor.get_name(),
-                "class": actor.get_class().get_name(),
-                "location": str(actor.get_actor_location())
+        for actor in actor_subsystem.get_all_level_actors():
+            if unreal.SystemLibrary.is_valid(actor):
+                yield MCPUnrealBridge._describe_actor(actor)
+
+    @staticmethod
+    def get_actors(stream=None):
+        """Get all actors in the current level"""
+        if stream is not None:
+            return MCPUnrealBridge._stream(stream, MCPUnrealBridge._iter_actors())
+
+        return to_json({"status": "success", "result": list(MCPUnrealBridge._iter_actors())})
+
+    @staticmethod
+    def ping():
+        """Heartbeat, answering with the level and asset versions so clients can tell what changed"""
+        return to_json({
+            "status": "success",
+            "result": {
+                "level_version": MCPUnrealBridge._level_version,
+                "asset_version": MCPUnrealBridge._asset_version
+            }
+        })
+
+    @staticmethod
+    def get_actor_stats():
+        """Count the level's actors by class, with the level's name and version"""
+        try:
+            by_class = {}
+            for actor in unreal.get_editor_subsystem(unreal.EditorActorSubsystem).get_all_level_actors():
+                class_name = actor.get_class().get_name()
+                by_class[class_name] = by_class.get(class_name, 0) + 1
+
+            world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+            return to_json({
+                "status": "success",
+                "result": {
+                    "level": world.get_name() if world else None,
+                    "level_version": MCPUnrealBridge._level_version,
+                    "total": sum(by_class.values()),
+                    "by_class": by_class
+                }
             })
-        
-        return json.dumps({"status": "success", "result": result})
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
+
+    @staticmethod
+    def get_changes_since(version=0):
+        """Get the actors added, removed or modified since a level version"""
+        try:
+            version = int(version)
+            current_version = MCPUnrealBridge._level_version
+
+            # The journal no longer reaches back that far (or the bridge restarted), fall back to a full snapshot
+            if version < MCPUnrealBridge._journal_floor or version > current_version:
+                actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+                actors = [MCPUnrealBridge._describe_actor(actor) for actor in actor_subsystem.get_all_level_actors()]
+                return to_json({
+                    "status": "success",
+                    "result": {"version": current_version, "full": True, "actors": actors}
+                })
+
+            # Versions in the journal are sorted but have gaps where events overflowed, so search for the first newer entry
+            journal = MCPUnrealBridge._change_journal
+            start = bisect.bisect_left(journal, (version + 1,))
+
+            # Collapse the entries into the net change per actor
+            net_changes = {}
+            for _, kind, path in islice(journal, start, None):
+                previous = net_changes.get(path)
+                if kind == "added":
+                    net_changes[path] = "modified" if previous == "removed" else "added"
+                elif kind == "removed":
+                    net_changes[path] = "unchanged" if previous == "added" else "removed"
+                elif previous != "added":
+                    net_changes[path] = "modified"
+
+            added = []
+            modified = []
+            removed = []
+            for path, change in net_changes.items():
+                if change == "unchanged":
+                    continue
+
+                actor = None
+                if change != "removed":
+                    actor = unreal.find_object(None, path)
+
+                if actor:
+                    (added if change == "added" else modified).append(MCPUnrealBridge._describe_actor(actor))
+                else:
+                    removed.append(path.rsplit('.', 1)[-1])
+
+            return to_json({
+                "status": "success",
+                "result": {
+                    "version": current_version,
+                    "full": False,
+                    "added": added,
+                    "modified": modified,
+                    "removed": removed
+                }
+            })
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
+
+    @staticmethod
+    def query_radius(center_x, center_y, center_z, radius):
+        """Get the actors whose bounds come within a radius of a point"""
+        try:
+            index = MCPUnrealBridge._get_spatial_index()
+            paths = index.query_radius(float(center_x), float(center_y), float(center_z), float(radius))
+            return to_json({"status": "success", "result": MCPUnrealBridge._describe_paths(paths)})
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
+
+    @staticmethod
+    def query_box(min_x, min_y, min_z, max_x, max_y, max_z):
+        """Get the actors whose bounds overlap a box"""
+        try:
+            index = MCPUnrealBridge._get_spatial_index()
+            bounds = (float(min_x), float(min_y), float(min_z), float(max_x), float(max_y), float(max_z))
+            paths = index.query_box(bounds)
+            return to_json({"status": "success", "result": MCPUnrealBridge._describe_paths(paths)})
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
+
+    @staticmethod
+    def nearest_k(location_x, location_y, location_z, k=1):
+        """Get the k actors nearest to a point, closest first"""
+        try:
+            index = MCPUnrealBridge._get_spatial_index()
+            nearest = index.nearest_k(float(location_x), float(location_y), float(location_z), int(k))
+
+            result = []
+            for distance, path in nearest:
+                actor = unreal.find_object(None, path)
+                if actor:
+                    details = MCPUnrealBridge._describe_actor(actor)
+                    details["distance"] = distance
+                    result.append(details)
+            return to_json({"status": "success", "result": result})
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
+
+    @staticmethod
+    def find_free_placement(footprint_x, footprint_y, near_x, near_y, radius, near_z=0, height=100, rotation_z=0, step=0, tolerance=0):
+        """Find the free spot closest to a point where a footprint fits without overlapping other actors"""
+        try:
+            index = MCPUnrealBridge._get_spatial_index()
+            half_x, half_y = rotated_half_extents(float(footprint_x) / 2, float(footprint_y) / 2, float(rotation_z))
+
+            # Floors and landscape only reach up to the base, so start the obstacle slab just above it
+            base_z = float(near_z)
+            position = find_free_position(index, half_x, half_y, float(near_x), float(near_y), float(radius),
+                                          min_z=base_z + 1.0, max_z=base_z + float(height),
+                                          step=float(step), tolerance=float(tolerance))
+            if position is None:
+                return to_json({ "status": "error", "message": f"No free position within {radius} of ({near_x}, {near_y})" })
+
+            return to_json({
+                "status": "success",
+                "result": {"x": position[0], "y": position[1], "z": base_z}
+            })
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
 
     @staticmethod
     def get_actor_details(actor_name):
@@ -30,17 +688,13 @@ class MCPUnrealBridge:
         
         for actor in actors:
             if actor.get_name() == actor_name:
-                result = {
-                    "name": actor.get_name(),
-                    "class": actor.get_class().get_name(),
-                    "location": str(actor.get_actor_location())
-                }
+                result = MCPUnrealBridge._describe_actor(actor)
                 break
 
         if not result:
             result = f"Actor not found: {actor_name}"
         
-        return json.dumps({"status": "success", "result": result})
+        return to_json({"status": "success", "result": result})
     
     @staticmethod
     def spawn_actor(asset_path, location_x=0, location_y=0, location_z=0, rotation_x=0, rotation_y=0, rotation_z=0, scale_x=0, scale_y=0, scale_z=0):
@@ -48,9 +702,9 @@ class MCPUnrealBridge:
         try:
 
             # Find the class reference
-            class_obj = unreal.load_asset(asset_path)
+            class_obj = MCPUnrealBridge._load_asset(asset_path, unreal.load_asset)
             if not class_obj:
-                return json.dumps({"status": "error", "message": f"Asset '{asset_path}' not found"})
+                return to_json({"status": "error", "message": f"Asset '{asset_path}' not found"})
             
             # Create the actor
             location = unreal.Vector(float(location_x), float(location_y), float(location_z))
@@ -60,14 +714,121 @@ class MCPUnrealBridge:
             
             if actor:
                 actor.set_actor_scale3d(unreal.Vector(scale_x, scale_y, scale_z))
-                return json.dumps({
+                return to_json({
                     "status": "success", 
                     "result": f"Created {asset_path} actor named '{actor.get_name()}' at location ({location_x}, {location_y}, {location_z})"
                 })
             else:
-                return json.dumps({ "status": "error", "message" : "Failed to create actor" })
+                return to_json({ "status": "error", "message" : "Failed to create actor" })
         except Exception as e :
-            return json.dumps({ "status": "error", "message" : str(e) })
+            return to_json({ "status": "error", "message" : str(e) })
+
+    @staticmethod
+    def _to_bool(value):
+        if isinstance(value, str):
+            return value.strip().lower() in ['true', 'yes', '1']
+        return bool(value)
+
+    @staticmethod
+    def _to_floats(value, keys):
+        """Read numbers from a list, a dict keyed by name or a "1,2,3" string"""
+        if isinstance(value, dict):
+            return [float(value[key]) for key in keys if key in value]
+        if isinstance(value, str):
+            value = value.strip("()[] ").split(',')
+        return [float(v) for v in value]
+
+    @staticmethod
+    def _to_vector(value):
+        return unreal.Vector(*MCPUnrealBridge._to_floats(value, ("x", "y", "z")))
+
+    @staticmethod
+    def _to_rotator(value):
+        # Same order as spawn_actor's rotation_x/y/z
+        return unreal.Rotator(*MCPUnrealBridge._to_floats(value, ("roll", "pitch", "yaw")))
+
+    @staticmethod
+    def _to_transform(value):
+        if isinstance(value, str):
+            value = json.loads(value)
+        return unreal.Transform(
+            MCPUnrealBridge._to_vector(value.get("location", (0, 0, 0))),
+            MCPUnrealBridge._to_rotator(value.get("rotation", (0, 0, 0))),
+            MCPUnrealBridge._to_vector(value.get("scale", (1, 1, 1))))
+
+    @staticmethod
+    def _to_linear_color(value):
+        return unreal.LinearColor(*MCPUnrealBridge._to_floats(value, ("r", "g", "b", "a")))
+
+    @staticmethod
+    def _to_color(value):
+        # Also takes hex strings like "#FF8800" or "#FF8800CC"
+        if isinstance(value, str) and value.startswith('#'):
+            digits = value[1:]
+            value = [int(digits[i:i + 2], 16) for i in range(0, len(digits), 2)]
+        channels = [int(v) for v in MCPUnrealBridge._to_floats(value, ("r", "g", "b", "a"))]
+        if len(channels) == 3:
+            channels.append(255)
+        return unreal.Color(*channels)
+
+    @staticmethod
+    def _to_object(value):
+        # Object references are given as asset paths, empty clears them
+        if value is None or value == "":
+            return None
+        obj = MCPUnrealBridge._load_asset(value, lambda path: unreal.load_object(None, path))
+        if obj is None:
+            raise ValueError(f"Object '{value}' not found")
+        return obj
+
+    @staticmethod
+    def _property_converter(current_value):
+        """Pick the function turning a request value into the type a property currently holds"""
+        # bool has to come before int, as bool is a subclass of int
+        if isinstance(current_value, bool):
+            return MCPUnrealBridge._to_bool
+        if isinstance(current_value, float):
+            return float
+        if isinstance(current_value, int) and not isinstance(current_value, unreal.EnumBase):
+            return lambda value: int(float(value))
+        if isinstance(current_value, unreal.Vector):
+            return MCPUnrealBridge._to_vector
+        if isinstance(current_value, unreal.Rotator):
+            return MCPUnrealBridge._to_rotator
+        if isinstance(current_value, unreal.Transform):
+            return MCPUnrealBridge._to_transform
+        if isinstance(current_value, unreal.LinearColor):
+            return MCPUnrealBridge._to_linear_color
+        if isinstance(current_value, unreal.Color):
+            return MCPUnrealBridge._to_color
+        if isinstance(current_value, unreal.EnumBase):
+            enum_type = type(current_value)
+            return lambda value: value if isinstance(value, enum_type) else getattr(enum_type, str(value).upper())
+        if isinstance(current_value, unreal.Name):
+            return lambda value: unreal.Name(str(value))
+        if current_value is None or isinstance(current_value, unreal.Object):
+            return MCPUnrealBridge._to_object
+        # Default to string
+        return str
+
+    @staticmethod
+    def _set_actor_property(actor, property_name, value):
+        """Convert a value to a property's type and set it, using the converter cached for the actor's class"""
+        key = (actor.get_class().get_name(), property_name)
+        converter = MCPUnrealBridge._property_converters.get(key)
+        if converter is None:
+            try:
+                current_value = getattr(actor, property_name)
+            except AttributeError:
+                raise AttributeError(f"Property {property_name} not found on {actor.get_name()}")
+
+            converter = MCPUnrealBridge._property_converter(current_value)
+
+            # An unset object reference says nothing about the type, so don't remember a guess
+            if current_value is not None:
+                MCPUnrealBridge._property_converters[key] = converter
+
+        setattr(actor, property_name, converter(value))
 
     @staticmethod
     def modify_actor(actor_name, property_name, property_value):
@@ -78,36 +839,84 @@ class MCPUnrealBridge:
 
             for actor in actors:
                 if actor.get_name() == actor_name:
-                    # Try to determine property type and convert value
-                    current_value = getattr(actor, property_name, None)
-                    if current_value is not None:
-                        if isinstance(current_value, float):
-                            setattr(actor, property_name, float(property_value))
-                        elif isinstance(current_value, int):
-                            setattr(actor, property_name, int(property_value))
-                        elif isinstance(current_value, bool):
-                            setattr(actor, property_name, property_value.lower() in['true', 'yes', '1'])
-                        elif isinstance(current_value, unreal.Vector):
-                            # Assuming format like "X,Y,Z"
-                            x, y, z = map(float, property_value.split(','))
-                            setattr(actor, property_name, unreal.Vector(x, y, z))
-                        else:
-                            # Default to string
-                            setattr(actor, property_name, property_value)
-
-                        return json.dumps({
-                            "status": "success",
-                            "result" : f"Modified {property_name} on {actor_name} to {property_value}"
-                        })
-                    else:
-                        return json.dumps({
+                    try:
+                        MCPUnrealBridge._set_actor_property(actor, property_name, property_value)
+                    except AttributeError:
+                        return to_json({
                             "status": "error",
                             "message" : f"Property {property_name} not found on {actor_name}"
                         })
 
-            return json.dumps({ "status": "error", "message" : f"Actor '{actor_name}' not found" })
+                    # Script edits don't go through PostEditMove, so journal them here
+                    MCPUnrealBridge._record_change("modified", actor.get_path_name())
+
+                    return to_json({
+                        "status": "success",
+                        "result" : f"Modified {property_name} on {actor_name} to {property_value}"
+                    })
+
+            return to_json({ "status": "error", "message" : f"Actor '{actor_name}' not found" })
         except Exception as e :
-            return json.dumps({ "status": "error", "message" : str(e) })
+            return to_json({ "status": "error", "message" : str(e) })
+
+    @staticmethod
+    def _resolve_targets(targets):
+        """Turn a list of actor names, a filter dict or "selection" into (name, actor or None) pairs"""
+        if targets == "selection":
+            actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+            return [(actor.get_name(), actor) for actor in actor_subsystem.get_selected_level_actors()]
+
+        if isinstance(targets, str):
+            targets = json.loads(targets) if targets.lstrip().startswith(('[', '{')) else [targets]
+
+        if isinstance(targets, dict):
+            return [(actor.get_name(), actor) for actor in MCPUnrealBridge._find_actors(targets)]
+
+        # One pass over the level for all the names, instead of a scan per target
+        wanted = set(targets)
+        found = {}
+        for actor in unreal.get_editor_subsystem(unreal.EditorActorSubsystem).get_all_level_actors():
+            name = actor.get_name()
+            if name in wanted:
+                found[name] = actor
+        return [(name, found.get(name)) for name in targets]
+
+    @staticmethod
+    def modify_actors(targets, properties):
+        """
+        Set many properties on many actors in one undoable step.
+        targets is a list of actor names, a filter (see _find_actors) or "selection", properties maps
+        property names to values. Each target gets its own result.
+        """
+        try:
+            if isinstance(properties, str):
+                properties = json.loads(properties)
+
+            results = []
+            with MCPUnrealBridge._bulk_operation("MCP Modify Actors"):
+                for name, actor in MCPUnrealBridge._resolve_targets(targets):
+                    if actor is None:
+                        results.append({"target": name, "status": "error", "message": f"Actor '{name}' not found"})
+                        continue
+
+                    errors = {}
+                    for property_name, value in properties.items():
+                        try:
+                            MCPUnrealBridge._set_actor_property(actor, property_name, value)
+                        except Exception as e:
+                            errors[property_name] = str(e)
+
+                    if len(errors) < len(properties):
+                        MCPUnrealBridge._record_change("modified", actor.get_path_name())
+
+                    result = {"target": name, "status": "error" if errors else "success"}
+                    if errors:
+                        result["errors"] = errors
+                    results.append(result)
+
+            return to_json({ "status": "success", "result": results })
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
 
     @staticmethod
     def get_selected_actors():
@@ -118,15 +927,11 @@ class MCPUnrealBridge:
 
             result = []
             for actor in selected_actors:
-                result.append({
-                    "name": actor.get_name(),
-                    "class" : actor.get_class().get_name(),
-                    "location" : str(actor.get_actor_location())
-                })
+                result.append(MCPUnrealBridge._describe_actor(actor))
 
-            return json.dumps({ "status": "success", "result": result })
+            return to_json({ "status": "success", "result": result })
         except Exception as e:
-            return json.dumps({ "status": "error", "message": str(e) })
+            return to_json({ "status": "error", "message": str(e) })
 
     @staticmethod
     def set_material(actor_name, material_path):
@@ -143,19 +948,19 @@ class MCPUnrealBridge:
                     break
 
             if not target_actor:
-                return json.dumps({ "status": "error", "message" : f"Actor '{actor_name}' not found" })
+                return to_json({ "status": "error", "message" : f"Actor '{actor_name}' not found" })
 
             # Check if it's a static mesh actor
             if not target_actor.is_a(unreal.StaticMeshActor) :
-                return json.dumps({
+                return to_json({
                     "status": "error",
                     "message": f"Actor '{actor_name}' is not a StaticMeshActor"
                 })
 
             # Load the material
-            material = unreal.load_object(None, material_path)
+            material = MCPUnrealBridge._load_asset(material_path, lambda path: unreal.load_object(None, path))
             if not material:
-                return json.dumps({
+                return to_json({
                     "status": "error",
                     "message": f"Material '{material_path}' not found"
                 })
@@ -163,72 +968,94 @@ class MCPUnrealBridge:
             # Get the static mesh component
             static_mesh_component = target_actor.get_component_by_class(unreal.StaticMeshComponent)
             if not static_mesh_component:
-                return json.dumps({
+                return to_json({
                     "status": "error",
                     "message" : f"No StaticMeshComponent found on actor '{actor_name}'"
                 })
 
             # Set the material
             static_mesh_component.set_material(0, material)
-            return json.dumps({
+            MCPUnrealBridge._record_change("modified", target_actor.get_path_name())
+            return to_json({
                 "status": "success",
                 "result" : f"Applied material '{material_path}' to actor '{actor_name}'"
             })
         except Exception as e :
-            return json.dumps({ "status": "error", "message" : str(e) })
+            return to_json({ "status": "error", "message" : str(e) })
 
     @staticmethod
-    def delete_all_static_mesh_actors():
-        """Delete all static mesh actors in the scene"""
-
+    def set_materials(targets, materials):
+        """
+        Assign materials to many actors in one undoable pass.
+        targets is a list of actor names, a filter (see _find_actors) or "selection".
+        materials maps material slots, by index or slot name, to material paths.
+        Every mesh component of a target gets the materials, instanced ones included.
+        """
         try:
+            if isinstance(materials, str):
+                materials = json.loads(materials)
+
+            # Resolve each material once for the whole batch
+            slots = []
+            for slot, material_path in materials.items():
+                material = MCPUnrealBridge._load_asset(material_path, lambda path: unreal.load_object(None, path))
+                if not material:
+                    return to_json({ "status": "error", "message": f"Material '{material_path}' not found" })
+                slot = int(slot) if isinstance(slot, int) or str(slot).isdigit() else str(slot)
+                slots.append((slot, material))
+
+            results = []
+            with MCPUnrealBridge._bulk_operation("MCP Set Materials"):
+                for name, actor in MCPUnrealBridge._resolve_targets(targets):
+                    if actor is None:
+                        results.append({"target": name, "status": "error", "message": f"Actor '{name}' not found"})
+                        continue
 
-            # Get the editor subsystem
-            editor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+                    components = actor.get_components_by_class(unreal.MeshComponent)
+                    if not components:
+                        results.append({"target": name, "status": "error", "message": f"No mesh component found on actor '{name}'"})
+                        continue
 
-            # Get all actors in the current level
-            try:
-                all_actors = editor_subsystem.get_all_level_actors()
-            except DeprecationWarning as dw:
-                # do nothing
-                pass
+                    for component in components:
+                        for slot, material in slots:
+                            if isinstance(slot, int):
+                                component.set_material(slot, material)
+                            else:
+                                component.set_material_by_name(slot, material)
 
-            # Filter for StaticMeshActors
-            static_mesh_actors = [actor for actor in all_actors if isinstance(actor, unreal.StaticMeshActor)]
+                    MCPUnrealBridge._record_change("modified", actor.get_path_name())
+                    results.append({"target": name, "status": "success", "components": len(components)})
 
-            # Print how many StaticMeshActors were found
-            #print(f"Found {len(static_mesh_actors)} StaticMeshActors")
-                
-            # Delete all StaticMeshActors
-            delete_count = 0
-            for actor in static_mesh_actors:
-                actor_name = actor.get_actor_label()
-                success = editor_subsystem.destroy_actor(actor)
-                if success:
-                    delete_count = delete_count + 1
-                    #print(f"Deleted StaticMeshActor: {actor_name}")
-                #else:
-                    #print(f"Failed to delete StaticMeshActor: {actor_name}")
-
-            return json.dumps({
+            return to_json({ "status": "success", "result": results })
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
+
+    @staticmethod
+    def delete_all_static_mesh_actors():
+        """Delete all static mesh actors in the scene"""
+
+        try:
+            matched, deleted = MCPUnrealBridge._delete_actors({"class": "StaticMeshActor"})
+
+            return to_json({
                 "status": "success",
-                "result" : f"Found {len(static_mesh_actors)} StaticMeshActors. Deleted {delete_count} StaticMeshActors."
+                "result" : f"Found {matched} StaticMeshActors. Deleted {deleted} StaticMeshActors."
             })
 
         except Exception as e:
-            return json.dumps({ "status": "error", "message": str(e) })
+            return to_json({ "status": "error", "message": str(e) })
 
     @staticmethod
     def get_project_dir():
         """Get the top level project directory"""
         try:
             project_dir = unreal.Paths.project_dir()
-            return json.dumps({
+            return to_json({
                 "status": "success",
                 "result" : f"{project_dir}"
             })
         except Exception as e:
-            return json.dumps({ "status": "error", "message": str(e) })
+            return to_json({ "status": "error", "message": str(e) })
 
     @staticmethod
     def get_content_dir():
@@ -238,15 +1065,15 @@ class MCPUnrealBridge:
             #saved_dir = unreal.Paths.project_saved_dir()
             #config_dir = unreal.Paths.project_config_dir()
             content_dir = unreal.Paths.project_content_dir()
-            return json.dumps({
+            return to_json({
                 "status": "success",
                 "result" : f"{content_dir}"
             })
         except Exception as e:
-            return json.dumps({ "status": "error", "message": str(e) })
+            return to_json({ "status": "error", "message": str(e) })
 
     @staticmethod
-    def find_basic_shapes():
+    def find_basic_shapes(stream=None):
         """Search for basic shapes for building"""
         
         try:
@@ -255,24 +1082,26 @@ class MCPUnrealBridge:
             assets = asset_registry.get_assets_by_path('/Engine/BasicShapes', recursive=True)
 
             # Find 
-            tile_asset_paths = []
-            for asset in assets:
-                if asset.get_class().get_name() == 'StaticMesh':
-                    tile_asset_paths.append(str(asset.package_name))
+            tile_asset_paths = (str(asset.package_name) for asset in assets
+                                if asset.get_class().get_name() == 'StaticMesh')
+            if stream is not None:
+                return MCPUnrealBridge._stream(stream, tile_asset_paths)
+
+            tile_asset_paths = list(tile_asset_paths)
 
             if not tile_asset_paths:
-                return json.dumps({ "status": "error", "message": f"Could not find basic shapes." })
+                return to_json({ "status": "error", "message": f"Could not find basic shapes." })
             else:
-                return json.dumps({
+                return to_json({
                     "status": "success",
                     "result" : tile_asset_paths
                 })
 
         except Exception as e:
-            return json.dumps({ "status": "error", "message": str(e) })
+            return to_json({ "status": "error", "message": str(e) })
 
     @staticmethod
-    def find_assets(asset_name):
+    def find_assets(asset_name, stream=None):
         """Search for specific assets by name, like Floor, Wall, Door"""
         
         try:
@@ -281,23 +1110,24 @@ class MCPUnrealBridge:
             assets = asset_registry.get_assets_by_path('/Game', recursive=True)
 
             # Find 
-            tile_asset_paths = []
             asset_name_lower = asset_name.lower()
-            for asset in assets:
-                this_name = str(asset.asset_name).lower()
-                if asset_name_lower in this_name:
-                    tile_asset_paths.append(str(asset.package_name))
+            tile_asset_paths = (str(asset.package_name) for asset in assets
+                                if asset_name_lower in str(asset.asset_name).lower())
+            if stream is not None:
+                return MCPUnrealBridge._stream(stream, tile_asset_paths)
+
+            tile_asset_paths = list(tile_asset_paths)
 
             if not tile_asset_paths:
-                return json.dumps({ "status": "error", "message": f"Could not find {asset_name} asset." })
+                return to_json({ "status": "error", "message": f"Could not find {asset_name} asset." })
             else:
-                return json.dumps({
+                return to_json({
                     "status": "success",
                     "result" : tile_asset_paths
                 })
 
         except Exception as e:
-            return json.dumps({ "status": "error", "message": str(e) })
+            return to_json({ "status": "error", "message": str(e) })
 
     @staticmethod
     def get_asset(asset_path):
@@ -306,7 +1136,7 @@ class MCPUnrealBridge:
         # Try to load the asset
         try:
             #print("Loading asset...")
-            static_mesh = unreal.EditorAssetLibrary.load_asset(asset_path)
+            static_mesh = MCPUnrealBridge._load_asset(asset_path)
             #print("Asset loaded: " + str(static_mesh != None))
             
             if static_mesh:
@@ -330,28 +1160,35 @@ class MCPUnrealBridge:
 
                     result = {"width": width, "depth": depth, "height": height}
 
-                    return json.dumps({
+                    return to_json({
                         "status": "success",
                         "result" : result
                     })
 
                 except Exception as e:
-                    return json.dumps({ "status": "error", "message": str(e) })
+                    return to_json({ "status": "error", "message": str(e) })
             else:
-                return json.dumps({ "status": "error", "message": f"Asset could not be loaded." })
+                return to_json({ "status": "error", "message": f"Asset could not be loaded." })
         except Exception as e:
-            return json.dumps({ "status": "error", "message": f"Error loading asset: {str(e)}" })
+            return to_json({ "status": "error", "message": f"Error loading asset: {str(e)}" })
 
     @staticmethod
-    def create_grid(asset_path, grid_width, grid_length):
-        import math
+    def create_grid(asset_path, grid_width, grid_length, seed=None, dry_run=False, background=False):
+        """
+        Create a grid of tiles. With dry_run the placements are returned with phase timings instead of spawned,
+        with background the grid is planned off the game thread and a job id is returned to poll with get_layout_job.
+        The grid has no random elements, seed is accepted and reported like the other procedural commands.
+        """
 
         try:
+            timings = {}
 
             # Load the static mesh
-            floor_asset = unreal.EditorAssetLibrary.load_asset(asset_path)
+            phase_start = time.perf_counter()
+            floor_asset = MCPUnrealBridge._load_asset(asset_path)
             if not floor_asset:
-                return json.dumps({ "status": "error", "message": f"Failed to load static mesh: {asset_path}" })
+                return to_json({ "status": "error", "message": f"Failed to load static mesh: {asset_path}" })
+            timings["load"] = time.perf_counter() - phase_start
 
             # Grid dimensions
             width = int(grid_width)
@@ -362,866 +1199,378 @@ class MCPUnrealBridge:
             tile_width = bounds.box_extent.x * 2
             tile_length = bounds.box_extent.y * 2
 
-            # Create grid of floor tiles
-            tiles_created = 0
-            for x in range(width):
-                for y in range(length):
-                    # Calculate position
-                    location = unreal.Vector(x * tile_width, y * tile_length, 0)
-                    
-                    # Create actor using EditorLevelLibrary
-                    try:
-                        actor = unreal.EditorLevelLibrary.spawn_actor_from_object(
-                            floor_asset,
-                            location,
-                            unreal.Rotator(0, 0, 0)
-                        )
-                    except DeprecationWarning as dw:
-                        # do nothing
-                        pass
-                    
-                    if actor:
-                        tiles_created += 1
-                        actor.set_actor_label(f"FloorTile_{x}_{y}")
+            def plan_fn():
+                return {
+                    "seed": None if seed is None else int(seed),
+                    "placements": plan_grid(asset_path, tile_width, tile_length, width, length),
+                    "dropped": 0
+                }
+
+            result = MCPUnrealBridge._run_plan(plan_fn, {asset_path: floor_asset}, timings, dry_run, background)
+            if dry_run or background:
+                return to_json({ "status": "success", "result": result })
 
             center_x = width // 2
             center_y = length // 2
             position_x = center_x * tile_width
             position_y = center_y * tile_length
-            return json.dumps({
+            return to_json({
                 "status": "success",
                 "result" : f"Successfully created grid centered at tile location: ({center_x}, {center_y}) and world location: ({position_x}, {position_y}, 0.0))."
             })
 
         except Exception as e:
-            return json.dumps({ "status": "error", "message": f"Error loading asset: {str(e)}" })
+            return to_json({ "status": "error", "message": f"Error loading asset: {str(e)}" })
 
     @staticmethod
-    def create_town(town_center_x=1250, town_center_y=1250, town_width=7000, town_height=7000):
-        """
-        Create a town using supplied assets with customizable size and position
-        
-        Args:
-            town_center_x (float): X coordinate of the town center
-            town_center_y (float): Y coordinate of the town center
-            town_width (float): Total width of the town area
-            town_height (float): Total height of the town area
-        """
+    def _load_layout_assets(spec):
+        """Load every asset a layout spec uses, returning the assets and their bounds extents by path"""
+        footprints = {}
 
-        import random
-        import math
-
-        #print(f"Starting to build fantasy town at ({town_center_x}, {town_center_y}) with size {town_width}x{town_height}...")
-
-        # Base paths for our assets
-        model_base_path = "/Game/HandPaintedEnvironment/Assets/Models"
-
-        # Helper function to load an asset
-        def load_asset(asset_name):
-            full_path = f"{model_base_path}/{asset_name}.{asset_name}"
-            return unreal.EditorAssetLibrary.load_asset(full_path)
-
-        # Track placed objects for collision detection
-        placed_objects = []
-
-        # Helper function to check for collision with existing objects
-        def check_collision(new_bounds, tolerance=10.0):
-            """Check if the new object bounds overlap with any existing objects"""
-            for obj_bounds in placed_objects:
-                # Check if the bounds overlap in X, Y dimensions with some tolerance
-                if (new_bounds["min_x"] - tolerance <= obj_bounds["max_x"] and 
-                    new_bounds["max_x"] + tolerance >= obj_bounds["min_x"] and
-                    new_bounds["min_y"] - tolerance <= obj_bounds["max_y"] and
-                    new_bounds["max_y"] + tolerance >= obj_bounds["min_y"]):
-                    return True
-            return False
-
-        # Helper function to place an actor with collision detection
-        def place_actor(static_mesh, x, y, z=0, rotation_z=0, scale=(1.0, 1.0, 1.0), name=None, max_attempts=5):
-            if not static_mesh:
-                #print(f"Cannot place actor: Static mesh is invalid")
-                return None
-                
-            editor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        def record_footprint(path, asset):
+            extent = asset.get_bounds().box_extent
+            footprints[path] = (extent.x, extent.y, extent.z)
 
-            # Get the bounds of the mesh
-            bounds = static_mesh.get_bounds()
-            bounds_min = bounds.origin - bounds.box_extent
-            bounds_max = bounds.origin + bounds.box_extent
-            
-            # Calculate width, depth, height
-            width = bounds.box_extent.x * scale[0]
-            depth = bounds.box_extent.y * scale[1]
-            height = bounds.box_extent.z * scale[2]
-            
-            # Try multiple positions if collision occurs
-            for attempt in range(max_attempts):
-                # Add small variation to position for retry attempts after the first
-                x_offset = 0
-                y_offset = 0
-                if attempt > 0:
-                    jitter_range = 20.0 * attempt  # Increase jitter with each attempt
-                    x_offset = random.uniform(-jitter_range, jitter_range)
-                    y_offset = random.uniform(-jitter_range, jitter_range)
-                
-                pos_x = x + x_offset
-                pos_y = y + y_offset
-                
-                # Calculate the bounds of the actor at this position with rotation
-                rad_rotation = math.radians(rotation_z)
-                sin_rot = math.sin(rad_rotation)
-                cos_rot = math.cos(rad_rotation)
-                
-                # Calculate the 4 corners of the bounding box after rotation
-                corners = [
-                    (pos_x - width/2, pos_y - depth/2),  # Bottom-left
-                    (pos_x + width/2, pos_y - depth/2),  # Bottom-right
-                    (pos_x + width/2, pos_y + depth/2),  # Top-right
-                    (pos_x - width/2, pos_y + depth/2)   # Top-left
-                ]
-                
-                # Rotate the corners
-                rotated_corners = []
-                for corner_x, corner_y in corners:
-                    dx = corner_x - pos_x
-                    dy = corner_y - pos_y
-                    rotated_x = pos_x + dx * cos_rot - dy * sin_rot
-                    rotated_y = pos_y + dx * sin_rot + dy * cos_rot
-                    rotated_corners.append((rotated_x, rotated_y))
-                
-                # Find the extents of the rotated box
-                x_values = [p[0] for p in rotated_corners]
-                y_values = [p[1] for p in rotated_corners]
-                
-                min_x = min(x_values)
-                max_x = max(x_values)
-                min_y = min(y_values)
-                max_y = max(y_values)
-                
-                new_bounds = {
-                    "min_x": min_x,
-                    "max_x": max_x,
-                    "min_y": min_y,
-                    "max_y": max_y,
-                    "center_x": pos_x,
-                    "center_y": pos_y
-                }
-                
-                # Check if this position would cause a collision
-                if not check_collision(new_bounds):
-                    # No collision, so place the actor
-                    location = unreal.Vector(pos_x, pos_y, z)
-                    rotation = unreal.Rotator(0, 0, rotation_z)
-                    actor = editor_subsystem.spawn_actor_from_object(static_mesh, location, rotation)
-                    
-                    if actor:
-                        if name:
-                            actor.set_actor_label(name)
-                        
-                        # Apply scale if needed
-                        if scale != (1.0, 1.0, 1.0):
-                            actor.set_actor_scale3d(unreal.Vector(scale[0], scale[1], scale[2]))
-                        
-                        # Record the placed object
-                        placed_objects.append(new_bounds)
-                        
-                        #if attempt > 0:
-                        #    print(f"Placed {name} at alternate position after {attempt+1} attempts")
-                        return actor
-            
-            #print(f"Failed to place {name} after {max_attempts} attempts due to collisions")
-            return None
-
-        # Helper function to get mesh dimensions
-        def get_mesh_dimensions(static_mesh, scale=(1.0, 1.0, 1.0)):
-            if not static_mesh:
-                return 0, 0, 0
-                
-            bounds = static_mesh.get_bounds()
-            width = bounds.box_extent.x * scale[0]
-            depth = bounds.box_extent.y * scale[1]
-            height = bounds.box_extent.z * scale[2]
-            
-            return width, depth, height
+        # Footprints are read as each asset arrives, but planning (and so spawning) needs all of them
+        assets = MCPUnrealBridge._load_assets(layout_asset_paths(spec), record_footprint)
+        return assets, footprints
 
-        # New helper for placing continuous walls or fences
-        def place_continuous_segments(mesh, start_point, end_point, z=0, rotation_offset=0, scale=(1.0, 1.0, 1.0), name_prefix="Segment", skip_indices=None):
-            if not mesh:
-                #print(f"Cannot place continuous segments: Mesh is invalid")
-                return []
-                
-            if skip_indices is None:
-                skip_indices = []
-                
-            # Get the dimensions of the mesh
-            mesh_width, mesh_depth, mesh_height = get_mesh_dimensions(mesh, scale)
-            
-            # For walls/fences, we assume they extend primarily along one dimension (width)
-            segment_length = mesh_width
-            
-            # Calculate distance and direction
-            start_x, start_y = start_point
-            end_x, end_y = end_point
-            dx = end_x - start_x
-            dy = end_y - start_y
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            # Calculate the angle of the line
-            angle = math.degrees(math.atan2(dy, dx))
-            
-            # Calculate number of segments needed to cover the distance
-            # Subtract a small overlap percentage to ensure segments connect properly
-            overlap_factor = 0.05  # 5% overlap to ensure no gaps
-            effective_segment_length = segment_length * (1 - overlap_factor)
-            num_segments = max(1, math.ceil(distance / effective_segment_length))
-            
-            # Place segments along the line
-            placed_actors = []
-            for i in range(num_segments):
-                if i in skip_indices:
+    @staticmethod
+    def _spawn_plan(placements, assets):
+        """Spawn a compiled placement plan in one pass, returning the number of actors created"""
+        editor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+
+        spawned = 0
+        with MCPUnrealBridge._bulk_operation("MCP Spawn Layout"):
+            for placement in placements:
+                asset = assets.get(placement["asset"])
+                if not asset:
                     continue
-                    
-                # Calculate position along the line
-                t = i / num_segments
-                pos_x = start_x + t * dx
-                pos_y = start_y + t * dy
-                
-                # Place the segment
-                actor = place_actor(mesh, pos_x, pos_y, z, angle + rotation_offset, scale, f"{name_prefix}_{i}")
+
+                actor = editor_subsystem.spawn_actor_from_object(asset, unreal.Vector(*placement["location"]), unreal.Rotator(*placement["rotation"]))
                 if actor:
-                    placed_actors.append(actor)
-            
-            return placed_actors
+                    if placement["label"]:
+                        actor.set_actor_label(placement["label"])
+                    if placement["scale"] != [1.0, 1.0, 1.0]:
+                        actor.set_actor_scale3d(unreal.Vector(*placement["scale"]))
+                    spawned += 1
 
+        return spawned
+
+    @staticmethod
+    def _get_planning_pool():
+        """Get the layout planning pool, preferring processes so planning scales with CPU cores"""
+        if MCPUnrealBridge._planning_pool is None:
+            try:
+                # Worker processes have to run the engine's Python interpreter, not the editor executable
+                multiprocessing.set_executable(unreal.get_interpreter_executable_path())
+                MCPUnrealBridge._planning_pool = concurrent.futures.ProcessPoolExecutor()
+            except Exception:
+                MCPUnrealBridge._planning_pool = concurrent.futures.ThreadPoolExecutor()
+        return MCPUnrealBridge._planning_pool
+
+    @staticmethod
+    def _plan_layout(spec, footprints, seed):
+        """Compile a layout on the planning pool, falling back to threads if worker processes can't start"""
         try:
-            # Calculate the scale factor based on town size compared to the original
-            # Original size was approximately 700x700
-            width_scale = 1.0 #town_width / 700.0
-            height_scale = 1.0 #town_height / 700.0
-
-            # We'll use this to scale distances and positions
-            scale_factor = min(width_scale, height_scale)  # Use the smaller scale to ensure everything fits
-
-            # STEP 1: PLACE BUILDINGS
-            #print("STEP 1: Placing buildings...")
-
-            # Load building assets
-            buildings = {
-                "town_hall": load_asset("Town_Hall"),
-                "large_house": load_asset("Large_house"),
-                "small_house": load_asset("Small_house"),
-                "baker_house": load_asset("Baker_house"),
-                "tavern": load_asset("Tavern"),
-                "witch_house": load_asset("Witch_house"),
-                "tower": load_asset("Tower"),
-                "mill": load_asset("Mill"),
-                "woodmill": load_asset("Woodmill"),
-                "forge": load_asset("Forge"),
-                "mine": load_asset("Mine")
-            }
+            return compile_layout(spec, footprints, seed, MCPUnrealBridge._get_planning_pool())
+        except concurrent.futures.process.BrokenProcessPool:
+            MCPUnrealBridge._planning_pool = concurrent.futures.ThreadPoolExecutor()
+            return compile_layout(spec, footprints, seed, MCPUnrealBridge._planning_pool)
 
-            # Check if assets loaded correctly
-            #for name, asset in buildings.items():
-            #    if not asset:
-            #        print(f"Failed to load {name}")
-
-            # Place central buildings - town hall
-            place_actor(buildings["town_hall"], town_center_x, town_center_y, 0, 0, name="Central_TownHall")
-
-            # Place tavern near the town center - scale the offset by our scale factor
-            place_actor(buildings["tavern"], 
-                        town_center_x + 800 * scale_factor, 
-                        town_center_y + 600 * scale_factor, 
-                        0, 135, name="Tavern")
-
-            # Place houses around the center - scaled based on town size
-            house_positions = [
-                # North district
-                (town_center_x - 1800 * scale_factor, town_center_y - 1900 * scale_factor, 45, "small_house", "North_House_1"),
-                (town_center_x - 2100 * scale_factor, town_center_y - 2200 * scale_factor, 30, "baker_house", "North_BakerHouse"),
-                (town_center_x - 1300 * scale_factor, town_center_y - 2000 * scale_factor, 15, "small_house", "North_House_2"),
-                
-                # East district
-                (town_center_x + 2200 * scale_factor, town_center_y - 1300 * scale_factor, 270, "large_house", "East_LargeHouse"),
-                (town_center_x + 2400 * scale_factor, town_center_y + 1200 * scale_factor, 300, "small_house", "East_House_1"),
-                (town_center_x + 1900 * scale_factor, town_center_y - 1700 * scale_factor, 315, "small_house", "East_House_2"),
-                
-                # South district
-                (town_center_x + 1300 * scale_factor, town_center_y + 2100 * scale_factor, 180, "large_house", "South_LargeHouse"),
-                (town_center_x - 1200 * scale_factor, town_center_y + 1950 * scale_factor, 135, "small_house", "South_House_1"),
-                
-                # West district
-                (town_center_x - 2000 * scale_factor, town_center_y + 1100 * scale_factor, 90, "large_house", "West_LargeHouse"),
-                (town_center_x - 2300 * scale_factor, town_center_y + 1500 * scale_factor, 45, "small_house", "West_House_1")
-            ]
-
-            # Place the houses
-            for x, y, rot, house_type, name in house_positions:
-                place_actor(buildings[house_type], x, y, 0, rot, name=name)
-
-            # Place special buildings
-            # Tower
-            place_actor(buildings["tower"], 
-                        town_center_x - 3000 * scale_factor, 
-                        town_center_y - 2900 * scale_factor, 
-                        0, 45, name="North_Tower")
-
-            # Witch's house in a more secluded area
-            place_actor(buildings["witch_house"], 
-                        town_center_x + 3000 * scale_factor, 
-                        town_center_y + 2900 * scale_factor, 
-                        0, 215, name="WitchHouse")
-
-            # Mill near water (imaginary river)
-            mill_x = town_center_x + 2900 * scale_factor
-            mill_y = town_center_y - 3000 * scale_factor
-            mill = place_actor(buildings["mill"], mill_x, mill_y, 0, 270, name="Watermill")
-            
-            # Mill wings - need to be attached to the mill
-            mill_wings = load_asset("Mill_wings")
-            if mill and mill_wings:
-                place_actor(mill_wings, mill_x, mill_y, 0, 270, name="Watermill_Wings")
-
-            # Woodmill in a wooded area
-            woodmill_x = town_center_x - 2900 * scale_factor
-            woodmill_y = town_center_y - 2400 * scale_factor
-            place_actor(buildings["woodmill"], woodmill_x, woodmill_y, 0, 135, name="Woodmill")
-            
-            woodmill_saw = load_asset("Woodmill_Saw")
-            if woodmill_saw:
-                place_actor(woodmill_saw, woodmill_x, woodmill_y, 0, 135, name="Woodmill_Saw")
-
-            # Forge
-            place_actor(buildings["forge"], 
-                        town_center_x + 1600 * scale_factor, 
-                        town_center_y - 1500 * scale_factor, 
-                        0, 330, name="Forge")
-
-            # Mine at the edge of town
-            place_actor(buildings["mine"], 
-                        town_center_x - 2900 * scale_factor, 
-                        town_center_y + 2900 * scale_factor, 
-                        0, 135, name="Mine")
-
-            #print("Buildings placed successfully")
-
-            # STEP 2: ADD NATURE ELEMENTS
-            #print("STEP 2: Adding trees, plants, and rocks...")
-
-            # Load nature assets
-            nature = {
-                "tree_1": load_asset("Tree_1"),
-                "tree_2": load_asset("Tree_2"),
-                "tree_4": load_asset("Tree_4"),
-                "pine_tree": load_asset("Pine_tree"),
-                "pine_tree_2": load_asset("Pine_tree_2"),
-                "bush_1": load_asset("Bush_1"),
-                "bush_2": load_asset("Bush_2"),
-                "fern": load_asset("Fern"),
-                "flowers_1": load_asset("Flowers_1"),
-                "flowers_2": load_asset("Flowers_2"),
-                "plant": load_asset("Plant"),
-                "rock_1": load_asset("Rock_1"),
-                "rock_2": load_asset("Rock_2"),
-                "rock_3": load_asset("Rock_3"),
-                "rock_4": load_asset("Rock_4"),
-                "stump": load_asset("Stump"),
-                "log": load_asset("Log"),
-                "mushroom_1": load_asset("Mushroom_1"),
-                "mushroom_2": load_asset("Mushroom_2")
-            }
+    @staticmethod
+    def _finish_plan(plan, assets, timings, dry_run):
+        """Spawn a finished plan (unless dry_run) on the game thread and summarize it"""
+        result = {
+            "seed": plan["seed"],
+            "planned": len(plan["placements"]),
+            "dropped": plan["dropped"],
+            "timings": timings
+        }
+        if dry_run:
+            result["placements"] = plan["placements"]
+            return result
+
+        phase_start = time.perf_counter()
+        result["spawned"] = MCPUnrealBridge._spawn_plan(plan["placements"], assets)
+        timings["spawn"] = time.perf_counter() - phase_start
+        return result
 
-            # Create a forest area near the witch's house
-            forest_center_x = town_center_x + 2900 * scale_factor
-            forest_center_y = town_center_y + 2200 * scale_factor
-            forest_radius = 1500 * scale_factor
+    @staticmethod
+    def _run_plan(plan_fn, assets, timings, dry_run=False, background=False):
+        """
+        Run a planning function and spawn its plan, timing each phase.
+        In the background, planning happens off the game thread and only the
+        finished plan comes back to it to be spawned, see _tick_layout_jobs.
+        """
+        if not background:
+            phase_start = time.perf_counter()
+            plan = plan_fn()
+            timings["plan"] = time.perf_counter() - phase_start
+            return MCPUnrealBridge._finish_plan(plan, assets, timings, dry_run)
+
+        def timed_plan_fn():
+            phase_start = time.perf_counter()
+            plan = plan_fn()
+            timings["plan"] = time.perf_counter() - phase_start
+            return plan
+
+        if MCPUnrealBridge._job_runner is None:
+            MCPUnrealBridge._job_runner = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        job_id = MCPUnrealBridge._next_layout_job
+        MCPUnrealBridge._next_layout_job += 1
+        MCPUnrealBridge._layout_jobs[job_id] = {
+            "future": MCPUnrealBridge._job_runner.submit(timed_plan_fn),
+            "assets": assets,
+            "timings": timings,
+            "dry_run": dry_run,
+            "status": "planning",
+            "result": None
+        }
+
+        if MCPUnrealBridge._layout_tick_handle is None:
+            MCPUnrealBridge._layout_tick_handle = unreal.register_slate_post_tick_callback(MCPUnrealBridge._tick_layout_jobs)
+
+        return {"job": job_id, "status": "planning"}
 
-            # Determine number of trees based on forest area
-            num_trees = int(500 * scale_factor)
-            
-            # Add trees to the forest
-            for i in range(num_trees):
-                # Calculate random position within the forest area
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(0, forest_radius)
-                x = forest_center_x + distance * math.cos(angle)
-                y = forest_center_y + distance * math.sin(angle)
-                
-                # Choose a random tree type
-                tree_type = random.choice(["tree_1", "tree_2", "tree_4", "pine_tree", "pine_tree_2"])
-                rot = random.uniform(0, 360)
-                scale = random.uniform(0.8, 1.2)
-                
-                tree = place_actor(nature[tree_type], x, y, 0, rot, (scale, scale, scale), f"Forest_Tree_{i}")
-                
-                # Add some undergrowth near trees if the tree was placed successfully
-                if tree and random.random() < 0.6:
-                    undergrowth_type = random.choice(["bush_1", "bush_2", "fern", "mushroom_1", "mushroom_2"])
-                    offset_x = random.uniform(-100, 100)
-                    offset_y = random.uniform(-100, 100)
-                    undergrowth_scale = random.uniform(0.7, 1.0)
-                    place_actor(nature[undergrowth_type], 
-                                x + offset_x, 
-                                y + offset_y, 
-                                0, 
-                                random.uniform(0, 360), 
-                                (undergrowth_scale, undergrowth_scale, undergrowth_scale), 
-                                f"Forest_Undergrowth_{i}")
-
-            # Add scattered trees around town - scale the number by town size
-            scattered_trees = int(100 * scale_factor)
-            for i in range(scattered_trees):
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(3000, 3000) * scale_factor
-                x = town_center_x + distance * math.cos(angle)
-                y = town_center_y + distance * math.sin(angle)
-                
-                # Avoid placing in the forest area
-                forest_dist = math.sqrt((x - forest_center_x)**2 + (y - forest_center_y)**2)
-                if forest_dist < forest_radius:
-                    continue
-                
-                tree_type = random.choice(["tree_1", "tree_2", "tree_4"])
-                rot = random.uniform(0, 360)
-                scale = random.uniform(0.9, 1.1)
-                
-                place_actor(nature[tree_type], x, y, 0, rot, (scale, scale, scale), f"Town_Tree_{i}")
-
-            # Add some rocks scattered around
-            num_rocks = int(15 * scale_factor)
-            for i in range(num_rocks):
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(3000, 3000) * scale_factor
-                x = town_center_x + distance * math.cos(angle)
-                y = town_center_y + distance * math.sin(angle)
-                
-                rock_type = random.choice(["rock_1", "rock_2", "rock_3", "rock_4"])
-                rot = random.uniform(0, 360)
-                scale = random.uniform(0.8, 1.5)
-                
-                place_actor(nature[rock_type], x, y, 0, rot, (scale, scale, scale), f"Rock_{i}")
-
-            # Create gardens near houses
-            houses = [
-                (town_center_x - 2000 * scale_factor, town_center_y - 1900 * scale_factor),  # North_House_1
-                (town_center_x - 1300 * scale_factor, town_center_y - 2000 * scale_factor), # North_House_2
-                (town_center_x + 2400 * scale_factor, town_center_y + 1200 * scale_factor), # East_House_1
-                (town_center_x - 1200 * scale_factor, town_center_y + 1950 * scale_factor),  # South_House_1
-            ]
-
-            for idx, (house_x, house_y) in enumerate(houses):
-                garden_x = house_x + random.uniform(200, 300)
-                garden_y = house_y + random.uniform(200, 300)
-                
-                # Place flowers and plants in the garden
-                plants_per_garden = int(5 * scale_factor)
-                for j in range(plants_per_garden):
-                    plant_x = garden_x + random.uniform(-100, 100)
-                    plant_y = garden_y + random.uniform(-100, 100)
-                    plant_type = random.choice(["flowers_1", "flowers_2", "plant", "bush_1"])
-                    rot = random.uniform(0, 360)
-                    
-                    place_actor(nature[plant_type], plant_x, plant_y, 0, rot, name=f"Garden_{idx}_Plant_{j}")
-
-            #print("Nature elements added successfully")
-
-            # STEP 3: CREATE FENCES
-            #print("STEP 3: Building fences...")
-
-            # Load fence assets
-            fences = {
-                "fence": load_asset("Fence"),
-                "fence_1": load_asset("Fence_1"),
-                "fence_2": load_asset("Fence_2"),
-                "stone_fence": load_asset("Stone_fence")
-            }
+    @staticmethod
+    def _tick_layout_jobs(delta_time):
+        """Slate tick on the game thread, spawning the plans of background jobs as they finish planning"""
+        still_planning = False
+        for job in MCPUnrealBridge._layout_jobs.values():
+            if job["status"] != "planning":
+                continue
+            if not job["future"].done():
+                still_planning = True
+                continue
 
-            # Define garden perimeters to fence
-            gardens = [
-                {
-                    "center": (town_center_x - 1800 * scale_factor, town_center_y - 1900 * scale_factor),  # North_House_1
-                    "size": (30 * scale_factor, 30 * scale_factor),
-                    "fence_type": "fence",
-                    "name": "North_House_1_Garden"
-                },
-                {
-                    "center": (town_center_x + 2400 * scale_factor, town_center_y + 1200 * scale_factor),  # East_House_1
-                    "size": (25 * scale_factor, 30 * scale_factor),
-                    "fence_type": "fence_1",
-                    "name": "East_House_1_Garden"
-                },
-                {
-                    "center": (town_center_x + 1300 * scale_factor, town_center_y + 2200 * scale_factor),  # South_LargeHouse
-                    "size": (35 * scale_factor, 35 * scale_factor),
-                    "fence_type": "fence_2",
-                    "name": "South_LargeHouse_Garden"
-                }
-            ]
-
-            # For each garden, create a fence perimeter
-            for garden in gardens:
-                center_x, center_y = garden["center"]
-                width, height = garden["size"]
-                fence_type = garden["fence_type"]
-                name_prefix = garden["name"]
-                
-                # Calculate the corner points of the garden
-                half_width = width / 2
-                half_height = height / 2
-                
-                corners = [
-                    (center_x - half_width, center_y - half_height),  # Bottom-left
-                    (center_x + half_width, center_y - half_height),  # Bottom-right
-                    (center_x + half_width, center_y + half_height),  # Top-right
-                    (center_x - half_width, center_y + half_height)   # Top-left
-                ]
-                
-                # Build the perimeter with continuous segments
-                for i in range(4):
-                    start_point = corners[i]
-                    end_point = corners[(i + 1) % 4]
-                    
-                    # For each side, determine if we need a gate
-                    skip_indices = []
-                    if i == 0:  # Usually front of the garden has a gate
-                        skip_indices = [1]  # Skip middle segment for a gate
-                    
-                    # Place continuous fence segments
-                    place_continuous_segments(
-                        fences[fence_type],
-                        start_point,
-                        end_point,
-                        0,  # z coordinate
-                        90,  # rotation offset (fences usually need to be rotated perpendicular to the line)
-                        (1.0, 1.0, 1.0),  # scale
-                        f"{name_prefix}_Fence_{i}",
-                        skip_indices
-                    )
-
-            # Create a fence around the town center square
-            town_square = {
-                "center": (town_center_x, town_center_y),
-                "size": (90 * scale_factor, 90 * scale_factor),
-                "fence_type": "stone_fence",
-                "name": "Town_Square"
-            }
+            try:
+                job["result"] = MCPUnrealBridge._finish_plan(job["future"].result(), job["assets"], job["timings"], job["dry_run"])
+                job["status"] = "done"
+            except Exception as e:
+                job["result"] = str(e)
+                job["status"] = "error"
+            job["assets"] = None
 
-            center_x, center_y = town_square["center"]
-            width, height = town_square["size"]
-            fence_type = town_square["fence_type"]
-            name_prefix = town_square["name"]
-
-            # Calculate the corner points
-            half_width = width / 2
-            half_height = height / 2
-
-            corners = [
-                (center_x - half_width, center_y - half_height),  # Bottom-left
-                (center_x + half_width, center_y - half_height),  # Bottom-right
-                (center_x + half_width, center_y + half_height),  # Top-right
-                (center_x - half_width, center_y + half_height)   # Top-left
-            ]
-
-            # Build the perimeter with continuous segments and gates
-            for i in range(4):
-                start_point = corners[i]
-                end_point = corners[(i + 1) % 4]
-                
-                # Create entrance gates on all sides
-                skip_indices = [1]  # Skip middle segment for a gate
-                
-                # Place continuous stone fence segments
-                place_continuous_segments(
-                    fences[fence_type],
-                    start_point,
-                    end_point,
-                    0,  # z coordinate
-                    90,  # rotation offset
-                    (1.0, 1.0, 1.0),  # scale
-                    f"{name_prefix}_Fence_{i}",
-                    skip_indices
-                )
-
-            #print("Fences created successfully")
-
-            # STEP 4: BUILD WALLS
-            #print("STEP 4: Building walls...")
-
-            # Load wall assets
-            walls = {
-                "wall_1": load_asset("Wall_1"),
-                "wall_2": load_asset("Wall_2")
-            }
+        if not still_planning:
+            unreal.unregister_slate_post_tick_callback(MCPUnrealBridge._layout_tick_handle)
+            MCPUnrealBridge._layout_tick_handle = None
 
-            # Get wall dimensions for alternating walls
-            wall1_width, _, _ = get_mesh_dimensions(walls["wall_1"])
-            wall2_width, _, _ = get_mesh_dimensions(walls["wall_2"])
+    @staticmethod
+    def get_layout_job(job_id):
+        """Get the status of a background layout job, and its result once finished"""
+        try:
+            job_id = int(job_id)
+            job = MCPUnrealBridge._layout_jobs.get(job_id)
+            if job is None:
+                return to_json({ "status": "error", "message": f"Layout job {job_id} not found" })
+
+            if job["status"] == "planning":
+                return to_json({ "status": "success", "result": {"job": job_id, "status": "planning"} })
+
+            # Finished jobs are handed out once
+            del MCPUnrealBridge._layout_jobs[job_id]
+            if job["status"] == "error":
+                return to_json({ "status": "error", "message": f"Layout job {job_id} failed: {job['result']}" })
+
+            result = {"job": job_id, "status": "done"}
+            result.update(job["result"])
+            return to_json({ "status": "success", "result": result })
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
 
-            # Define the town perimeter for walls - use the provided town width and height
-            town_perimeter = {
-                "center": (town_center_x, town_center_y),
-                "size": (town_width, town_height),
-                "name": "Town_Wall"
-            }
+    @staticmethod
+    def _run_layout(spec, seed=None, dry_run=False, background=False):
+        """
+        Load, plan and (unless dry_run) spawn a layout spec, timing each phase.
+        Dry runs keep the full placement list in the result instead of spawning it.
+        """
+        timings = {}
 
-            center_x, center_y = town_perimeter["center"]
-            width, height = town_perimeter["size"]
-            name_prefix = town_perimeter["name"]
-
-            # Calculate the corner points
-            half_width = (width / 2) - wall1_width
-            half_height = (height / 2) - wall1_width
-
-            corners = [
-                (center_x - half_width, center_y - half_height),  # Bottom-left
-                (center_x + half_width, center_y - half_height),  # Bottom-right
-                (center_x + half_width, center_y + half_height),  # Top-right
-                (center_x - half_width, center_y + half_height)   # Top-left
-            ]
-
-            # Build the perimeter with continuous wall segments
-            # For each side, first measure the total length and determine how many of each wall type to use
-            for i in range(4):
-                start_point = corners[i]
-                end_point = corners[(i + 1) % 4]
-                
-                # Calculate side length
-                start_x, start_y = start_point
-                end_x, end_y = end_point
-                side_length = math.sqrt((end_x - start_x)**2 + (end_y - start_y)**2)
-                
-                # Determine where to place gates - we'll place 1-2 gates on each side based on length
-                # Calculate how many walls would fit on this side
-                effective_wall1_length = wall1_width * 0.95  # Account for slight overlap
-                num_wall1_segments = math.ceil(side_length / effective_wall1_length)
-                
-                # Identify gate positions - which segments to skip
-                gate_skip_indices = []
-                if num_wall1_segments > 8:
-                    # Place two gates if the wall is long enough
-                    gate_skip_indices = [num_wall1_segments // 3, 2 * num_wall1_segments // 3]
-                else:
-                    # Otherwise just one gate in the middle
-                    gate_skip_indices = [num_wall1_segments // 2]
-                
-                # Place the wall segments using primarily wall_1 with gates
-                wall1_actors = place_continuous_segments(
-                    walls["wall_1"],
-                    start_point,
-                    end_point,
-                    0,  # z coordinate
-                    0,   # no rotation offset for walls
-                    (1.0, 1.0, 1.0),  # scale
-                    f"{name_prefix}_Wall1_{i}",
-                    gate_skip_indices
-                )
-                
-                # For each gate position, place a tower
-                for gate_idx in gate_skip_indices:
-                    t = gate_idx / num_wall1_segments
-                    pos_x = start_x + t * (end_x - start_x)
-                    pos_y = start_y + t * (end_y - start_y)
-                    
-                    # Calculate angle
-                    angle = math.degrees(math.atan2(end_y - start_y, end_x - start_x))
-                    
-                    # Place tower at gate position
-                    tower = load_asset("Tower")
-                    if tower:
-                        place_actor(tower, pos_x, pos_y, 0, angle + 90, name=f"Gate_Tower_{i}_{gate_idx}")
-
-            #print("Walls built successfully")
-
-            # STEP 5: ADD FINAL DETAILS
-            #print("STEP 5: Adding final details and props...")
-
-            # Load remaining prop assets
-            props = {
-                "anvil": load_asset("Anvil"),
-                "barrel": load_asset("Barrel"),
-                "chest": load_asset("Chest"),
-                "cauldron": load_asset("Cauldron"),
-                "altar": load_asset("Altar"),
-                "well": load_asset("Well"),
-                "trolley": load_asset("Trolley"),
-                "lamppost": load_asset("Lamppost"),
-                "street_light": load_asset("street_light")
-            }
+        # Assets have to be loaded on the game thread, before planning starts
+        phase_start = time.perf_counter()
+        assets, footprints = MCPUnrealBridge._load_layout_assets(spec)
+        timings["load"] = time.perf_counter() - phase_start
 
-            # Place a well in the town center
-            place_actor(props["well"], town_center_x + 150 * scale_factor, town_center_y - 150 * scale_factor, 0, 0, name="Town_Center_Well")
+        seed = None if seed is None else int(seed)
+        return MCPUnrealBridge._run_plan(lambda: MCPUnrealBridge._plan_layout(spec, footprints, seed),
+                                         assets, timings, dry_run, background)
 
-            # Place streetlights around the town square
-            square_size = 90 * scale_factor
-            light_spacing = 30 * scale_factor
-            for i in range(4):
-                for j in range(3):
-                    if j == 1:  # Skip middle to accommodate entrances
-                        continue
-                        
-                    # Calculate position along each side of the square
-                    if i == 0:  # North side
-                        x = town_center_x - square_size/2 + j * light_spacing
-                        y = town_center_y - square_size/2
-                        rot = 0
-                    elif i == 1:  # East side
-                        x = town_center_x + square_size/2
-                        y = town_center_y - square_size/2 + j * light_spacing
-                        rot = 90
-                    elif i == 2:  # South side
-                        x = town_center_x + square_size/2 - j * light_spacing
-                        y = town_center_y + square_size/2
-                        rot = 180
-                    else:  # West side
-                        x = town_center_x - square_size/2
-                        y = town_center_y + square_size/2 - j * light_spacing
-                        rot = 270
-                        
-                    light_type = "lamppost" if j % 2 == 0 else "street_light"
-                    place_actor(props[light_type], x, y, 0, rot, name=f"Square_Light_{i}_{j}")
-
-            # Add props near the forge
-            forge_x = town_center_x + 600 * scale_factor
-            forge_y = town_center_y - 500 * scale_factor
-
-            place_actor(props["anvil"], forge_x + 50 * scale_factor, forge_y - 80 * scale_factor, 0, 45, name="Forge_Anvil")
-            place_actor(props["barrel"], forge_x - 70 * scale_factor, forge_y - 60 * scale_factor, 0, 0, name="Forge_Barrel")
-
-            # Add barrels and chests around the tavern
-            tavern_x = town_center_x + 700 * scale_factor
-            tavern_y = town_center_y + 600 * scale_factor
-
-            for i in range(3):
-                x_offset = random.uniform(-150, 150) * scale_factor
-                y_offset = random.uniform(-150, 150) * scale_factor
-                rot = random.uniform(0, 360)
-                place_actor(props["barrel"], tavern_x + x_offset, tavern_y + y_offset, 0, rot, name=f"Tavern_Barrel_{i}")
-
-            place_actor(props["chest"], tavern_x - 100 * scale_factor, tavern_y + 120 * scale_factor, 0, 45, name="Tavern_Chest")
-
-            # Add altar near the witch's house
-            witch_house_x = town_center_x + 1800 * scale_factor
-            witch_house_y = town_center_y + 1500 * scale_factor
-
-            place_actor(props["altar"], witch_house_x + 150 * scale_factor, witch_house_y + 100 * scale_factor, 0, 215, name="Witch_Altar")
-            place_actor(props["cauldron"], witch_house_x - 80 * scale_factor, witch_house_y + 120 * scale_factor, 0, 0, name="Witch_Cauldron")
-
-            # Add a trolley near the mine
-            mine_x = town_center_x - 2200 * scale_factor
-            mine_y = town_center_y + 1800 * scale_factor
-
-            place_actor(props["trolley"], mine_x + 150 * scale_factor, mine_y - 100 * scale_factor, 0, 45, name="Mine_Trolley")
-
-            # Create a path connecting major locations with Tile assets
-            tiles = {
-                "tile_1": load_asset("Tile_1"),
-                "tile_2": load_asset("Tile_2"),
-                "tile_3": load_asset("Tile_3"),
-                "tile_4": load_asset("Tile_4"),
-                "tile_5": load_asset("Tile_5"),
-                "tile_6": load_asset("Tile_6"),
-                "tile_7": load_asset("Tile_7")
-            }
+    @staticmethod
+    def execute_layout(spec, seed=None, dry_run=False, background=False):
+        """Compile a declarative layout spec and spawn the resulting plan"""
+        try:
+            if isinstance(spec, str):
+                spec = json.loads(spec)
 
-            # Define major path points - scaled based on town size
-            path_points = [
-                (town_center_x, town_center_y),  # Town center
-                (town_center_x + 700 * scale_factor, town_center_y + 600 * scale_factor),  # Tavern
-                (town_center_x + 600 * scale_factor, town_center_y - 500 * scale_factor),  # Forge
-                (town_center_x - 1000 * scale_factor, town_center_y - 1700 * scale_factor),  # Tower
-                (town_center_x + 1700 * scale_factor, town_center_y - 1200 * scale_factor),  # Watermill
-                (town_center_x - 1800 * scale_factor, town_center_y - 400 * scale_factor),  # Woodmill
-                (town_center_x - 2200 * scale_factor, town_center_y + 1800 * scale_factor),  # Mine
-                (town_center_x + 1800 * scale_factor, town_center_y + 1500 * scale_factor)  # Witch house
-            ]
-
-            # Create paths between points
-            for i in range(len(path_points) - 1):
-                start_x, start_y = path_points[i]
-                end_x, end_y = path_points[i + 1]
-                
-                # Calculate distance and direction
-                dx = end_x - start_x
-                dy = end_y - start_y
-                distance = math.sqrt(dx*dx + dy*dy)
-                
-                # Tile spacing - scale by the town size
-                tile_spacing = 100 * scale_factor
-                num_tiles = int(distance / tile_spacing)
-                
-                # Place tiles along the path
-                for j in range(num_tiles):
-                    t = j / num_tiles
-                    x = start_x + t * dx
-                    y = start_y + t * dy
-                    
-                    # Add some randomness to make the path look more natural
-                    offset_x = random.uniform(-20, 20) * scale_factor
-                    offset_y = random.uniform(-20, 20) * scale_factor
-                    
-                    # Random tile type
-                    tile_type = random.choice(["tile_1", "tile_2", "tile_3", "tile_4", "tile_5", "tile_6", "tile_7"])
-                    rot = random.uniform(0, 360)
-                    
-                    place_actor(tiles[tile_type], x + offset_x, y + offset_y, 1, rot, name=f"Path_Tile_{i}_{j}")
-
-            #print("Final details added successfully")
-            #print(f"Fantasy town creation complete at ({town_center_x}, {town_center_y}) with size {town_width}x{town_height}!")
-
-            return json.dumps({
+            return to_json({
+                "status": "success",
+                "result": MCPUnrealBridge._run_layout(spec, seed, dry_run, background)
+            })
+        except Exception as e:
+            return to_json({ "status": "error", "message": f"Error executing layout: {str(e)}" })
+
+    @staticmethod
+    def create_town(town_center_x=1250, town_center_y=1250, town_width=7000, town_height=7000, seed=None, dry_run=False, background=False):
+        """
+        Create a town using supplied assets with customizable size and position
+        
+        Args:
+            town_center_x (float): X coordinate of the town center
+            town_center_y (float): Y coordinate of the town center
+            town_width (float): Total width of the town area
+            town_height (float): Total height of the town area
+            seed (int): Seed for the random layout, the same seed always builds the same town
+            dry_run (bool): Return the planned placements and phase timings without spawning anything
+            background (bool): Plan off the game thread and return a job id to poll with get_layout_job
+        """
+
+        try:
+            # The layout lives in mcp_town as a spec, so it can be planned without the editor
+            spec = town_layout_spec(town_center_x, town_center_y, town_width, town_height)
+            result = MCPUnrealBridge._run_layout(spec, seed, dry_run, background)
+
+            if dry_run or background:
+                return to_json({ "status": "success", "result": result })
+
+            return to_json({
                 "status": "success",
-                "result": f"Successfully created fantasy town at ({town_center_x}, {town_center_y}) with size {town_width}x{town_height}."
+                "result": f"Successfully created fantasy town at ({town_center_x}, {town_center_y}) with size {town_width}x{town_height} using seed {result['seed']}."
             })
 
         except Exception as e:
-            return json.dumps({ "status": "error", "message": f"Error building town: {str(e)}" })
+            return to_json({ "status": "error", "message": f"Error building town: {str(e)}" })
+
+    @staticmethod
+    def _parameter_converter(type_name):
+        """Converter for a Blueprint parameter type as described by GetFunctionParameters"""
+        if type_name == "bool":
+            return MCPUnrealBridge._to_bool
+        if type_name == "int":
+            return lambda value: int(float(value))
+        if type_name == "float":
+            return float
+        if type_name in ("str", "text"):
+            return str
+        if type_name == "name":
+            return lambda value: unreal.Name(str(value))
+        if type_name == "object":
+            return MCPUnrealBridge._to_object
+        struct_converters = {
+            "Vector": MCPUnrealBridge._to_vector,
+            "Rotator": MCPUnrealBridge._to_rotator,
+            "Transform": MCPUnrealBridge._to_transform,
+            "LinearColor": MCPUnrealBridge._to_linear_color,
+            "Color": MCPUnrealBridge._to_color
+        }
+        # Enums and anything else are passed through as given
+        return struct_converters.get(type_name, lambda value: value)
+
+    @staticmethod
+    def _get_blueprint_callable(blueprint_name, function_name):
+        """Get a Blueprint function bound to its CDO, its argument converters (None if unknown) and the Blueprint's path"""
+        key = (blueprint_name, function_name)
+        entry = MCPUnrealBridge._blueprint_callables.get(key)
+        if entry is not None and unreal.SystemLibrary.is_valid(entry[3]):
+            return entry[:3]
+
+        # Find the Blueprint asset
+        blueprint_asset = unreal.find_asset(blueprint_name)
+        if not blueprint_asset:
+            raise LookupError(f"Blueprint '{blueprint_name}' not found")
+
+        # Get the blueprint class
+        blueprint_class = unreal.load_class(blueprint_asset)
+        if not blueprint_class:
+            raise LookupError(f"Could not load class from Blueprint '{blueprint_name}'")
+
+        # Get the CDO(Class Default Object)
+        cdo = unreal.get_default_object(blueprint_class)
+        function = getattr(cdo, function_name)
+
+        # Type the arguments from the function's signature when the plugin can describe it
+        converters = None
+        library = getattr(unreal, "MCPBridgeEditorLibrary", None)
+        if library:
+            parameters, found = library.get_function_parameters(blueprint_class, function_name)
+            if found:
+                converters = [MCPUnrealBridge._parameter_converter(parameter.split(':', 1)[1]) for parameter in parameters]
+
+        entry = (function, converters, blueprint_asset.get_path_name(), cdo)
+        MCPUnrealBridge._blueprint_callables[key] = entry
+        return entry[:3]
+
+    @staticmethod
+    def _parse_blueprint_arguments(arguments):
+        """Guess argument types from a comma-separated string, for functions without a known signature"""
+        parsed_args = []
+        for arg in arguments.split(','):
+            arg = arg.strip()
+            # Try to determine argument type
+            if arg.lower() in ['true', 'false']:
+                parsed_args.append(arg.lower() == 'true')
+            elif arg.isdigit():
+                parsed_args.append(int(arg))
+            elif arg.replace('.', '', 1).isdigit():
+                parsed_args.append(float(arg))
+            else:
+                parsed_args.append(arg)
+        return parsed_args
+
+    @staticmethod
+    def _call_blueprint(function, converters, arguments):
+        """Call a bound Blueprint function with a list or comma-separated string of arguments"""
+        if not arguments:
+            arguments = []
+        elif isinstance(arguments, str):
+            if converters is None:
+                return function(*MCPUnrealBridge._parse_blueprint_arguments(arguments))
+            arguments = [arg.strip() for arg in arguments.split(',')]
+
+        if converters is not None:
+            if len(arguments) > len(converters):
+                raise TypeError(f"Expected at most {len(converters)} arguments, got {len(arguments)}")
+            arguments = [convert(arg) for convert, arg in zip(converters, arguments)]
+        return function(*arguments)
 
     @staticmethod
     def execute_blueprint_function(blueprint_name, function_name, arguments = ""):
         """Execute a function in a Blueprint"""
         try:
-            # Find the Blueprint asset
-            blueprint_asset = unreal.find_asset(blueprint_name)
-            if not blueprint_asset:
-                return json.dumps({
-                    "status": "error",
-                    "message" : f"Blueprint '{blueprint_name}' not found"
-                })
-
-            # Get the blueprint class
-            blueprint_class = unreal.load_class(blueprint_asset)
-            if not blueprint_class:
-                return json.dumps({
-                    "status": "error",
-                    "message": f"Could not load class from Blueprint '{blueprint_name}'"
-                })
-
-            # Get the CDO(Class Default Object)
-            cdo = unreal.get_default_object(blueprint_class)
-
-            # Parse arguments
-            parsed_args = []
-            if arguments:
-                for arg in arguments.split(','):
-                    arg = arg.strip()
-                    # Try to determine argument type
-                    if arg.lower() in ['true', 'false']:
-                        parsed_args.append(arg.lower() == 'true')
-                    elif arg.isdigit():
-                        parsed_args.append(int(arg))
-                    elif arg.replace('.', '', 1).isdigit():
-                        parsed_args.append(float(arg))
-                    else:
-                        parsed_args.append(arg)
+            try:
+                function, converters, _ = MCPUnrealBridge._get_blueprint_callable(blueprint_name, function_name)
+            except LookupError as e:
+                return to_json({ "status": "error", "message" : str(e) })
 
             # Call the function
-            result = getattr(cdo, function_name)(*parsed_args)
-            return json.dumps({
+            result = MCPUnrealBridge._call_blueprint(function, converters, arguments)
+            return to_json({
                 "status": "success",
                 "result" : f"Function '{function_name}' executed. Result: {result}"
             })
         except Exception as e:
-            return json.dumps({ "status": "error", "message": str(e) })
+            return to_json({ "status": "error", "message": str(e) })
+
+    @staticmethod
+    def execute_blueprint_function_batch(blueprint_name, function_name, argument_list):
+        """Call a Blueprint function once per argument list, returning a result or error for each call"""
+        try:
+            if isinstance(argument_list, str):
+                argument_list = json.loads(argument_list)
+
+            function, converters, _ = MCPUnrealBridge._get_blueprint_callable(blueprint_name, function_name)
+
+            results = []
+            for arguments in argument_list:
+                try:
+                    results.append({"result": MCPUnrealBridge._call_blueprint(function, converters, arguments)})
+                except Exception as e:
+                    results.append({"error": str(e)})
+
+            return to_json({ "status": "success", "result": results })
+        except Exception as e:
+            return to_json({ "status": "error", "message": str(e) })
 
     @staticmethod
     def execute_python(code):
@@ -1250,13 +1599,13 @@ class MCPUnrealBridge:
                 code_obj = compile(replaced, '<string>', 'exec')
                 
             except SyntaxError as se:
-                return json.dumps({
+                return to_json({
                     "status": "error",
                     "message" : f"Syntax Error executing Python code: {str(se)}",
                     "traceback" : traceback.format_exc()
                 })
             except Exception as ex:
-                return json.dumps({
+                return to_json({
                     "status": "error",
                     "message" : f"Error executing Python code: {str(ex)}",
                     "traceback" : traceback.format_exc()
@@ -1283,14 +1632,14 @@ class MCPUnrealBridge:
                 exec(code_obj, globals(), locals_dict)
 
             except AttributeError as ae:
-                return json.dumps({
+                return to_json({
                     "status": "error",
                     "message" : f"Attribute Error in code: {str(ae)}",
                     "traceback" : traceback.format_exc()
                 })
 
             except Exception as ee:
-                return json.dumps({
+                return to_json({
                     "status": "error",
                     "message" : f"Python exec() error: {str(ee)}",
                     "traceback" : traceback.format_exc()
@@ -1318,22 +1667,22 @@ class MCPUnrealBridge:
 
             # Return the result if it was set
             if 'result' in locals_dict and locals_dict['result'] is not None:
-                return json.dumps({
+                return to_json({
                     "status": "success",
-                    "result" : str(locals_dict['result'])
+                    "result" : locals_dict['result']
                 })
             elif error_text and len(error_text) > 0:
-                return json.dumps({
+                return to_json({
                     "status": "error",
                     "result": error_text
                 })
             elif not result:
-                return json.dumps({
+                return to_json({
                     "status": "error",
                     "result": "Python code did not execute Successfully. No result set."
                 })
             else:
-                return json.dumps({
+                return to_json({
                     "status": "success",
                     "result": str(result)
                 })
@@ -1346,7 +1695,7 @@ class MCPUnrealBridge:
             if read_error:
                 error_msg = read_error.read()
                 read_error.close()
-            return json.dumps({
+            return to_json({
                 "status": "error",
                 "message" : f"Python exec() error: {error_msg}",
                 "traceback" : traceback.format_exc()
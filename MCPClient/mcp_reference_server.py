@@ -0,0 +1,268 @@
+# mcp_reference_server.py
+# Stand-in for the plugin's socket server, speaking the same envelope without an editor:
+# repr'd JSON responses, negotiate with framing and compression, and streamed results.
+# Like the plugin it serves many clients at once but runs one command (or stream chunk)
+# at a time, as the game thread does. Commands answer from a synthetic level. Used by
+# the benchmarks and for client work away from Unreal:
+#   python MCPClient/mcp_reference_server.py --port 9000 --socket /tmp/unreal_mcp.sock
+import argparse
+import json
+import os
+import select
+import socket
+import socketserver
+import struct
+import threading
+import time
+import zlib
+from itertools import islice
+
+try:
+    import lz4.block
+except ImportError:
+    lz4 = None
+
+FRAME_HEADER = struct.Struct('!BII')
+FRAME_NONE, FRAME_ZLIB, FRAME_LZ4 = 0, 1, 2
+
+# Items per streamed chunk, as in the bridge
+STREAM_CHUNK_ITEMS = 500
+
+
+class ReferenceLevel:
+    """Synthetic level the stand-in commands answer from"""
+
+    def __init__(self, actor_count):
+        self.actors = [{
+            "name": f"StaticMeshActor_{i}",
+            "class": "StaticMeshActor",
+            "location": [float(i % 100) * 200.0, float(i // 100) * 200.0, 0.0]
+        } for i in range(actor_count)]
+        self.assets = [f"/Game/Props/SM_Prop_{i}" for i in range(actor_count)]
+
+    def ping(self):
+        return {"level_version": 0, "asset_version": 0}
+
+    def get_project_dir(self):
+        return os.getcwd()
+
+    def get_actor_stats(self):
+        by_class = {}
+        for actor in self.actors:
+            by_class[actor["class"]] = by_class.get(actor["class"], 0) + 1
+        return {"level": "ReferenceLevel", "level_version": 0, "total": len(self.actors), "by_class": by_class}
+
+    def get_actors(self):
+        return iter(self.actors)
+
+    def find_assets(self, asset_name):
+        asset_name = asset_name.lower()
+        return (path for path in self.assets if asset_name in path.rsplit('/', 1)[-1].lower())
+
+    def find_basic_shapes(self):
+        return iter(["/Engine/BasicShapes/Cube", "/Engine/BasicShapes/Sphere", "/Engine/BasicShapes/Cylinder"])
+
+
+class MessageBuffer:
+    """Splits the bytes a client sends into whole JSON messages, as FMCPMessageBuffer does in the plugin"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offset = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def append(self, data):
+        self.data += data
+
+    def __iter__(self):
+        """Take every message that has fully arrived, anything that can't start a JSON object goes out as it is"""
+        while True:
+            end = None
+            data = self.data
+            while self.offset < len(data):
+                byte = data[self.offset]
+                self.offset += 1
+                if self.in_string:
+                    if self.escaped:
+                        self.escaped = False
+                    elif byte == 0x5C:  # backslash
+                        self.escaped = True
+                    elif byte == 0x22:  # quote
+                        self.in_string = False
+                elif self.depth == 0 and byte != 0x7B:  # {
+                    if byte not in b" \t\r\n":
+                        end = len(data)
+                        break
+                elif byte == 0x22:
+                    self.in_string = True
+                elif byte in b"{[":
+                    self.depth += 1
+                elif byte in b"}]":
+                    self.depth -= 1
+                    if self.depth == 0:
+                        end = self.offset
+                        break
+            if end is None:
+                return
+            message = bytes(data[:end])
+            del data[:end]
+            self.offset = self.depth = 0
+            self.in_string = self.escaped = False
+            yield message.decode('utf-8', 'replace')
+
+
+class ReferenceHandler(socketserver.BaseRequestHandler):
+    """One client connection, handled like FMCPSocketServer handles one"""
+
+    def setup(self):
+        self.framed = False
+        self.compression = None
+        self.min_size = 0
+
+    def handle(self):
+        received = MessageBuffer()
+        while True:
+            if self.server.poll_interval:
+                # How the plugin used to wait: check for data, sleep, check again
+                while not select.select([self.request], [], [], 0)[0]:
+                    time.sleep(self.server.poll_interval)
+            data = self.request.recv(65536)
+            if not data:
+                return
+            # Requests can take several reads, and one read can hold several requests
+            received.append(data)
+            for text in received:
+                try:
+                    message = json.loads(text)
+                except json.JSONDecodeError:
+                    message = None
+                if isinstance(message, dict):
+                    self.process(message)
+                else:
+                    self.send_response({"status": "error", "message": "Invalid JSON format"})
+
+    def process(self, message):
+        command = message.get("command")
+        params = message.get("params") or {}
+
+        if command == "negotiate":
+            self.negotiate(params)
+        elif message.get("stream"):
+            self.stream(command, params)
+        else:
+            self.send_response(self.run(command, params, list))
+
+    def negotiate(self, params):
+        for name in params.get("compression", []):
+            if name == "zlib" or (name == "lz4" and lz4 is not None):
+                self.compression = name
+                break
+        self.min_size = int(params.get("min_size", 4096))
+        self.request.sendall(json.dumps({"status": "success", "result": {
+            "compression": self.compression or "none", "min_size": self.min_size}}).encode('utf-8'))
+        self.framed = True
+
+    def run(self, command, params, collect):
+        """Response dict of a command, its items gathered with collect"""
+        handler = getattr(self.server.level, command, None)
+        if handler is None or command.startswith('_'):
+            return {"status": "error", "message": f"Unknown command '{command}'"}
+        try:
+            with self.server.executor:
+                result = handler(**params)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+        if isinstance(result, (str, dict)):
+            return {"status": "success", "result": result}
+        return {"status": "success", "result": collect(result)}
+
+    def stream(self, command, params):
+        response = self.run(command, params, lambda items: items)
+        if response["status"] != "success":
+            self.send_response(response)
+            return
+        items = response["result"]
+        while True:
+            # Each chunk is its own game thread call in the plugin, so other clients get turns in between
+            with self.server.executor:
+                chunk = list(islice(items, STREAM_CHUNK_ITEMS))
+            done = len(chunk) < STREAM_CHUNK_ITEMS
+            self.send_response({"done": done, "status": "success", "result": chunk}, chunk=True)
+            if done:
+                return
+
+    def send_response(self, response, chunk=False):
+        # The editor hands back the repr of the JSON string the bridge returns
+        data = repr(json.dumps(response, separators=(',', ':'))).encode('utf-8')
+        if not self.framed:
+            self.request.sendall(data + b"\n" if chunk else data)
+            return
+
+        codec, payload = FRAME_NONE, data
+        if self.compression and len(data) >= self.min_size:
+            packed = zlib.compress(data, 1) if self.compression == "zlib" else lz4.block.compress(data, store_size=False)
+            if len(packed) < len(data):
+                codec, payload = (FRAME_ZLIB if self.compression == "zlib" else FRAME_LZ4), packed
+        self.request.sendall(FRAME_HEADER.pack(codec, len(payload), len(data)) + payload)
+
+
+class ReferenceTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socket, 'AF_UNIX'):
+    class ReferenceUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+def serve(host='127.0.0.1', port=9000, socket_path=None, actors=1000, poll_interval=0):
+    """
+    Start the listeners on background threads and return them. With a poll interval, clients are
+    polled with sleeps in between as the plugin used to, instead of blocking until data arrives.
+    """
+    level = ReferenceLevel(actors)
+    # Stands in for the game thread, which every listener's clients share
+    executor = threading.Lock()
+    servers = []
+    if port is not None:
+        servers.append(ReferenceTCPServer((host, port), ReferenceHandler))
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        servers.append(ReferenceUnixServer(socket_path, ReferenceHandler))
+    for server in servers:
+        server.level = level
+        server.executor = executor
+        server.poll_interval = poll_interval
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return servers
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9000)
+    parser.add_argument('--socket', default=os.environ.get("UNREAL_MCP_SOCKET"), help="Unix domain socket path to listen on as well")
+    parser.add_argument('--actors', type=int, default=1000)
+    parser.add_argument('--poll-interval', type=float, default=0, help="Poll clients with this many seconds of sleep in between, as the plugin used to")
+    args = parser.parse_args()
+
+    servers = serve(args.host, args.port, args.socket, args.actors, args.poll_interval)
+    print(f"Reference server listening on {args.host}:{args.port}" + (f" and {args.socket}" if args.socket else ""), flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == '__main__':
+    main()
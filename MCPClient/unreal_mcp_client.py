@@ -2,16 +2,32 @@
 import socket
 import json
 import re
+import os
+import sys
+import struct
+import zlib
+import random
+import threading
+import time
+import queue
+import concurrent.futures
+from collections import OrderedDict
 from mcp.server.fastmcp import FastMCP, Context
 
 # Add a startup handler to connect to Unreal
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from collections.abc import AsyncIterator
 
+try:
+    import lz4.block
+except ImportError:
+    lz4 = None
+
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[str]:
     """Connect to Unreal Engine when the MCP server starts"""
     connected = connect_to_unreal()
+    start_heartbeat()
     if connected:
         yield "Connected to Unreal Engine"
     else:
@@ -23,44 +39,259 @@ mcp = FastMCP("Unreal Engine", lifespan=app_lifespan)
 # Configure socket connection
 HOST = '127.0.0.1'
 PORT = 9000
-socket_client = None
 
-# Connect to the Unreal Engine socket server
-def connect_to_unreal():
-    global socket_client
-    try:
-        socket_client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        socket_client.connect((HOST, PORT))
-        print(f"Connected to Unreal Engine on {HOST}:{PORT}")
-        return True
-    except Exception as e:
-        print(f"Failed to connect to Unreal Engine: {e}")
-        socket_client = None
+# Unix domain socket of an editor on the same Linux host, set from UNREAL_MCP_SOCKET to skip TCP loopback.
+# The plugin listens on it when the editor is started with the same variable.
+SOCKET_PATH = os.environ.get("UNREAL_MCP_SOCKET", "")
+
+# Compression formats to negotiate, in order of preference (e.g. "lz4,zlib"), for editors reached
+# through an SSH tunnel. Responses smaller than the minimum size are sent as is. Empty keeps the
+# plain protocol, which is the cheapest option on a local loopback connection.
+COMPRESSION = [name for name in os.environ.get("UNREAL_MCP_COMPRESSION", "").split(",")
+               if name == "zlib" or (name == "lz4" and lz4 is not None)]
+COMPRESSION_MIN_SIZE = int(os.environ.get("UNREAL_MCP_COMPRESSION_MIN_SIZE", "4096"))
+
+# Frame header: codec, payload size, uncompressed size
+FRAME_HEADER = struct.Struct('!BII')
+FRAME_NONE, FRAME_ZLIB, FRAME_LZ4 = 0, 1, 2
+
+# Reconnecting backs off exponentially with full jitter, so restarting editors aren't hit by every client at once
+RECONNECT_ATTEMPTS = 5
+RECONNECT_BASE_DELAY = 0.25
+RECONNECT_MAX_DELAY = 5.0
+
+# Commands that only read, which are safe to send again after a lost connection. Anything else may
+# have run before the connection dropped, so it is reported instead of replayed.
+READ_ONLY_COMMANDS = {
+    "ping", "get_actors", "get_changes_since", "get_actor_stats", "query_radius", "query_box",
+    "nearest_k", "find_free_placement", "get_actor_details", "get_selected_actors", "get_project_dir",
+    "get_content_dir", "find_basic_shapes", "find_assets", "get_asset", "prefetch_assets", "server_stats"
+}
+
+# Connections kept open to each editor, so tool calls made in parallel don't queue behind each other's
+# socket. The plugin still runs their commands one at a time on the game thread, but streams interleave.
+POOL_SIZE = max(1, int(os.environ.get("UNREAL_MCP_POOL_SIZE", "4")))
+
+# Seconds a connection may sit idle before a heartbeat ping checks it, and how long to wait for the reply.
+# The plugin answers pings on the game thread, so a ping that takes longer only means the editor is busy
+# (often with a long command on another pooled connection); its reply is read before the next command.
+HEARTBEAT_INTERVAL = float(os.environ.get("UNREAL_MCP_HEARTBEAT", "15"))
+HEARTBEAT_TIMEOUT = 10.0
+
+# Seconds the results of rarely changing read commands are cached for, and the editor versions (from
+# ping) they depend on. A result is dropped when its time runs out or one of its versions changes;
+# commands that may write also drop the results depending on assets.
+CACHE_TTLS = {
+    "get_project_dir": (3600.0, ()),
+    "get_content_dir": (3600.0, ()),
+    "find_basic_shapes": (600.0, ("asset_version",)),
+    "find_assets": (60.0, ("asset_version",)),
+    "get_asset": (300.0, ("asset_version",))
+}
+# Most results cached across all editors, 0 turns the cache off
+CACHE_SIZE = int(os.environ.get("UNREAL_MCP_CACHE_SIZE", "256"))
+# Seconds versions from the last ping are trusted for. Heartbeats only ping idle connections, so while the
+# bridge is in use a cached result is only served after a fresh ping shows its versions still hold.
+CACHE_VERSIONS_MAX_AGE = 2.0
+
+def is_retryable(command, params):
+    """Whether a command can be sent again without risking doing its work twice"""
+    return command in READ_ONLY_COMMANDS or bool((params or {}).get("dry_run"))
+
+def _decode_response(data):
+    """Parse one response as the bridge sends it, the repr of a JSON string"""
+    stripped = data.decode('utf-8', 'replace').strip('\'"\n\r')
+    return json.loads(stripped.replace('\\\'', ''))
+
+class UnrealConnection:
+    """Connection to one editor, at host:port or, for an address starting with "/", a Unix domain socket"""
+
+    def __init__(self, name, address):
+        self.name = name
+        self.address = address
+        self.socket = None
+        # Whether the connection negotiated framed responses
+        self.framed = False
+        # One command at a time per connection, the heartbeat takes it too
+        self.lock = threading.RLock()
+        # When the connection was last used, so the heartbeat only pings idle ones
+        self.last_used = time.monotonic()
+        # Level and asset versions from the last ping, and when it answered
+        self.versions = {}
+        self.versions_checked = 0.0
+        # Whether a heartbeat ping timed out and its reply is still to be read
+        self.ping_pending = False
+
+    def connect(self):
+        # Never leak the socket of a dropped connection
+        self.close()
+        try:
+            if self.address.startswith("/"):
+                self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.socket.connect(self.address)
+            else:
+                host, port = self.address.rsplit(":", 1)
+                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.socket.connect((host, int(port)))
+            self.framed = False
+            self.ping_pending = False
+            print(f"Connected to Unreal Engine '{self.name}' on {self.address}")
+            if COMPRESSION:
+                self.negotiate_compression()
+            return True
+        except Exception as e:
+            print(f"Failed to connect to Unreal Engine '{self.name}' on {self.address}: {e}")
+            self.socket = None
+            return False
+
+    def close(self):
+        if self.socket is not None:
+            try:
+                self.socket.close()
+            except OSError:
+                pass
+            self.socket = None
+
+    def reconnect(self):
+        """Connect, retrying with exponential backoff and full jitter"""
+        for attempt in range(RECONNECT_ATTEMPTS):
+            if attempt:
+                time.sleep(random.uniform(0, min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** (attempt - 1))))
+            if self.connect():
+                return True
         return False
 
-# Send a command to Unreal Engine and get the response
-def send_command(command, params=None):
+    def heartbeat(self):
+        """Ping the editor if the connection has been idle, dropping it if the connection fails"""
+        if self.socket is None or time.monotonic() - self.last_used < HEARTBEAT_INTERVAL:
+            return
+        # A busy connection is evidently alive
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            self.socket.settimeout(HEARTBEAT_TIMEOUT)
+            # After a ping timed out, wait some more for its reply instead of sending another
+            if not self.ping_pending:
+                self.socket.sendall(json.dumps({"command": "ping", "params": {}}).encode('utf-8'))
+                self.ping_pending = True
+            response = self._read_ping()
+            if response.get("status") != "success":
+                self.close()
+        except socket.timeout:
+            # The game thread is busy, the reply is still to come
+            self.last_used = time.monotonic()
+        except Exception as e:
+            # stdout carries the stdio MCP transport, so this goes to stderr
+            print(f"Heartbeat to Unreal Engine '{self.name}' failed: {e}", file=sys.stderr)
+            self.close()
+        finally:
+            if self.socket is not None:
+                self.socket.settimeout(None)
+            self.lock.release()
+
+    def _read_ping(self):
+        """Read the reply to the outstanding heartbeat ping and take the versions it reports"""
+        response = self._read_response()
+        self.ping_pending = False
+        if response.get("status") == "success":
+            self.versions = response["result"]
+            self.last_used = self.versions_checked = time.monotonic()
+        return response
+
+    def negotiate_compression(self):
+        """Switch the connection to framed, compressed responses, if the plugin supports it"""
+        self.socket.sendall(json.dumps({
+            "command": "negotiate",
+            "params": {"compression": COMPRESSION, "min_size": COMPRESSION_MIN_SIZE}
+        }).encode('utf-8'))
+        reply = _decode_response(self.socket.recv(16384))
+
+        # Older plugins pass negotiate on to Python, which answers with an error
+        self.framed = reply.get("status") == "success"
+        if self.framed:
+            print(f"... compression {reply['result']['compression']} above {reply['result']['min_size']} bytes")
+
+    def _recv_exact(self, size):
+        data = bytearray()
+        while len(data) < size:
+            chunk = self.socket.recv(min(size - len(data), 1 << 20))
+            if not chunk:
+                raise ConnectionError("Unreal Engine closed the connection")
+            data += chunk
+        return bytes(data)
+
+    def _recv_frame(self):
+        """Read one framed response and decompress it"""
+        codec, size, raw_size = FRAME_HEADER.unpack(self._recv_exact(FRAME_HEADER.size))
+        payload = self._recv_exact(size)
+        if codec == FRAME_ZLIB:
+            return zlib.decompress(payload)
+        if codec == FRAME_LZ4:
+            return lz4.block.decompress(payload, uncompressed_size=raw_size)
+        return payload
+
+    def check_versions(self):
+        """Ping for the editor's current level and asset versions, empty if the ping failed"""
+        response = self.send_command("ping")
+        if response.get("status") != "success":
+            return {}
+        self.versions = response["result"]
+        self.versions_checked = time.monotonic()
+        return self.versions
+
+    # Send a command to Unreal Engine and get the response
+    def send_command(self, command, params=None, profile=None):
+
+        if params is None:
+            params = {}
+        
+        message = {
+            "command": command,
+            "params": params
+        }
+        # Run under a profiler in the editor: true, or options such as {"top": 20, "sampler": true, "save": true}
+        if profile:
+            message["profile"] = profile
+
+        with self.lock:
+            for attempt in range(2 if is_retryable(command, params) else 1):
+                if self.socket is None and not self.reconnect():
+                    return {"status": "error", "message": f"Not connected to Unreal Engine '{self.name}'"}
+                try:
+                    return self._exchange(message)
+                except Exception as e:
+                    print(f"Error sending command to Unreal: {e}")
+                    self.close()
+                    error = e
+
+            if not is_retryable(command, params):
+                return {"status": "error", "message": f"Connection to Unreal Engine '{self.name}' lost during {command}, "
+                                                      f"it may or may not have run, not retrying: {error}"}
+            return {"status": "error", "message": f"Communication error: {error}"}
+
+    def _exchange(self, message):
+        """Send a message and read its response"""
+        # A ping the editor was too busy to answer in time is answered first
+        if self.ping_pending:
+            self._read_ping()
 
-    if socket_client is None:
-        if not connect_to_unreal():
-            return {"status": "error", "message": "Not connected to Unreal Engine"}
-    
-    if params is None:
-        params = {}
-    
-    message = {
-        "command": command,
-        "params": params
-    }
-    
-    try:
         # Send the message
-        socket_client.sendall(json.dumps(message).encode('utf-8'))
+        self.socket.sendall(json.dumps(message).encode('utf-8'))
+        self.last_used = time.monotonic()
+        return self._read_response()
+
+    def _read_response(self):
+        """Read one response"""
+        if self.framed:
+            try:
+                return _decode_response(self._recv_frame())
+            except json.JSONDecodeError as je:
+                return {"status": "error", "message": f"Json error: {je}"}
         
         # Receive the response
         response = None
         while True:
-            chunk = socket_client.recv(16384)  # 16KB buffer
+            chunk = self.socket.recv(16384)  # 16KB buffer
             if chunk:
 
                 # Check if we've received a complete JSON object
@@ -93,12 +324,307 @@ def send_command(command, params=None):
         # Send response
         return response
 
-    except Exception as e:
-        print(f"Error sending command to Unreal: {e}")
-        # Try to reconnect
-        if connect_to_unreal():
-            return send_command(command, params)
-        return {"status": "error", "message": f"Communication error: {e}"}
+    def _read_stream(self, message):
+        """Send a streaming command and yield each newline delimited chunk of the reply, up to the last one"""
+        if self.ping_pending:
+            self._read_ping()
+        self.socket.sendall(json.dumps(message).encode('utf-8'))
+        self.last_used = time.monotonic()
+
+        # Framed connections send one frame per chunk instead of a line
+        while self.framed:
+            response = _decode_response(self._recv_frame())
+            yield response
+            if response.get("done") is not False:
+                return
+
+        buffer = b""
+        while True:
+            data = self.socket.recv(65536)
+            if not data:
+                raise ConnectionError("Unreal Engine closed the connection mid stream")
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if not line.strip():
+                    continue
+                response = _decode_response(line)
+                yield response
+                # Only chunks saying done is false have more following, errors end the stream too
+                if response.get("done") is not False:
+                    return
+
+    def stream_command(self, command, params=None):
+        """
+        Send a command in streaming mode and yield its result items as they arrive,
+        so the whole result is never held in memory on either side.
+        Raises RuntimeError with the bridge's message if the command fails.
+        """
+        with self.lock:
+            if self.socket is None and not self.reconnect():
+                raise ConnectionError(f"Not connected to Unreal Engine '{self.name}'")
+
+            chunks = self._read_stream({
+                "command": command,
+                "params": params or {},
+                "stream": True
+            })
+            try:
+                for chunk in chunks:
+                    if chunk.get("status") != "success":
+                        raise RuntimeError(chunk.get("message", "Unknown error"))
+                    yield from chunk.get("result", [])
+            except (OSError, ValueError):
+                # Items may already be out, so a broken stream isn't retried; the next command reconnects
+                self.close()
+                raise
+            finally:
+                # Read an abandoned stream to the end, or its chunks would be taken as the next command's response
+                if self.socket is not None:
+                    try:
+                        for _ in chunks:
+                            pass
+                    except (OSError, ValueError):
+                        self.close()
+
+class ConnectionPool:
+    """Up to POOL_SIZE connections to one editor, opened as parallel calls need them"""
+
+    def __init__(self, name, address, size=POOL_SIZE):
+        self.name = name
+        self.address = address
+        self.connections = [UnrealConnection(name, address) for _ in range(size)]
+        # Last in, first out, so a lone caller keeps reusing the same warm connection
+        self.idle = queue.LifoQueue()
+        for connection in reversed(self.connections):
+            self.idle.put(connection)
+
+    @property
+    def connected(self):
+        return any(connection.socket is not None for connection in self.connections)
+
+    def current_versions(self, max_age=None):
+        """Level and asset versions from the latest ping, pinging again if it is older than max_age seconds"""
+        if max_age is None:
+            max_age = CACHE_VERSIONS_MAX_AGE
+        latest = max(self.connections, key=lambda connection: connection.versions_checked)
+        if time.monotonic() - latest.versions_checked <= max_age:
+            return latest.versions
+        with self.acquire() as connection:
+            return connection.check_versions()
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection, waiting if every one is in use"""
+        connection = self.idle.get()
+        try:
+            yield connection
+        finally:
+            self.idle.put(connection)
+
+    def connect(self):
+        """Open the first connection, the others open when they are first needed"""
+        return self.connections[0].connect()
+
+    def close(self):
+        for connection in self.connections:
+            connection.close()
+
+    def heartbeat(self):
+        for connection in self.connections:
+            connection.heartbeat()
+
+    def send_command(self, command, params=None, profile=None):
+        with self.acquire() as connection:
+            return connection.send_command(command, params, profile)
+
+    def stream_command(self, command, params=None):
+        # The connection stays borrowed until the stream is read to the end or abandoned
+        with self.acquire() as connection:
+            yield from connection.stream_command(command, params)
+
+class ResponseCache:
+    """Least recently used cache of read command results per editor, with a time to live per command and hit counters"""
+
+    def __init__(self, ttls, size):
+        self.ttls = ttls
+        self.size = size
+        # (target, command, params, streamed) -> (expiry, versions the result depends on, result)
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = {command: {"hits": 0, "misses": 0, "expired": 0, "invalidated": 0} for command in ttls}
+
+    def cacheable(self, command):
+        return self.size > 0 and command in self.ttls
+
+    @staticmethod
+    def _key(target, command, params, streamed):
+        return target, command, json.dumps(params or {}, sort_keys=True), streamed
+
+    def get(self, target, command, params, streamed, versions):
+        """Cached result, or None if there is none still valid against the editor's current versions"""
+        key = self._key(target, command, params, streamed)
+        with self.lock:
+            counters = self.counters[command]
+            entry = self.entries.get(key)
+            if entry is None:
+                counters["misses"] += 1
+                return None
+
+            expiry, stored_versions, result = entry
+            if time.monotonic() >= expiry:
+                reason = "expired"
+            elif any(versions.get(name) != stored_versions[name] for name in stored_versions):
+                reason = "invalidated"
+            else:
+                counters["hits"] += 1
+                self.entries.move_to_end(key)
+                return result
+
+            del self.entries[key]
+            counters[reason] += 1
+            counters["misses"] += 1
+            return None
+
+    def put(self, target, command, params, streamed, versions, result):
+        ttl, depends_on = self.ttls[command]
+        key = self._key(target, command, params, streamed)
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl, {name: versions.get(name) for name in depends_on}, result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, target=None, command=None, depends_on=None):
+        """Drop the results for a target and/or command, or those depending on a version, returning how many went"""
+        with self.lock:
+            dropped = [key for key, (_, stored_versions, _) in self.entries.items()
+                       if (target is None or key[0] == target) and (command is None or key[1] == command)
+                       and (depends_on is None or depends_on in stored_versions)]
+            for key in dropped:
+                del self.entries[key]
+                self.counters[key[1]]["invalidated"] += 1
+            return len(dropped)
+
+    def stats(self):
+        with self.lock:
+            hits = sum(counters["hits"] for counters in self.counters.values())
+            misses = sum(counters["misses"] for counters in self.counters.values())
+            return {
+                "entries": len(self.entries),
+                "size": self.size,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "commands": {command: dict(counters) for command, counters in self.counters.items()}
+            }
+
+def _parse_endpoints(value):
+    """Named endpoints from "name=host:port,name=/path/to.sock", in order"""
+    endpoints = {}
+    for entry in value.split(","):
+        if "=" in entry:
+            name, address = entry.split("=", 1)
+            endpoints[name.strip()] = address.strip()
+    return endpoints
+
+# Named editors to route commands to, from UNREAL_MCP_ENDPOINTS, e.g. "town=127.0.0.1:9000,dungeon=127.0.0.1:9001".
+# The first one is the default target. Without it there is one "default" editor at SOCKET_PATH or HOST:PORT.
+ENDPOINTS = _parse_endpoints(os.environ.get("UNREAL_MCP_ENDPOINTS", "")) or {"default": SOCKET_PATH or f"{HOST}:{PORT}"}
+connections = {name: ConnectionPool(name, address) for name, address in ENDPOINTS.items()}
+cache = ResponseCache(CACHE_TTLS, CACHE_SIZE)
+
+def get_connection(target=None):
+    """Connection pool for a target name, the default editor when target is empty"""
+    if not target:
+        return next(iter(connections.values()))
+    if target not in connections:
+        raise KeyError(f"Unknown target '{target}', known targets: {', '.join(connections)}")
+    return connections[target]
+
+# Connect to the Unreal Engine socket server
+def connect_to_unreal(target=None):
+    """Connect to one editor, or with no target to every registered editor, true if any connected"""
+    if target:
+        return get_connection(target).connect()
+    return any([connection.connect() for connection in connections.values()])
+
+def send_command(command, params=None, target=None, profile=None):
+    """Send a command to one editor, the default one unless a target is named, optionally profiling it there"""
+    try:
+        connection = get_connection(target)
+    except KeyError as e:
+        return {"status": "error", "message": str(e.args[0])}
+
+    # A profiled run has to reach the editor, and its response carries the profile
+    cacheable = cache.cacheable(command) and not profile
+    if cacheable:
+        versions = connection.current_versions()
+        cached = cache.get(connection.name, command, params, False, versions)
+        if cached is not None:
+            return cached
+
+    response = connection.send_command(command, params, profile)
+    if cacheable:
+        if response.get("status") == "success":
+            cache.put(connection.name, command, params, False, versions, response)
+    elif not cache.cacheable(command) and not is_retryable(command, params):
+        # Writes can add or change assets too, e.g. through execute_python
+        cache.invalidate(connection.name, depends_on="asset_version")
+    return response
+
+def stream_command(command, params=None, target=None):
+    """Stream a command's result items from one editor, see UnrealConnection.stream_command"""
+    connection = get_connection(target)
+    if not cache.cacheable(command):
+        return connection.stream_command(command, params)
+    return _cached_stream(connection, command, params)
+
+def _cached_stream(connection, command, params):
+    """Stream from the cache, or from the editor caching the items once the stream has been read to the end"""
+    versions = connection.current_versions()
+    cached = cache.get(connection.name, command, params, True, versions)
+    if cached is not None:
+        yield from cached
+        return
+
+    items = []
+    for item in connection.stream_command(command, params):
+        items.append(item)
+        yield item
+    cache.put(connection.name, command, params, True, versions, items)
+
+def start_heartbeat():
+    """Ping idle editors in the background, so a dead connection is noticed before a command is sent on it"""
+    def run():
+        while True:
+            time.sleep(HEARTBEAT_INTERVAL / 2)
+            for connection in connections.values():
+                connection.heartbeat()
+
+    if HEARTBEAT_INTERVAL > 0:
+        threading.Thread(target=run, name="unreal-heartbeat", daemon=True).start()
+
+def fan_out(command, params=None, targets=None, stream=False):
+    """
+    Send a command to several editors at once (all of them by default), one thread per editor.
+    params may be a function of the target name, to shard work across editors. Returns
+    {target: items} when streaming, {target: response} otherwise; a target that fails maps
+    to an error response either way.
+    """
+    names = targets or list(connections)
+
+    def run(name):
+        try:
+            target_params = params(name) if callable(params) else params
+            if stream:
+                return list(stream_command(command, target_params, name))
+            return send_command(command, target_params, name)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(names)) as pool:
+        return dict(zip(names, pool.map(run, names)))
 
 # Tools
 #@mcp.tool()
@@ -113,31 +639,195 @@ def send_command(command, params=None):
 #        return f"Error: {result.get('message', 'Unknown error')}"
 
 @mcp.tool()
-def get_actors() -> str:
-    """List all actors in the current level"""
+def get_actors(target: str = "") -> str:
+    """
+    List all actors in the current level
+
+    Args:
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
     print(f"get_actors")
-    result = send_command("get_actors")
+    try:
+        response = "# Actors in the current level\n\n"
+        for actor in stream_command("get_actors", target=target):
+            response += f"- {actor.get('name')} ({actor.get('class')})\n"
+            response += f"  Location: {actor.get('location')}\n"
+        
+        return response
+    except Exception as e:
+        return f"get_actors error: {e}"
+
+@mcp.tool()
+def get_changes_since(version: int = 0, target: str = "") -> str:
+    """
+    List the actors added, removed or modified since a level version.
+    Use the version returned by the previous call to poll for further changes.
+
+    Args:
+        version: Level version returned by the last call (0 for everything)
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("get_changes_since", {"version": version}, target=target)
+    if result.get("status") == "success":
+        changes = result.get("result", {})
+
+        response = f"# Level version {changes.get('version')}\n\n"
+        if changes.get("full"):
+            response += "Change history unavailable, full snapshot follows.\n\n"
+            for actor in changes.get("actors", []):
+                response += f"- {actor.get('name')} ({actor.get('class')})\n"
+                response += f"  Location: {actor.get('location')}\n"
+            return response
+
+        for heading in ("added", "modified"):
+            response += f"## {heading.capitalize()}\n"
+            for actor in changes.get(heading, []):
+                response += f"- {actor.get('name')} ({actor.get('class')})\n"
+                response += f"  Location: {actor.get('location')}\n"
+        response += "## Removed\n"
+        for name in changes.get("removed", []):
+            response += f"- {name}\n"
+
+        return response
+    else:
+        return f"Error: {result.get('message', 'Unknown error')}"
+
+@mcp.tool()
+def query_radius(center_x: float, center_y: float, center_z: float, radius: float, target: str = "") -> str:
+    """
+    List the actors whose bounds come within a radius of a point.
+
+    Args:
+        center_x: X coordinate of the point
+        center_y: Y coordinate of the point
+        center_z: Z coordinate of the point
+        radius: Search radius in cm
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("query_radius", {
+        "center_x": center_x,
+        "center_y": center_y,
+        "center_z": center_z,
+        "radius": radius
+    }, target=target)
     if result.get("status") == "success":
         actors = result.get("result", [])
-        
-        response = "# Actors in the current level\n\n"
+
+        response = f"# Actors within {radius} of ({center_x}, {center_y}, {center_z})\n\n"
         for actor in actors:
             response += f"- {actor.get('name')} ({actor.get('class')})\n"
             response += f"  Location: {actor.get('location')}\n"
-        
+
+        return response
+    else:
+        return f"Error: {result.get('message', 'Unknown error')}"
+
+@mcp.tool()
+def query_box(min_x: float, min_y: float, min_z: float, max_x: float, max_y: float, max_z: float, target: str = "") -> str:
+    """
+    List the actors whose bounds overlap an axis aligned box.
+
+    Args:
+        min_x: Minimum X of the box
+        min_y: Minimum Y of the box
+        min_z: Minimum Z of the box
+        max_x: Maximum X of the box
+        max_y: Maximum Y of the box
+        max_z: Maximum Z of the box
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("query_box", {
+        "min_x": min_x,
+        "min_y": min_y,
+        "min_z": min_z,
+        "max_x": max_x,
+        "max_y": max_y,
+        "max_z": max_z
+    }, target=target)
+    if result.get("status") == "success":
+        actors = result.get("result", [])
+
+        response = f"# Actors inside ({min_x}, {min_y}, {min_z}) - ({max_x}, {max_y}, {max_z})\n\n"
+        for actor in actors:
+            response += f"- {actor.get('name')} ({actor.get('class')})\n"
+            response += f"  Location: {actor.get('location')}\n"
+
         return response
     else:
-        return f"get_actors error: " + json.dumps(result) #f"Error: {result.get('message', 'Unknown error')}"
+        return f"Error: {result.get('message', 'Unknown error')}"
 
 @mcp.tool()
-def get_actor_details(actor_name: str) -> str:
+def nearest_k(location_x: float, location_y: float, location_z: float, k: int = 1, target: str = "") -> str:
+    """
+    List the k actors nearest to a point, closest first.
+
+    Args:
+        location_x: X coordinate of the point
+        location_y: Y coordinate of the point
+        location_z: Z coordinate of the point
+        k: Number of actors to return
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("nearest_k", {
+        "location_x": location_x,
+        "location_y": location_y,
+        "location_z": location_z,
+        "k": k
+    }, target=target)
+    if result.get("status") == "success":
+        actors = result.get("result", [])
+
+        response = f"# {k} nearest actors to ({location_x}, {location_y}, {location_z})\n\n"
+        for actor in actors:
+            response += f"- {actor.get('name')} ({actor.get('class')}) at distance {actor.get('distance')}\n"
+            response += f"  Location: {actor.get('location')}\n"
+
+        return response
+    else:
+        return f"Error: {result.get('message', 'Unknown error')}"
+
+@mcp.tool()
+def find_free_placement(footprint_x: float, footprint_y: float, near_x: float, near_y: float, radius: float, near_z: float = 0, height: float = 100, rotation_z: float = 0, target: str = "") -> str:
+    """
+    Find the free spot closest to a point where an object of the given footprint fits without overlapping other actors.
+    Use this before spawn_actor instead of guessing positions in crowded areas.
+
+    Args:
+        footprint_x: Size of the object in the x dimension
+        footprint_y: Size of the object in the y dimension
+        near_x: X coordinate of the preferred position
+        near_y: Y coordinate of the preferred position
+        radius: How far from the preferred position to search
+        near_z: Z coordinate the object will rest on
+        height: Height of the object, actors below near_z or above near_z + height are ignored
+        rotation_z: Rotation of the object around the Z-axis
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("find_free_placement", {
+        "footprint_x": footprint_x,
+        "footprint_y": footprint_y,
+        "near_x": near_x,
+        "near_y": near_y,
+        "radius": radius,
+        "near_z": near_z,
+        "height": height,
+        "rotation_z": rotation_z
+    }, target=target)
+    if result.get("status") == "success":
+        return json.dumps(result.get("result"))
+    else:
+        return json.dumps(result)
+
+@mcp.tool()
+def get_actor_details(actor_name: str, target: str = "") -> str:
     """
     Get details for a specific actor by name.
 
     Args:
         actor_name: Name of the actor to retrieve details
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
-    result = send_command("get_actor_details", {"actor_name": actor_name})
+    result = send_command("get_actor_details", {"actor_name": actor_name}, target=target)
     if result.get("status") == "success":
         actor = result.get("result", {})
         
@@ -150,7 +840,7 @@ def get_actor_details(actor_name: str) -> str:
         return f"Error: {result.get('message', 'Unknown error')}"
 
 @mcp.tool()
-def spawn_actor(asset_path: str, location_x: float = 0, location_y: float = 0, location_z: float = 0, rotation_x: float = 0, rotation_y: float = 0, rotation_z: float = 0, scale_x: float = 0, scale_y: float = 0, scale_z: float = 0) -> str:
+def spawn_actor(asset_path: str, location_x: float = 0, location_y: float = 0, location_z: float = 0, rotation_x: float = 0, rotation_y: float = 0, rotation_z: float = 0, scale_x: float = 0, scale_y: float = 0, scale_z: float = 0, target: str = "") -> str:
     """
     Spawn an actor in the current level.
     
@@ -165,6 +855,7 @@ def spawn_actor(asset_path: str, location_x: float = 0, location_y: float = 0, l
         scale_x: Scale of actor in X-direction
         scale_y: Scale of actor in Y-direction
         scale_z: Scale of actor in Z-direction
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
     result = send_command("spawn_actor", {
         "asset_path": asset_path,
@@ -177,7 +868,7 @@ def spawn_actor(asset_path: str, location_x: float = 0, location_y: float = 0, l
         "scale_x": scale_x,
         "scale_y": scale_y,
         "scale_z": scale_z
-    })
+    }, target=target)
     
     if result.get("status") == "success":
         return result.get("result", "Actor created successfully")
@@ -185,7 +876,7 @@ def spawn_actor(asset_path: str, location_x: float = 0, location_y: float = 0, l
         return f"Error: {result.get('message', 'Unknown error')}"
 
 @mcp.tool()
-def modify_actor(actor_name: str, property_name: str, property_value: str) -> str:
+def modify_actor(actor_name: str, property_name: str, property_value: str, target: str = "") -> str:
     """
     Modify a property of an existing actor.
     
@@ -193,12 +884,13 @@ def modify_actor(actor_name: str, property_name: str, property_value: str) -> st
         actor_name: Name of the actor to modify
         property_name: Name of the property to change
         property_value: New value for the property (will be converted to appropriate type)
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
     result = send_command("modify_actor", {
         "actor_name": actor_name,
         "property_name": property_name,
         "property_value": property_value
-    })
+    }, target=target)
     
     if result.get("status") == "success":
         return result.get("result", "Actor modified successfully")
@@ -206,9 +898,39 @@ def modify_actor(actor_name: str, property_name: str, property_value: str) -> st
         return f"Error: {result.get('message', 'Unknown error')}"
 
 @mcp.tool()
-def get_selected_actors() -> str:
-    """Get the currently selected actors in the editor"""
-    result = send_command("get_selected_actors")
+def modify_actors(targets: list[str] | dict | str, properties: dict, target: str = "") -> str:
+    """
+    Set several properties on many actors in one request, undoable as a single step.
+    Prefer this over repeated modify_actor calls.
+
+    Args:
+        targets: The actors to change: a list of actor names, a filter dictionary as taken by
+            delete_actors (class, label, folder, tag, names, bounds), or "selection" for the selected actors
+        properties: Property names mapped to new values. Vectors and rotators take [x, y, z]
+            (rotators as [roll, pitch, yaw]), transforms take {"location", "rotation", "scale"},
+            colors take [r, g, b, a] or "#RRGGBB", object references take an asset path
+        target: The editor to run on (not an actor), from list_targets (empty for the default editor)
+
+    Returns a result per actor, with per-property errors for the ones that failed.
+    """
+    result = send_command("modify_actors", {
+        "targets": targets,
+        "properties": properties
+    }, target=target)
+    if result.get("status") == "success":
+        return json.dumps(result.get("result"))
+    else:
+        return json.dumps(result)
+
+@mcp.tool()
+def get_selected_actors(target: str = "") -> str:
+    """
+    Get the currently selected actors in the editor
+
+    Args:
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("get_selected_actors", target=target)
     
     if result.get("status") == "success":
         actors = result.get("result", [])
@@ -226,18 +948,19 @@ def get_selected_actors() -> str:
         return f"Error: {result.get('message', 'Unknown error')}"
 
 @mcp.tool()
-def set_material(actor_name: str, material_path: str) -> str:
+def set_material(actor_name: str, material_path: str, target: str = "") -> str:
     """
     Apply a material to a static mesh actor.
     
     Args:
         actor_name: Name of the actor to modify
         material_path: Path to the material asset (e.g., '/Game/Materials/M_Basic')
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
     result = send_command("set_material", {
         "actor_name": actor_name,
         "material_path": material_path
-    })
+    }, target=target)
     
     if result.get("status") == "success":
         return result.get("result", "Material applied successfully")
@@ -245,29 +968,58 @@ def set_material(actor_name: str, material_path: str) -> str:
         return f"Error: {result.get('message', 'Unknown error')}"
 
 @mcp.tool()
-def delete_all_static_mesh_actors() -> str:
-    """Delete all static mesh actors in the scene"""
-    result = send_command("delete_all_static_mesh_actors")
+def delete_actors(actor_filter: dict, target: str = "") -> str:
+    """
+    Delete every actor matching a filter in one step, undoable as a single transaction.
+    All criteria given must match. At least one is required.
+
+    Args:
+        actor_filter: Dictionary with any of:
+            class: Class name, e.g. "StaticMeshActor" or a Blueprint class like "BP_Tree_C"
+            label: Glob pattern on the actor label, e.g. "Forest_Tree_*"
+            folder: Outliner folder, subfolders included
+            tag: Actor tag
+            names: List of actor names
+            bounds: [min_x, min_y, min_z, max_x, max_y, max_z] box the actors overlap
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("delete_actors", {"actor_filter": actor_filter}, target=target)
     if result.get("status") == "success":
-        response = result.get("result")
-        return response
+        return json.dumps(result.get("result"))
     else:
         return json.dumps(result)
 
 @mcp.tool()
-def get_project_dir() -> str:
-    """Get the top level project directory"""
-    result = send_command("get_project_dir")
+def set_materials(targets: list[str] | dict | str, materials: dict, target: str = "") -> str:
+    """
+    Apply materials to many actors at once, for example to re-skin a whole district.
+    Prefer this over repeated set_material calls.
+
+    Args:
+        targets: List of actor names, a filter dictionary as taken by delete_actors
+            (class, label, folder, tag, names, bounds), or "selection" for the selected actors
+        materials: Material slots mapped to material paths. Slots are indices ("0", "1") or slot names.
+            Every mesh component of each actor is updated, instanced meshes included
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("set_materials", {
+        "targets": targets,
+        "materials": materials
+    }, target=target)
     if result.get("status") == "success":
-        response = result.get("result")
-        return response
+        return json.dumps(result.get("result"))
     else:
         return json.dumps(result)
 
 @mcp.tool()
-def get_content_dir() -> str:
-    """Get the content directory"""
-    result = send_command("get_content_dir")
+def delete_all_static_mesh_actors(target: str = "") -> str:
+    """
+    Delete all static mesh actors in the scene
+
+    Args:
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("delete_all_static_mesh_actors", target=target)
     if result.get("status") == "success":
         response = result.get("result")
         return response
@@ -275,43 +1027,166 @@ def get_content_dir() -> str:
         return json.dumps(result)
 
 @mcp.tool()
-def find_basic_shapes():
-    """Search for basic shapes for building"""
-    result = send_command("find_basic_shapes")
+def get_project_dir(target: str = "") -> str:
+    """
+    Get the top level project directory
+
+    Args:
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("get_project_dir", target=target)
     if result.get("status") == "success":
         response = result.get("result")
-        return json.dumps(response)
+        return response
     else:
         return json.dumps(result)
 
 @mcp.tool()
-def find_assets(asset_name: str) -> str:
+def get_content_dir(target: str = "") -> str:
     """
-    Search for specific assets by name, like Floor, Wall, Door.
+    Get the content directory
 
     Args:
-        asset_name: Name of asset file on disk
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
-    result = send_command("find_assets", {
-        "asset_name": asset_name
-    })
+    result = send_command("get_content_dir", target=target)
     if result.get("status") == "success":
         response = result.get("result")
-        return json.dumps(response)
+        return response
     else:
         return json.dumps(result)
 
 @mcp.tool()
-def get_asset(asset_path: str) -> str:
+def find_basic_shapes(target: str = ""):
+    """
+    Search for basic shapes for building
+
+    Args:
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    try:
+        return json.dumps(list(stream_command("find_basic_shapes", target=target)))
+    except Exception as e:
+        return json.dumps({"status": "error", "message": str(e)})
+
+@mcp.tool()
+def list_targets() -> str:
+    """List the editors commands can be sent to with a target, the first one being the default"""
+    return json.dumps([
+        {"target": name, "address": connection.address, "connected": connection.connected}
+        for name, connection in connections.items()
+    ])
+
+@mcp.tool()
+def get_actor_stats(target: str = "", all_targets: bool = False) -> str:
+    """
+    Count the actors in the current level by class.
+
+    Args:
+        target: Editor to run on, from list_targets (empty for the default editor)
+        all_targets: Ask every editor at once and add up their counts, keeping each editor's stats too
+    """
+    if not all_targets:
+        result = send_command("get_actor_stats", target=target)
+        if result.get("status") == "success":
+            return json.dumps(result.get("result"))
+        return json.dumps(result)
+
+    merged = {"total": 0, "by_class": {}, "targets": {}}
+    for name, result in fan_out("get_actor_stats").items():
+        if result.get("status") != "success":
+            merged["targets"][name] = {"error": result.get("message", "Unknown error")}
+            continue
+        stats = result["result"]
+        merged["targets"][name] = stats
+        merged["total"] += stats["total"]
+        for class_name, count in stats["by_class"].items():
+            merged["by_class"][class_name] = merged["by_class"].get(class_name, 0) + count
+    return json.dumps(merged)
+
+@mcp.tool()
+def get_server_stats(target: str = "") -> str:
+    """
+    Get the plugin's scheduling metrics: connected clients, and per command class (interactive, write,
+    code, bulk, highest priority first) the commands waiting, in progress and started, and how many
+    had to wait for the class's concurrency or rate limit.
+
+    Args:
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("server_stats", target=target)
+    if result.get("status") == "success":
+        return json.dumps(result.get("result"))
+    return json.dumps(result)
+
+@mcp.tool()
+def get_cache_stats() -> str:
+    """
+    Get the client's cache of rarely changing results (project and content directories, basic shapes,
+    asset searches and asset dimensions): entries, hit rate, and per command hits, misses and how many
+    results expired or were invalidated by editor changes.
+    """
+    return json.dumps(cache.stats())
+
+@mcp.tool()
+def clear_cache(command: str = "", target: str = "") -> str:
+    """
+    Drop cached results, for example after changing assets outside the editor.
+
+    Args:
+        command: Only drop this command's results (empty for every command)
+        target: Only drop results from this editor, from list_targets (empty for every editor)
+    """
+    try:
+        target_name = get_connection(target).name if target else None
+    except KeyError as e:
+        return json.dumps({"status": "error", "message": str(e.args[0])})
+    return json.dumps({"status": "success", "result": {"dropped": cache.invalidate(target_name, command or None)}})
+
+@mcp.tool()
+def find_assets(asset_name: str, target: str = "", all_targets: bool = False) -> str:
+    """
+    Search for specific assets by name, like Floor, Wall, Door.
+
+    Args:
+        asset_name: Name of asset file on disk
+        target: Editor to run on, from list_targets (empty for the default editor)
+        all_targets: Search every editor at once, listing each asset once with the editors that have it
+    """
+    if all_targets:
+        found = {}
+        errors = {}
+        for name, asset_paths in fan_out("find_assets", {"asset_name": asset_name}, stream=True).items():
+            if isinstance(asset_paths, dict):
+                errors[name] = asset_paths.get("message", "Unknown error")
+                continue
+            for asset_path in asset_paths:
+                found.setdefault(asset_path, []).append(name)
+        return json.dumps({"assets": found, "errors": errors})
+
+    try:
+        asset_paths = list(stream_command("find_assets", {
+            "asset_name": asset_name
+        }, target=target))
+    except Exception as e:
+        return json.dumps({"status": "error", "message": str(e)})
+
+    if not asset_paths:
+        return json.dumps({"status": "error", "message": f"Could not find {asset_name} asset."})
+    return json.dumps(asset_paths)
+
+@mcp.tool()
+def get_asset(asset_path: str, target: str = "") -> str:
     """
     Get the dimensions of an asset.
     
     Args:
         asset_path: Path to the asset on disk
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
     result = send_command("get_asset", {
         "asset_path": asset_path
-    })
+    }, target=target)
     if result.get("status") == "success":
         response = result.get("result")
         return json.dumps(response)
@@ -319,7 +1194,23 @@ def get_asset(asset_path: str) -> str:
         return json.dumps(result)
 
 @mcp.tool()
-def create_grid(asset_path: str, grid_width: int, grid_length: int) -> str:
+def prefetch_assets(asset_paths: list[str], target: str = "") -> str:
+    """
+    Start loading assets in the background, so the spawns and material changes that use them
+    don't wait on cold loads one by one. Call this before a batch of spawn_actor or set_material calls.
+
+    Args:
+        asset_paths: Paths of the assets to load, e.g. "/Game/Props/Barrel.Barrel"
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("prefetch_assets", {"asset_paths": asset_paths}, target=target)
+    if result.get("status") == "success":
+        return json.dumps(result.get("result"))
+    else:
+        return json.dumps(result)
+
+@mcp.tool()
+def create_grid(asset_path: str, grid_width: int, grid_length: int, seed: int | None = None, dry_run: bool = False, background: bool = False, target: str = "") -> str:
     """
     Create a grid evenly spaced with the provided asset.
     
@@ -327,12 +1218,22 @@ def create_grid(asset_path: str, grid_width: int, grid_length: int) -> str:
         asset_path: Path to the tile asset on disk
         grid_width: Number of tiles in the x dimension
         grid_length: Number of tiles in the y dimension
+        seed: Optional seed, reported back for consistency with the other procedural tools
+        dry_run: Return the planned placements and phase timings without spawning anything
+        background: Plan off the game thread and return a job id, poll it with get_layout_job
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
-    result = send_command("create_grid", {
+    params = {
         "asset_path": asset_path,
         "grid_width": grid_width,
-        "grid_length": grid_length
-    })
+        "grid_length": grid_length,
+        "dry_run": dry_run,
+        "background": background
+    }
+    if seed is not None:
+        params["seed"] = seed
+
+    result = send_command("create_grid", params, target=target)
     if result.get("status") == "success":
         response = result.get("result")
         return json.dumps(response)
@@ -340,7 +1241,7 @@ def create_grid(asset_path: str, grid_width: int, grid_length: int) -> str:
         return json.dumps(result)
 
 @mcp.tool()
-def create_town(town_center_x: int, town_center_y: int, town_width: int, town_height: int) -> str:
+def create_town(town_center_x: int, town_center_y: int, town_width: int, town_height: int, seed: int | None = None, dry_run: bool = False, background: bool = False, target: str = "") -> str:
     """Create a town using supplied assets
 
     Args:
@@ -348,21 +1249,123 @@ def create_town(town_center_x: int, town_center_y: int, town_width: int, town_he
         town_center_y: Center y position
         town_width: Width of town
         town_height: Height of town
+        seed: Seed for the random layout, the same seed always builds the same town
+        dry_run: Return the planned placements and phase timings without spawning anything
+        background: Plan off the game thread and return a job id, poll it with get_layout_job
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
-    result = send_command("create_town", {
+    params = {
         "town_center_x": town_center_x,
         "town_center_y": town_center_y,
         "town_width": town_width,
-        "town_height": town_height
-    })
+        "town_height": town_height,
+        "dry_run": dry_run,
+        "background": background
+    }
+    if seed is not None:
+        params["seed"] = seed
+
+    result = send_command("create_town", params, target=target)
     if result.get("status") == "success":
         response = result.get("result")
+        if dry_run or background:
+            return json.dumps(response)
         return response
     else:
         return json.dumps(result)
 
 @mcp.tool()
-def run_blueprint_function(blueprint_name: str, function_name: str, arguments: str = "") -> str:
+def execute_layout(spec: str, seed: int | None = None, dry_run: bool = False, background: bool = False, target: str = "") -> str:
+    """
+    Build a layout from a declarative JSON spec in one bulk spawn.
+    The spec lists districts, each with explicit placements, scatter rules, segment runs (walls and fences)
+    and paths. Overlapping objects are moved to the nearest free spot or dropped before anything is spawned.
+
+    Args:
+        spec: Layout spec as a JSON string, see mcp_layout.py in the plugin's Content/Python folder for the format
+        seed: Seed overriding the one in the spec
+        dry_run: Return the planned placements and phase timings without spawning anything
+        background: Plan off the game thread and return a job id, poll it with get_layout_job
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    try:
+        spec_dict = json.loads(spec)
+    except json.JSONDecodeError as e:
+        return f"Error: Invalid layout spec: {e}"
+
+    params = {
+        "spec": spec_dict,
+        "dry_run": dry_run,
+        "background": background
+    }
+    if seed is not None:
+        params["seed"] = seed
+
+    result = send_command("execute_layout", params, target=target)
+    if result.get("status") == "success":
+        response = result.get("result")
+        return json.dumps(response)
+    else:
+        return json.dumps(result)
+
+@mcp.tool()
+def execute_layout_sharded(spec: str, targets: list[str] | None = None, seed: int | None = None, dry_run: bool = False, background: bool = False) -> str:
+    """
+    Build a layout across several editors at once, each one planning and spawning a share of the
+    spec's districts. Districts are dealt out in turn and keep their random streams, so each comes
+    out as it would in a single editor, but overlaps are only resolved between districts on the same editor.
+
+    Args:
+        spec: Layout spec as a JSON string, in the execute_layout format
+        targets: Editors to shard across, from list_targets (all of them if empty)
+        seed: Seed overriding the one in the spec, picked here if neither sets one so every shard agrees
+        dry_run: Return each shard's planned placements and phase timings without spawning anything
+        background: Plan off the game thread on each editor, returning a job id per editor for get_layout_job
+    """
+    try:
+        spec_dict = json.loads(spec)
+    except json.JSONDecodeError as e:
+        return f"Error: Invalid layout spec: {e}"
+
+    if seed is None:
+        seed = spec_dict.get("seed")
+    if seed is None:
+        seed = random.randrange(2**32)
+
+    names = targets or list(connections)
+    districts = spec_dict.get("districts", [])
+
+    def shard_params(name):
+        shard = dict(spec_dict)
+        shard_index = names.index(name)
+        shard["districts"] = [dict(district, index=district.get("index", district_index))
+                              for district_index, district in enumerate(districts)
+                              if district_index % len(names) == shard_index]
+        return {"spec": shard, "seed": seed, "dry_run": dry_run, "background": background}
+
+    shards = {}
+    for name, result in fan_out("execute_layout", shard_params, names).items():
+        shards[name] = result.get("result") if result.get("status") == "success" else {"error": result.get("message", "Unknown error")}
+    return json.dumps({"seed": seed, "shards": shards})
+
+@mcp.tool()
+def get_layout_job(job_id: int, target: str = "") -> str:
+    """
+    Check on a layout started with background set. While planning the status is "planning",
+    once spawned the full result is returned and the job is forgotten.
+
+    Args:
+        job_id: Job id returned by create_grid, create_town or execute_layout
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command("get_layout_job", {"job_id": job_id}, target=target)
+    if result.get("status") == "success":
+        return json.dumps(result.get("result"))
+    else:
+        return json.dumps(result)
+
+@mcp.tool()
+def run_blueprint_function(blueprint_name: str, function_name: str, arguments: str = "", target: str = "") -> str:
     """
     Execute a function in a Blueprint.
     
@@ -370,12 +1373,13 @@ def run_blueprint_function(blueprint_name: str, function_name: str, arguments: s
         blueprint_name: Name of the Blueprint
         function_name: Name of the function to call
         arguments: Comma-separated list of arguments (if any)
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
     result = send_command("execute_blueprint_function", {
         "blueprint_name": blueprint_name,
         "function_name": function_name,
         "arguments": arguments
-    })
+    }, target=target)
     
     if result.get("status") == "success":
         return result.get("result", "Blueprint function executed successfully")
@@ -383,12 +1387,37 @@ def run_blueprint_function(blueprint_name: str, function_name: str, arguments: s
         return f"Error: {result.get('message', 'Unknown error')}"
 
 @mcp.tool()
-def execute_python(code: str) -> str:
+def run_blueprint_function_batch(blueprint_name: str, function_name: str, argument_list: list[list], target: str = "") -> str:
+    """
+    Call a function in a Blueprint many times in one request, once per argument list.
+    Arguments are converted to the function's parameter types.
+
+    Args:
+        blueprint_name: Name of the Blueprint
+        function_name: Name of the function to call
+        argument_list: One list of arguments per call, e.g. [[1, "Red"], [2, "Blue"]]
+        target: Editor to run on, from list_targets (empty for the default editor)
+
+    Returns a list with a result or an error for each call, in order.
+    """
+    result = send_command("execute_blueprint_function_batch", {
+        "blueprint_name": blueprint_name,
+        "function_name": function_name,
+        "argument_list": argument_list
+    }, target=target)
+    if result.get("status") == "success":
+        return json.dumps(result.get("result"))
+    else:
+        return json.dumps(result)
+
+@mcp.tool()
+def execute_python(code: str, target: str = "") -> str:
     """
     Execute arbitrary Python code in Unreal Engine.
     
     Args:
         code: Python code to execute
+        target: Editor to run on, from list_targets (empty for the default editor)
     """
 
     # need to double all double-quotes
@@ -399,7 +1428,7 @@ def execute_python(code: str) -> str:
 
     result = send_command("execute_python", {
         "code": clean_code
-    })
+    }, target=target)
     
     if result is None:
         return f"Code executed successfully"
@@ -407,7 +1436,9 @@ def execute_python(code: str) -> str:
         return f"Error: {result}"
     elif isinstance(result, dict):
         if result.get("status") == "success":
-            return result.get("result", "Code executed successfully")
+            output = result.get("result", "Code executed successfully")
+            # result comes back as JSON data now, not its str()
+            return output if isinstance(output, str) else json.dumps(output)
         else:
             error_msg = result.get('message', 'Unknown error')
             traceback = result.get('traceback', '')
@@ -415,6 +1446,28 @@ def execute_python(code: str) -> str:
     else:
         return f"Error: {str(result)}"
 
+@mcp.tool()
+def profile_command(command: str, params: dict | None = None, top: int = 20, sampler: bool = False, save_stats: bool = False, target: str = "") -> str:
+    """
+    Run any bridge command under a Python profiler in the editor, to see where a slow command spends
+    its time. Returns the command's response with a profile: wall time and the top functions by
+    cumulative time. Commands that change the level really run, so profile them on a test level.
+
+    Args:
+        command: Bridge command to run, e.g. get_actors or create_grid
+        params: The command's parameters, as its tool would send them
+        top: How many functions to list
+        sampler: Sample with pyinstrument when it is installed in the editor, instead of tracing every call with cProfile
+        save_stats: Also write the raw stats file under the project's Saved/Profiling folder, its path is in the profile
+        target: Editor to run on, from list_targets (empty for the default editor)
+    """
+    result = send_command(command, params or {}, target=target, profile={
+        "top": top,
+        "sampler": sampler,
+        "save": save_stats
+    })
+    return json.dumps(result)
+
 @mcp.prompt()
 def create_castle() -> str:
     """Create a castle"""
@@ -0,0 +1,222 @@
+// Copyright Omar Abdelwahed 2025. All Rights Reserved.
+
+#include "MCPBridgeEditorLibrary.h"
+#include "AI/NavigationSystemBase.h"
+#include "Editor.h"
+#include "Engine/Selection.h"
+#include "Engine/AssetManager.h"
+#include "Engine/StreamableManager.h"
+#include "Misc/PackageName.h"
+#include "UObject/SoftObjectPath.h"
+#include "UObject/UObjectGlobals.h"
+
+namespace
+{
+    struct FPendingAssetLoad
+    {
+        FString Path;
+        TSharedPtr<FStreamableHandle> Handle;
+    };
+
+    // Only touched from the game thread, where Python runs
+    TMap<int32, TArray<FPendingAssetLoad>> AsyncLoadRequests;
+    int32 NextAsyncLoadRequest = 1;
+
+    int32 BulkOperationDepth = 0;
+    TOptional<FNavigationLockContext> BulkNavigationLock;
+    const FText BulkOperationName = NSLOCTEXT("UnrealMCPBridge", "BulkOperation", "MCP Bridge bulk operation");
+
+    FSoftObjectPath ToObjectPath(const FString& AssetPath)
+    {
+        // Accept package names like /Game/Props/Barrel as well as /Game/Props/Barrel.Barrel
+        if (!AssetPath.Contains(TEXT(".")))
+        {
+            return FSoftObjectPath(AssetPath + TEXT(".") + FPackageName::GetShortName(AssetPath));
+        }
+        return FSoftObjectPath(AssetPath);
+    }
+
+    FString DescribePropertyType(const FProperty* Property)
+    {
+        if (Property->IsA<FBoolProperty>())
+        {
+            return TEXT("bool");
+        }
+        if (const FByteProperty* ByteProperty = CastField<FByteProperty>(Property))
+        {
+            return ByteProperty->Enum ? TEXT("enum") : TEXT("int");
+        }
+        if (Property->IsA<FEnumProperty>())
+        {
+            return TEXT("enum");
+        }
+        if (const FNumericProperty* NumericProperty = CastField<FNumericProperty>(Property))
+        {
+            return NumericProperty->IsFloatingPoint() ? TEXT("float") : TEXT("int");
+        }
+        if (Property->IsA<FStrProperty>())
+        {
+            return TEXT("str");
+        }
+        if (Property->IsA<FNameProperty>())
+        {
+            return TEXT("name");
+        }
+        if (Property->IsA<FTextProperty>())
+        {
+            return TEXT("text");
+        }
+        if (const FStructProperty* StructProperty = CastField<FStructProperty>(Property))
+        {
+            return StructProperty->Struct->GetName();
+        }
+        if (Property->IsA<FObjectPropertyBase>())
+        {
+            return TEXT("object");
+        }
+        return TEXT("other");
+    }
+}
+
+int32 UMCPBridgeEditorLibrary::RequestAsyncLoad(const TArray<FString>& AssetPaths)
+{
+    FStreamableManager& StreamableManager = UAssetManager::GetStreamableManager();
+
+    // One handle per asset, so each one can be collected as soon as it is ready
+    TArray<FPendingAssetLoad> Loads;
+    for (const FString& AssetPath : AssetPaths)
+    {
+        FPendingAssetLoad& Load = Loads.AddDefaulted_GetRef();
+        Load.Path = AssetPath;
+        Load.Handle = StreamableManager.RequestAsyncLoad(ToObjectPath(AssetPath), FStreamableDelegate(),
+            FStreamableManager::AsyncLoadHighPriority);
+    }
+
+    if (Loads.IsEmpty())
+    {
+        return 0;
+    }
+
+    const int32 RequestId = NextAsyncLoadRequest++;
+    AsyncLoadRequests.Add(RequestId, MoveTemp(Loads));
+    return RequestId;
+}
+
+TMap<FString, UObject*> UMCPBridgeEditorLibrary::TakeLoadedAssets(int32 RequestId)
+{
+    TMap<FString, UObject*> Loaded;
+    TArray<FPendingAssetLoad>* Loads = AsyncLoadRequests.Find(RequestId);
+    if (!Loads)
+    {
+        return Loaded;
+    }
+
+    for (int32 Index = Loads->Num() - 1; Index >= 0; --Index)
+    {
+        FPendingAssetLoad& Load = (*Loads)[Index];
+        if (!Load.Handle.IsValid() || Load.Handle->HasLoadCompleted() || Load.Handle->WasCanceled())
+        {
+            Loaded.Add(Load.Path, Load.Handle.IsValid() ? Load.Handle->GetLoadedAsset() : nullptr);
+            Loads->RemoveAtSwap(Index);
+        }
+    }
+
+    if (Loads->IsEmpty())
+    {
+        AsyncLoadRequests.Remove(RequestId);
+    }
+    return Loaded;
+}
+
+bool UMCPBridgeEditorLibrary::IsAsyncLoadPending(int32 RequestId)
+{
+    return AsyncLoadRequests.Contains(RequestId);
+}
+
+void UMCPBridgeEditorLibrary::ProcessAsyncLoading(float TimeLimitSeconds)
+{
+    ::ProcessAsyncLoading(true, false, TimeLimitSeconds);
+}
+
+void UMCPBridgeEditorLibrary::ReleaseAsyncLoad(int32 RequestId)
+{
+    if (TArray<FPendingAssetLoad>* Loads = AsyncLoadRequests.Find(RequestId))
+    {
+        for (FPendingAssetLoad& Load : *Loads)
+        {
+            if (Load.Handle.IsValid())
+            {
+                Load.Handle->CancelHandle();
+            }
+        }
+        AsyncLoadRequests.Remove(RequestId);
+    }
+}
+
+TArray<FString> UMCPBridgeEditorLibrary::GetFunctionParameters(UClass* Class, const FString& FunctionName, bool& bFound)
+{
+    TArray<FString> Parameters;
+    bFound = false;
+    if (!Class)
+    {
+        return Parameters;
+    }
+
+    const FString WantedName = FunctionName.Replace(TEXT("_"), TEXT(""));
+    UFunction* Function = nullptr;
+    for (TFieldIterator<UFunction> It(Class, EFieldIteratorFlags::IncludeSuper); It; ++It)
+    {
+        if (It->GetName().Replace(TEXT("_"), TEXT("")).Equals(WantedName, ESearchCase::IgnoreCase))
+        {
+            Function = *It;
+            break;
+        }
+    }
+    if (!Function)
+    {
+        return Parameters;
+    }
+    bFound = true;
+
+    for (TFieldIterator<FProperty> It(Function); It && It->HasAnyPropertyFlags(CPF_Parm); ++It)
+    {
+        // The return value and pure outputs come back from the call instead
+        if (It->HasAnyPropertyFlags(CPF_ReturnParm) ||
+            (It->HasAnyPropertyFlags(CPF_OutParm) && !It->HasAnyPropertyFlags(CPF_ReferenceParm)))
+        {
+            continue;
+        }
+        Parameters.Add(FString::Printf(TEXT("%s:%s"), *It->GetName(), *DescribePropertyType(*It)));
+    }
+    return Parameters;
+}
+
+void UMCPBridgeEditorLibrary::BeginBulkOperation()
+{
+    // Only the outermost operation changes anything
+    if (BulkOperationDepth++ > 0 || !GEditor)
+    {
+        return;
+    }
+
+    GEditor->SetViewportsRealtimeOverride(false, BulkOperationName);
+    GEditor->GetSelectedActors()->BeginBatchSelectOperation();
+    if (UWorld* World = GEditor->GetEditorWorldContext().World())
+    {
+        BulkNavigationLock.Emplace(World, ENavigationLockReason::Unknown);
+    }
+}
+
+void UMCPBridgeEditorLibrary::EndBulkOperation()
+{
+    if (BulkOperationDepth == 0 || --BulkOperationDepth > 0 || !GEditor)
+    {
+        return;
+    }
+
+    // Releasing the lock runs the navigation updates collected in the meantime
+    BulkNavigationLock.Reset();
+    GEditor->GetSelectedActors()->EndBatchSelectOperation();
+    GEditor->RemoveViewportsRealtimeOverride(BulkOperationName);
+    GEditor->RedrawLevelEditingViewports();
+}
@@ -0,0 +1,151 @@
+// Copyright Omar Abdelwahed 2025. All Rights Reserved.
+
+#include "MCPCommandScheduler.h"
+#include "HAL/PlatformMisc.h"
+#include "HAL/PlatformTime.h"
+
+/** Class names for UNREAL_MCP_RATE_LIMITS and server_stats, in EMCPCommandClass order */
+static const TCHAR* CommandClassNames[] = { TEXT("interactive"), TEXT("write"), TEXT("code"), TEXT("bulk") };
+
+FMCPCommandScheduler::FMCPCommandScheduler()
+    : LastRefill(FPlatformTime::Seconds())
+{
+    // Interactive queries and single edits are never held back. Code and bulk commands tie up the game thread
+    // for long stretches, so only one runs at a time and bursts of them are spread out.
+    State(EMCPCommandClass::Code).MaxInFlight = 1;
+    State(EMCPCommandClass::Code).RatePerSecond = 10.0;
+    State(EMCPCommandClass::Code).Burst = 10.0;
+    State(EMCPCommandClass::Bulk).MaxInFlight = 1;
+    State(EMCPCommandClass::Bulk).RatePerSecond = 2.0;
+    State(EMCPCommandClass::Bulk).Burst = 4.0;
+
+    // Rates can be changed per class, e.g. UNREAL_MCP_RATE_LIMITS=bulk=0.5,write=100 (0 for no limit)
+    TArray<FString> Entries;
+    FPlatformMisc::GetEnvironmentVariable(TEXT("UNREAL_MCP_RATE_LIMITS")).ParseIntoArray(Entries, TEXT(","));
+    for (const FString& Entry : Entries)
+    {
+        FString Name, Rate;
+        if (!Entry.Split(TEXT("="), &Name, &Rate))
+        {
+            continue;
+        }
+        for (int32 Index = 0; Index < (int32)EMCPCommandClass::Num; Index++)
+        {
+            if (Name.TrimStartAndEnd() == CommandClassNames[Index])
+            {
+                Classes[Index].RatePerSecond = FMath::Max(FCString::Atod(*Rate.TrimStartAndEnd()), 0.0);
+            }
+        }
+    }
+
+    for (FClassState& Class : Classes)
+    {
+        Class.Tokens = Class.Burst;
+    }
+}
+
+EMCPCommandClass FMCPCommandScheduler::Classify(const FString& Command)
+{
+    static const TSet<FString> InteractiveCommands = {
+        TEXT("negotiate"), TEXT("server_stats"), TEXT("ping"), TEXT("get_actors"), TEXT("get_changes_since"),
+        TEXT("get_actor_stats"), TEXT("query_radius"), TEXT("query_box"), TEXT("nearest_k"), TEXT("find_free_placement"),
+        TEXT("get_actor_details"), TEXT("get_selected_actors"), TEXT("get_project_dir"), TEXT("get_content_dir"),
+        TEXT("find_basic_shapes"), TEXT("find_assets"), TEXT("get_asset"), TEXT("prefetch_assets"), TEXT("get_layout_job")
+    };
+    static const TSet<FString> CodeCommands = {
+        TEXT("execute_python"), TEXT("execute_blueprint_function")
+    };
+    static const TSet<FString> BulkCommands = {
+        TEXT("modify_actors"), TEXT("set_materials"), TEXT("delete_actors"), TEXT("delete_all_static_mesh_actors"),
+        TEXT("create_grid"), TEXT("create_town"), TEXT("execute_layout"), TEXT("execute_blueprint_function_batch")
+    };
+
+    if (InteractiveCommands.Contains(Command))
+    {
+        return EMCPCommandClass::Interactive;
+    }
+    if (CodeCommands.Contains(Command))
+    {
+        return EMCPCommandClass::Code;
+    }
+    if (BulkCommands.Contains(Command))
+    {
+        return EMCPCommandClass::Bulk;
+    }
+    return EMCPCommandClass::Write;
+}
+
+void FMCPCommandScheduler::BeginPass(double Now)
+{
+    const double Elapsed = Now - LastRefill;
+    LastRefill = Now;
+    for (FClassState& Class : Classes)
+    {
+        Class.Tokens = FMath::Min(Class.Burst, Class.Tokens + Elapsed * Class.RatePerSecond);
+        Class.Queued = 0;
+    }
+}
+
+void FMCPCommandScheduler::NoteQueued(EMCPCommandClass Class)
+{
+    FClassState& ClassState = State(Class);
+    ClassState.Queued++;
+    ClassState.MaxQueued = FMath::Max(ClassState.MaxQueued, ClassState.Queued);
+}
+
+void FMCPCommandScheduler::NoteLimited(EMCPCommandClass Class)
+{
+    State(Class).LimitedCount++;
+}
+
+bool FMCPCommandScheduler::CanStart(EMCPCommandClass Class, double& OutWaitSeconds) const
+{
+    const FClassState& ClassState = State(Class);
+    if (ClassState.InFlight >= ClassState.MaxInFlight)
+    {
+        // Frees up when a command finishes, which wakes the server anyway
+        return false;
+    }
+    if (ClassState.RatePerSecond > 0.0 && ClassState.Tokens < 1.0)
+    {
+        OutWaitSeconds = FMath::Min(OutWaitSeconds, (1.0 - ClassState.Tokens) / ClassState.RatePerSecond);
+        return false;
+    }
+    return true;
+}
+
+void FMCPCommandScheduler::Started(EMCPCommandClass Class)
+{
+    FClassState& ClassState = State(Class);
+    ClassState.InFlight++;
+    ClassState.StartedCount++;
+    if (ClassState.RatePerSecond > 0.0)
+    {
+        ClassState.Tokens -= 1.0;
+    }
+}
+
+void FMCPCommandScheduler::Finished(EMCPCommandClass Class)
+{
+    State(Class).InFlight--;
+}
+
+TSharedRef<FJsonObject> FMCPCommandScheduler::GetStats() const
+{
+    TSharedRef<FJsonObject> Stats = MakeShared<FJsonObject>();
+    for (int32 Index = 0; Index < (int32)EMCPCommandClass::Num; Index++)
+    {
+        const FClassState& ClassState = Classes[Index];
+        TSharedRef<FJsonObject> ClassStats = MakeShared<FJsonObject>();
+        ClassStats->SetNumberField(TEXT("priority"), Index);
+        ClassStats->SetNumberField(TEXT("queued"), ClassState.Queued);
+        ClassStats->SetNumberField(TEXT("max_queued"), ClassState.MaxQueued);
+        ClassStats->SetNumberField(TEXT("in_flight"), ClassState.InFlight);
+        ClassStats->SetNumberField(TEXT("max_in_flight"), ClassState.MaxInFlight == MAX_int32 ? -1 : ClassState.MaxInFlight);
+        ClassStats->SetNumberField(TEXT("rate_per_second"), ClassState.RatePerSecond);
+        ClassStats->SetNumberField(TEXT("started"), (double)ClassState.StartedCount);
+        ClassStats->SetNumberField(TEXT("limited"), (double)ClassState.LimitedCount);
+        Stats->SetObjectField(CommandClassNames[Index], ClassStats);
+    }
+    return Stats;
+}
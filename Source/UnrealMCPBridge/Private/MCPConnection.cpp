@@ -0,0 +1,177 @@
+// Copyright Omar Abdelwahed 2025. All Rights Reserved.
+
+#include "MCPConnection.h"
+#include "Sockets.h"
+#include "SocketSubsystem.h"
+
+#if PLATFORM_UNIX
+#include <errno.h>
+#include <fcntl.h>
+#include <poll.h>
+#include <sys/socket.h>
+#include <sys/stat.h>
+#include <sys/un.h>
+#include <unistd.h>
+#endif
+
+FMCPSocketConnection::FMCPSocketConnection(FSocket* InSocket)
+    : Socket(InSocket)
+{
+    Socket->SetNonBlocking(true);
+}
+
+FMCPSocketConnection::~FMCPSocketConnection()
+{
+    Socket->Close();
+    ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->DestroySocket(Socket);
+}
+
+bool FMCPSocketConnection::HasPendingData()
+{
+    uint32 PendingDataSize = 0;
+    return Socket->HasPendingData(PendingDataSize);
+}
+
+bool FMCPSocketConnection::Wait(FTimespan Timeout)
+{
+    // Readable includes a closed connection, which the following Recv reports
+    return Socket->Wait(ESocketWaitConditions::WaitForRead, Timeout);
+}
+
+bool FMCPSocketConnection::Recv(uint8* Data, int32 BufferSize, int32& BytesRead)
+{
+    return Socket->Recv(Data, BufferSize, BytesRead);
+}
+
+bool FMCPSocketConnection::Send(const uint8* Data, int32 Count, int32& BytesSent, bool& bWouldBlock)
+{
+    if (Socket->Send(Data, Count, BytesSent))
+    {
+        return true;
+    }
+    bWouldBlock = ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->GetLastErrorCode() == SE_EWOULDBLOCK;
+    return false;
+}
+
+#if PLATFORM_UNIX
+
+FMCPUnixConnection::FMCPUnixConnection(int InFileDescriptor)
+    : FileDescriptor(InFileDescriptor)
+{
+    fcntl(FileDescriptor, F_SETFL, fcntl(FileDescriptor, F_GETFL) | O_NONBLOCK);
+}
+
+FMCPUnixConnection::~FMCPUnixConnection()
+{
+    close(FileDescriptor);
+}
+
+/** Wait up to TimeoutMs for a descriptor to become readable, a hang up counting as readable */
+static bool PollForRead(int FileDescriptor, int TimeoutMs)
+{
+    pollfd PollFd = { FileDescriptor, POLLIN, 0 };
+    return poll(&PollFd, 1, TimeoutMs) > 0 && (PollFd.revents & (POLLIN | POLLHUP | POLLERR)) != 0;
+}
+
+bool FMCPUnixConnection::HasPendingData()
+{
+    // A hang up counts, so the following Recv sees the closed connection
+    return PollForRead(FileDescriptor, 0);
+}
+
+bool FMCPUnixConnection::Wait(FTimespan Timeout)
+{
+    return PollForRead(FileDescriptor, (int)Timeout.GetTotalMilliseconds());
+}
+
+bool FMCPUnixConnection::Recv(uint8* Data, int32 BufferSize, int32& BytesRead)
+{
+    BytesRead = 0;
+    const ssize_t Read = recv(FileDescriptor, Data, BufferSize, 0);
+    if (Read > 0)
+    {
+        BytesRead = (int32)Read;
+        return true;
+    }
+
+    // Zero bytes is the client closing the connection
+    return Read < 0 && (errno == EAGAIN || errno == EWOULDBLOCK);
+}
+
+bool FMCPUnixConnection::Send(const uint8* Data, int32 Count, int32& BytesSent, bool& bWouldBlock)
+{
+    // No SIGPIPE if the client is gone, send just fails
+    const ssize_t Sent = send(FileDescriptor, Data, Count, MSG_NOSIGNAL);
+    if (Sent >= 0)
+    {
+        BytesSent = (int32)Sent;
+        return true;
+    }
+    BytesSent = 0;
+    bWouldBlock = errno == EAGAIN || errno == EWOULDBLOCK;
+    return false;
+}
+
+TUniquePtr<FMCPUnixListener> FMCPUnixListener::Create(const FString& Path)
+{
+    sockaddr_un Address = {};
+    Address.sun_family = AF_UNIX;
+    FTCHARToUTF8 PathUTF8(*Path);
+    if (PathUTF8.Length() >= (int32)sizeof(Address.sun_path))
+    {
+        UE_LOG(LogTemp, Error, TEXT("MCP socket path is too long: %s"), *Path);
+        return nullptr;
+    }
+    FMemory::Memcpy(Address.sun_path, PathUTF8.Get(), PathUTF8.Length());
+
+    const int FileDescriptor = socket(AF_UNIX, SOCK_STREAM, 0);
+    if (FileDescriptor < 0)
+    {
+        UE_LOG(LogTemp, Error, TEXT("Failed to create MCP Unix socket"));
+        return nullptr;
+    }
+
+    // A socket file left by an editor that didn't shut down cleanly would make bind fail
+    unlink(Address.sun_path);
+    if (bind(FileDescriptor, (sockaddr*)&Address, sizeof(Address)) != 0 || listen(FileDescriptor, 8) != 0)
+    {
+        UE_LOG(LogTemp, Error, TEXT("Failed to listen on MCP Unix socket %s (errno %d)"), *Path, errno);
+        close(FileDescriptor);
+        return nullptr;
+    }
+
+    // Only the user running the editor may connect, like the TCP listener only taking loopback connections
+    chmod(Address.sun_path, S_IRUSR | S_IWUSR);
+    fcntl(FileDescriptor, F_SETFL, fcntl(FileDescriptor, F_GETFL) | O_NONBLOCK);
+
+    return TUniquePtr<FMCPUnixListener>(new FMCPUnixListener(FileDescriptor, Path));
+}
+
+FMCPUnixListener::FMCPUnixListener(int InFileDescriptor, const FString& InPath)
+    : FileDescriptor(InFileDescriptor)
+    , Path(InPath)
+{
+}
+
+FMCPUnixListener::~FMCPUnixListener()
+{
+    close(FileDescriptor);
+    unlink(TCHAR_TO_UTF8(*Path));
+}
+
+bool FMCPUnixListener::Wait(FTimespan Timeout)
+{
+    return PollForRead(FileDescriptor, (int)Timeout.GetTotalMilliseconds());
+}
+
+TUniquePtr<FMCPConnection> FMCPUnixListener::Accept()
+{
+    const int ClientFileDescriptor = accept(FileDescriptor, nullptr, nullptr);
+    if (ClientFileDescriptor < 0)
+    {
+        return nullptr;
+    }
+    return MakeUnique<FMCPUnixConnection>(ClientFileDescriptor);
+}
+
+#endif
@@ -1,21 +1,124 @@
 // Copyright Omar Abdelwahed 2025. All Rights Reserved.
 
 #include "MCPSocketServer.h"
+#include "MCPConnection.h"
 #include "PythonBridge.h"
 #include "SocketSubsystem.h"
 #include "Interfaces/IPv4/IPv4Address.h"
 #include "HAL/RunnableThread.h"
+#include "HAL/PlatformMisc.h"
+#include "HAL/PlatformTime.h"
 #include "JsonGlobals.h"
 #include "JsonObjectConverter.h"
+#include "Misc/Compression.h"
+#include "Serialization/JsonSerializer.h"
+#include "Policies/CondensedJsonPrintPolicy.h"
 #include <PythonScriptPlugin/Private/PythonScriptRemoteExecution.h>
 #include <Common/TcpSocketBuilder.h>
 
+FMCPWaitLoop::FMCPWaitLoop(const TCHAR* ThreadName, TFunction<bool()> InStep)
+    : Step(MoveTemp(InStep))
+    , bStopping(false)
+{
+    Thread = FRunnableThread::Create(this, ThreadName, 0, TPri_Normal);
+}
+
+FMCPWaitLoop::~FMCPWaitLoop()
+{
+    if (Thread)
+    {
+        Thread->Kill(true);
+        delete Thread;
+    }
+}
+
+uint32 FMCPWaitLoop::Run()
+{
+    while (!bStopping && Step())
+    {
+    }
+    return 0;
+}
+
+void FMCPWaitLoop::Stop()
+{
+    bStopping = true;
+}
+
+void FMCPMessageBuffer::Append(const uint8* InBytes, int32 Size)
+{
+    Bytes.Append(InBytes, Size);
+}
+
+bool FMCPMessageBuffer::Next(FString& OutText)
+{
+    // Braces and quotes are ASCII, which never appears inside a multi-byte UTF-8 character, so the bytes can be scanned as they are
+    int32 End = INDEX_NONE;
+    for (; ScanOffset < Bytes.Num(); ScanOffset++)
+    {
+        const uint8 Byte = Bytes[ScanOffset];
+        if (bInString)
+        {
+            if (bEscaped)
+            {
+                bEscaped = false;
+            }
+            else if (Byte == '\\')
+            {
+                bEscaped = true;
+            }
+            else if (Byte == '"')
+            {
+                bInString = false;
+            }
+        }
+        else if (Depth == 0 && Byte != '{')
+        {
+            if (Byte != ' ' && Byte != '\t' && Byte != '\r' && Byte != '\n')
+            {
+                // Not a JSON object, so it can never complete, take everything read so far as one message
+                End = Bytes.Num();
+                break;
+            }
+        }
+        else if (Byte == '"')
+        {
+            bInString = true;
+        }
+        else if (Byte == '{' || Byte == '[')
+        {
+            Depth++;
+        }
+        else if ((Byte == '}' || Byte == ']') && --Depth == 0)
+        {
+            End = ScanOffset + 1;
+            break;
+        }
+    }
+
+    if (End == INDEX_NONE)
+    {
+        return false;
+    }
+
+    FUTF8ToTCHAR Converted(reinterpret_cast<const ANSICHAR*>(Bytes.GetData()), End);
+    OutText = FString(Converted.Length(), Converted.Get());
+    Bytes.RemoveAt(0, End);
+    ScanOffset = 0;
+    Depth = 0;
+    bInString = false;
+    bEscaped = false;
+    return true;
+}
+
 FMCPSocketServer::FMCPSocketServer()
-    : ListenerSocket(nullptr)
+    : WorkEvent(FPlatformProcess::GetSynchEventFromPool(false))
+    , ListenerSocket(nullptr)
     , Thread(nullptr)
     , bStopping(false)
     , Port(9000)
     , ListenAddress(TEXT("127.0.0.1"))
+    , SocketPath(FPlatformMisc::GetEnvironmentVariable(TEXT("UNREAL_MCP_SOCKET")))
 {
 }
 
@@ -27,6 +130,8 @@ FMCPSocketServer::~FMCPSocketServer()
         delete Thread;
     }
 
+    FPlatformProcess::ReturnSynchEventToPool(WorkEvent);
+
     if (ListenerSocket)
     {
         ListenerSocket->Close();
@@ -70,37 +175,99 @@ uint32 FMCPSocketServer::Run()
     // Set socket to non-blocking mode
     ListenerSocket->SetNonBlocking(true);
 
-    // Main server loop
-    while (!bStopping)
+#if PLATFORM_UNIX
+    // Same host clients can skip TCP loopback through a Unix domain socket, when UNREAL_MCP_SOCKET names one
+    TUniquePtr<FMCPUnixListener> UnixListener;
+    if (!SocketPath.IsEmpty())
     {
-        bool bHasPendingConnection = false;
-        ListenerSocket->HasPendingConnection(bHasPendingConnection);
+        UnixListener = FMCPUnixListener::Create(SocketPath);
+        if (UnixListener)
+        {
+            UE_LOG(LogTemp, Display, TEXT("MCP Socket Server listening on %s"), *SocketPath);
+        }
+    }
+#endif
 
-        if (bHasPendingConnection)
+    // Each listener blocks in its own wait, so a connecting client is taken on at once without polling
+    const FTimespan WaitTimeout = FTimespan::FromSeconds(WaitSeconds);
+    TArray<TUniquePtr<FMCPWaitLoop>> Listeners;
+    Listeners.Add(MakeUnique<FMCPWaitLoop>(TEXT("MCPListener"), [this, WaitTimeout]()
+    {
+        bool bHasPendingConnection = false;
+        if (ListenerSocket->WaitForPendingConnection(bHasPendingConnection, WaitTimeout) && bHasPendingConnection)
         {
             TSharedRef<FInternetAddr> RemoteAddress = ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->CreateInternetAddr();
-            FSocket* ClientSocket = ListenerSocket->Accept(*RemoteAddress, TEXT("MCP Client Connection"));
-
-            if (ClientSocket)
+            if (FSocket* ClientSocket = ListenerSocket->Accept(*RemoteAddress, TEXT("MCP Client Connection")))
             {
-                UE_LOG(LogTemp, Display, TEXT("MCP Client connected from %s"), *RemoteAddress->ToString(true));
+                QueueSession(MakeUnique<FMCPSocketConnection>(ClientSocket), RemoteAddress->ToString(true));
+            }
+        }
+        return true;
+    }));
 
-                // Handle the client in the same thread for simplicity
-                // In a production environment, you'd likely want to spawn a new thread for each client
-                HandleClientConnection(ClientSocket);
+#if PLATFORM_UNIX
+    if (UnixListener)
+    {
+        Listeners.Add(MakeUnique<FMCPWaitLoop>(TEXT("MCPUnixListener"), [this, WaitTimeout, Listener = UnixListener.Get()]()
+        {
+            if (Listener->Wait(WaitTimeout))
+            {
+                if (TUniquePtr<FMCPConnection> Connection = Listener->Accept())
+                {
+                    QueueSession(MoveTemp(Connection), SocketPath);
+                }
             }
+            return true;
+        }));
+    }
+#endif
+
+    // Main server loop
+    double WaitTime = WaitSeconds;
+    while (!bStopping)
+    {
+        // Sleep until a listener or a reader has work for us, or a rate limited command may start
+        if (WaitTime > 0.0)
+        {
+            WorkEvent->Wait(FTimespan::FromSeconds(WaitTime));
+        }
+
+        TUniquePtr<FMCPClientSession> Accepted;
+        while (AcceptedSessions.Dequeue(Accepted))
+        {
+            AddSession(MoveTemp(Accepted));
+        }
+
+        // One message or stream chunk per pass, so a long stream or a chatty client doesn't lock out the others.
+        // Commands still run one at a time, on the game thread.
+        WaitTime = WaitSeconds;
+        const int32 Index = PickNextSession(WaitTime);
+        if (Index == INDEX_NONE)
+        {
+            continue;
+        }
+
+        FMCPClientSession& Session = *Sessions[Index];
+        if (!ServiceSession(Session))
+        {
+            UE_LOG(LogTemp, Display, TEXT("MCP Client disconnected from %s"), *Session.Description);
+            Sessions.RemoveAt(Index);
         }
 
-        // Sleep to prevent tight loop
-        FPlatformProcess::Sleep(0.1f);
+        // There may be more to do, look again before sleeping
+        WaitTime = 0.0;
     }
 
+    // Stop the listeners before the sockets they wait on go, and the readers before their connections close
+    Listeners.Empty();
+    Sessions.Empty();
     return 0;
 }
 
 void FMCPSocketServer::Stop()
 {
     bStopping = true;
+    WorkEvent->Trigger();
 }
 
 void FMCPSocketServer::Exit()
@@ -113,71 +280,227 @@ void FMCPSocketServer::Exit()
     }
 }
 
-void FMCPSocketServer::HandleClientConnection(FSocket* ClientSocket)
+void FMCPSocketServer::QueueSession(TUniquePtr<FMCPConnection> Connection, const FString& Description)
+{
+    TUniquePtr<FMCPClientSession> Session = MakeUnique<FMCPClientSession>();
+    Session->Connection = MoveTemp(Connection);
+    Session->Description = Description;
+    AcceptedSessions.Enqueue(MoveTemp(Session));
+    WorkEvent->Trigger();
+}
+
+void FMCPSocketServer::AddSession(TUniquePtr<FMCPClientSession> Session)
 {
-    /*if (!ClientSocket)
+    if (Sessions.Num() >= MaxSessions)
     {
+        UE_LOG(LogTemp, Warning, TEXT("MCP Client from %s refused, %d clients are already connected"), *Session->Description, MaxSessions);
+        SendString(*Session->Connection, TEXT("{\"status\":\"error\",\"message\":\"Too many clients connected\"}"));
         return;
-    }*/
-    UE_LOG(LogTemp, Display, TEXT("FMCPSocketServer::HandleClientConnection"));
+    }
 
-    // Set socket to non-blocking mode
-    ClientSocket->SetNonBlocking(true);
+    UE_LOG(LogTemp, Display, TEXT("MCP Client connected from %s"), *Session->Description);
+    Session->RecvBuffer.SetNumUninitialized(1024 * 16); // 16KB buffer
+    FMCPClientSession* SessionPtr = Session.Get();
+    Session->Reader = MakeUnique<FMCPWaitLoop>(TEXT("MCPClientReader"), [this, SessionPtr]()
+    {
+        return ReadClientMessage(*SessionPtr);
+    });
+    Sessions.Add(MoveTemp(Session));
+}
 
-    // Buffer for incoming data
-    TArray<uint8> RecvBuffer;
-    RecvBuffer.SetNumUninitialized(1024 * 16); // 16KB buffer
+bool FMCPSocketServer::ReadClientMessage(FMCPClientSession& Session)
+{
+    // Wakes as soon as the client sends something, instead of on the next poll
+    if (!Session.Connection->Wait(FTimespan::FromSeconds(WaitSeconds)))
+    {
+        return true;
+    }
 
-    while (!bStopping)
+    int32 BytesRead = 0;
+    if (!Session.Connection->Recv(Session.RecvBuffer.GetData(), Session.RecvBuffer.Num(), BytesRead))
+    {
+        Session.bDisconnected = true;
+        WorkEvent->Trigger();
+        return false;
+    }
+
+    if (BytesRead > 0)
+    {
+        UE_LOG(LogTemp, Display, TEXT("...bytes: %i"), BytesRead);
+
+        // A large request (a long batch call, a layout spec) arrives over several reads, and a read can hold several requests
+        Session.Received.Append(Session.RecvBuffer.GetData(), BytesRead);
+        FString Text;
+        while (Session.Received.Next(Text))
+        {
+            QueueClientMessage(Session, Text);
+        }
+
+        if (Session.Received.Num() > MaxMessageBytes)
+        {
+            UE_LOG(LogTemp, Error, TEXT("MCP client %s sent a message over %d bytes, disconnecting"), *Session.Description, MaxMessageBytes);
+            Session.bDisconnected = true;
+            WorkEvent->Trigger();
+            return false;
+        }
+    }
+    return true;
+}
+
+void FMCPSocketServer::QueueClientMessage(FMCPClientSession& Session, const FString& Text)
+{
+    UE_LOG(LogTemp, Display, TEXT("Received message: %s"), *FPythonBridge::TruncateForLog(Text));
+
+    // Parse it here so the server thread can schedule it by its command
+    FMCPClientMessage Message;
+    TSharedRef<TJsonReader<>> JsonReader = TJsonReaderFactory<>::Create(Text);
+    if (FJsonSerializer::Deserialize(JsonReader, Message.Json) && Message.Json.IsValid())
     {
-        uint32 PendingDataSize = 0;
-        if (ClientSocket->HasPendingData(PendingDataSize))
+        Message.Command = Message.Json->GetStringField(TEXT("command"));
+        Message.Class = FMCPCommandScheduler::Classify(Message.Command);
+    }
+    else
+    {
+        Message.Json.Reset();
+    }
+
+    Session.Inbox.Enqueue(MoveTemp(Message));
+    WorkEvent->Trigger();
+}
+
+int32 FMCPSocketServer::PickNextSession(double& OutWaitSeconds)
+{
+    Scheduler.BeginPass(FPlatformTime::Seconds());
+
+    int32 Best = INDEX_NONE;
+    EMCPCommandClass BestClass = EMCPCommandClass::Num;
+    for (int32 Offset = 0; Offset < Sessions.Num(); Offset++)
+    {
+        const int32 Index = (NextSessionIndex + Offset) % Sessions.Num();
+        FMCPClientSession& Session = *Sessions[Index];
+
+        // A stream already holds its slot, its chunks only go by priority
+        if (!Session.StreamId.IsEmpty())
         {
-            UE_LOG(LogTemp, Display, TEXT("... client sending data!"));
-            int32 BytesRead = 0;
-            if (ClientSocket->Recv(RecvBuffer.GetData(), RecvBuffer.Num(), BytesRead))
+            if (Session.StreamClass < BestClass)
             {
-                if (BytesRead > 0)
-                {
-                    UE_LOG(LogTemp, Display, TEXT("...bytes: %i"), BytesRead);
-                    // Add null terminator
-                    RecvBuffer[BytesRead] = 0;
+                Best = Index;
+                BestClass = Session.StreamClass;
+            }
+            continue;
+        }
 
-                    // Convert to FString and process
-                    FString ReceivedData = UTF8_TO_TCHAR(reinterpret_cast<ANSICHAR*>(RecvBuffer.GetData()));
-                    ProcessClientMessage(ClientSocket, ReceivedData);
-                }
+        FMCPClientMessage* Message = Session.Inbox.Peek();
+        if (!Message)
+        {
+            // Nothing left to answer, drop it straight away
+            if (Session.bDisconnected)
+            {
+                return Index;
             }
+            continue;
         }
 
-        // Sleep to prevent tight loop
-        FPlatformProcess::Sleep(0.01f);
+        Scheduler.NoteQueued(Message->Class);
+        if (!Scheduler.CanStart(Message->Class, OutWaitSeconds))
+        {
+            if (!Message->bLimited)
+            {
+                Message->bLimited = true;
+                Scheduler.NoteLimited(Message->Class);
+            }
+            continue;
+        }
+        if (Message->Class < BestClass)
+        {
+            Best = Index;
+            BestClass = Message->Class;
+        }
     }
 
-    // Close and destroy the socket when done
-    ClientSocket->Close();
-    ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->DestroySocket(ClientSocket);
+    if (Best != INDEX_NONE)
+    {
+        NextSessionIndex = Best + 1;
+    }
+    return Best;
 }
 
-void FMCPSocketServer::ProcessClientMessage(FSocket* ClientSocket, const FString& Message)
+bool FMCPSocketServer::ServiceSession(FMCPClientSession& Session)
 {
-    UE_LOG(LogTemp, Display, TEXT("Received message: %s"), *Message);
+    // A stream in progress sends its next chunk before the client's next message is read
+    if (!Session.StreamId.IsEmpty())
+    {
+        const bool bSent = SendStreamChunk(Session, FPythonBridge::ReadStream(Session.StreamId));
+        if (Session.StreamId.IsEmpty())
+        {
+            Scheduler.Finished(Session.StreamClass);
+        }
+        return bSent;
+    }
+
+    FMCPClientMessage Message;
+    if (!Session.Inbox.Dequeue(Message))
+    {
+        // Messages that arrived before the client went away are still answered
+        return !Session.bDisconnected;
+    }
 
-    TSharedPtr<FJsonObject> JsonObject;
-    TSharedRef<TJsonReader<>> JsonReader = TJsonReaderFactory<>::Create(Message);
+    Scheduler.Started(Message.Class);
+    const bool bSent = ProcessClientMessage(Session, Message);
+    if (Session.StreamId.IsEmpty())
+    {
+        Scheduler.Finished(Message.Class);
+    }
+    return bSent;
+}
 
-    if (FJsonSerializer::Deserialize(JsonReader, JsonObject) && JsonObject.IsValid())
+bool FMCPSocketServer::ProcessClientMessage(FMCPClientSession& Session, const FMCPClientMessage& Message)
+{
+    if (Message.Json.IsValid())
     {
-        FString Command = JsonObject->GetStringField(TEXT("command"));
-        TSharedPtr<FJsonObject> Params = JsonObject->GetObjectField(TEXT("params"));
+        const FString& Command = Message.Command;
+        TSharedPtr<FJsonObject> Params = Message.Json->GetObjectField(TEXT("params"));
+
+        // Connection settings and server metrics are handled here, Python never sees them
+        if (Command == TEXT("negotiate"))
+        {
+            return NegotiateConnection(Session, Params);
+        }
+        if (Command == TEXT("server_stats"))
+        {
+            return SendServerStats(Session);
+        }
+
+        bool bStream = false;
+        Message.Json->TryGetBoolField(TEXT("stream"), bStream);
+        if (bStream)
+        {
+            // The first chunk goes now, the rest as the session's turns come up
+            FString StreamId;
+            FString Chunk = FPythonBridge::BeginStreamingCommand(Command, Params, StreamId);
+            Session.StreamId = StreamId;
+            Session.StreamClass = Message.Class;
+            return SendStreamChunk(Session, Chunk);
+        }
+
+        // Requests carrying "profile": true (or an options object) run under a profiler, others take the usual path
+        TSharedPtr<FJsonObject> ProfileOptions;
+        bool bProfile = false;
+        if (!Message.Json->TryGetBoolField(TEXT("profile"), bProfile))
+        {
+            const TSharedPtr<FJsonObject>* Options = nullptr;
+            if (Message.Json->TryGetObjectField(TEXT("profile"), Options))
+            {
+                ProfileOptions = *Options;
+                bProfile = true;
+            }
+        }
 
         // Process the command through the Python bridge
-        FString Response = FPythonBridge::ExecuteCommand(Command, Params);
+        FString Response = bProfile ? FPythonBridge::ExecuteProfiledCommand(Command, Params, ProfileOptions) : FPythonBridge::ExecuteCommand(Command, Params);
 
         // Send the response back to the client
-        FTCHARToUTF8 ConvertToUTF8(*Response);
-        int32 BytesSent = 0;
-        ClientSocket->Send((uint8*)ConvertToUTF8.Get(), ConvertToUTF8.Length(), BytesSent);
+        return SendResponse(Session, Response);
     }
     else
     {
@@ -185,8 +508,163 @@ void FMCPSocketServer::ProcessClientMessage(FSocket* ClientSocket, const FString
 
         // Send error response
         FString ErrorResponse = TEXT("{\"status\":\"error\",\"message\":\"Invalid JSON format\"}");
-        FTCHARToUTF8 ConvertToUTF8(*ErrorResponse);
+        return SendResponse(Session, ErrorResponse);
+    }
+}
+
+bool FMCPSocketServer::SendStreamChunk(FMCPClientSession& Session, const FString& Chunk)
+{
+    // Newline delimited chunks, or one frame each
+    const bool bSent = Session.bFramed ? SendResponse(Session, Chunk) : SendString(*Session.Connection, Chunk.TrimEnd() + TEXT("\n"));
+    if (!bSent)
+    {
+        // Client went away mid stream, let Python drop the iterator
+        FPythonBridge::CloseStream(Session.StreamId);
+        Session.StreamId.Reset();
+        return false;
+    }
+
+    if (!FPythonBridge::IsStreamPending(Chunk))
+    {
+        Session.StreamId.Reset();
+    }
+    return true;
+}
+
+bool FMCPSocketServer::SendString(FMCPConnection& Connection, const FString& Data)
+{
+    FTCHARToUTF8 ConvertToUTF8(*Data);
+    return SendBytes(Connection, (const uint8*)ConvertToUTF8.Get(), ConvertToUTF8.Length());
+}
+
+bool FMCPSocketServer::SendBytes(FMCPConnection& Connection, const uint8* Bytes, int32 Size)
+{
+    int32 Remaining = Size;
+
+    // The socket is non-blocking, so large responses can take several sends
+    while (Remaining > 0 && !bStopping)
+    {
         int32 BytesSent = 0;
-        ClientSocket->Send((uint8*)ConvertToUTF8.Get(), ConvertToUTF8.Length(), BytesSent);
+        bool bWouldBlock = false;
+        if (!Connection.Send(Bytes, Remaining, BytesSent, bWouldBlock))
+        {
+            if (!bWouldBlock)
+            {
+                UE_LOG(LogTemp, Warning, TEXT("MCP client send failed"));
+                return false;
+            }
+            FPlatformProcess::Sleep(0.001f);
+            continue;
+        }
+        Bytes += BytesSent;
+        Remaining -= BytesSent;
+    }
+
+    return Remaining == 0;
+}
+
+bool FMCPSocketServer::SendResponse(FMCPClientSession& Session, const FString& Response)
+{
+    if (!Session.bFramed)
+    {
+        return SendString(*Session.Connection, Response);
+    }
+
+    FTCHARToUTF8 ConvertToUTF8(*Response);
+    const uint8* RawBytes = (const uint8*)ConvertToUTF8.Get();
+    const int32 RawSize = ConvertToUTF8.Length();
+
+    // Compress only above the negotiated size, and only keep the result if it actually came out smaller
+    EFrameCodec Codec = EFrameCodec::None;
+    TArray<uint8> Compressed;
+    if (Session.CompressionFormat != NAME_None && RawSize >= Session.CompressionMinSize)
+    {
+        int32 CompressedSize = FCompression::CompressMemoryBound(Session.CompressionFormat, RawSize);
+        Compressed.SetNumUninitialized(CompressedSize);
+        // Speed over ratio, zlib level 1 gives nearly the ratio of the default level at a third of the CPU (see bench_compression.py)
+        if (FCompression::CompressMemory(Session.CompressionFormat, Compressed.GetData(), CompressedSize, RawBytes, RawSize, COMPRESS_BiasSpeed) && CompressedSize < RawSize)
+        {
+            Compressed.SetNum(CompressedSize);
+            Codec = Session.CompressionFormat == NAME_Zlib ? EFrameCodec::Zlib : EFrameCodec::LZ4;
+        }
     }
-}
\ No newline at end of file
+    const uint8* Payload = Codec == EFrameCodec::None ? RawBytes : Compressed.GetData();
+    const int32 PayloadSize = Codec == EFrameCodec::None ? RawSize : Compressed.Num();
+
+    // Frame header: codec, payload size, uncompressed size, sizes big endian
+    uint8 Header[9];
+    Header[0] = (uint8)Codec;
+    for (int32 i = 0; i < 4; i++)
+    {
+        Header[1 + i] = (uint8)((uint32)PayloadSize >> (24 - 8 * i));
+        Header[5 + i] = (uint8)((uint32)RawSize >> (24 - 8 * i));
+    }
+
+    return SendBytes(*Session.Connection, Header, sizeof(Header)) && SendBytes(*Session.Connection, Payload, PayloadSize);
+}
+
+bool FMCPSocketServer::SendServerStats(FMCPClientSession& Session)
+{
+    TSharedRef<FJsonObject> Result = MakeShared<FJsonObject>();
+    Result->SetNumberField(TEXT("sessions"), Sessions.Num());
+    Result->SetObjectField(TEXT("classes"), Scheduler.GetStats());
+    TSharedRef<FJsonObject> Response = MakeShared<FJsonObject>();
+    Response->SetStringField(TEXT("status"), TEXT("success"));
+    Response->SetObjectField(TEXT("result"), Result);
+
+    FString ResponseString;
+    TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> JsonWriter = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&ResponseString);
+    FJsonSerializer::Serialize(Response, JsonWriter);
+    return SendResponse(Session, ResponseString);
+}
+
+bool FMCPSocketServer::NegotiateConnection(FMCPClientSession& Session, TSharedPtr<FJsonObject> Params)
+{
+    FName Format = NAME_None;
+    int32 MinSize = 4096;
+    if (Params.IsValid())
+    {
+        const TArray<TSharedPtr<FJsonValue>>* Formats = nullptr;
+        if (Params->TryGetArrayField(TEXT("compression"), Formats))
+        {
+            for (const TSharedPtr<FJsonValue>& Value : *Formats)
+            {
+                const FString Name = Value->AsString();
+                if (Name == TEXT("zlib"))
+                {
+                    Format = NAME_Zlib;
+                    break;
+                }
+                if (Name == TEXT("lz4"))
+                {
+                    Format = NAME_LZ4;
+                    break;
+                }
+            }
+        }
+        Params->TryGetNumberField(TEXT("min_size"), MinSize);
+    }
+
+    // The reply still goes out unframed, everything after it is framed
+    TSharedRef<FJsonObject> Result = MakeShared<FJsonObject>();
+    Result->SetStringField(TEXT("compression"), Format == NAME_None ? TEXT("none") : Format == NAME_Zlib ? TEXT("zlib") : TEXT("lz4"));
+    Result->SetNumberField(TEXT("min_size"), MinSize);
+    TSharedRef<FJsonObject> Response = MakeShared<FJsonObject>();
+    Response->SetStringField(TEXT("status"), TEXT("success"));
+    Response->SetObjectField(TEXT("result"), Result);
+
+    FString ResponseString;
+    TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> JsonWriter = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&ResponseString);
+    FJsonSerializer::Serialize(Response, JsonWriter);
+
+    if (!SendString(*Session.Connection, ResponseString))
+    {
+        return false;
+    }
+
+    Session.bFramed = true;
+    Session.CompressionFormat = Format;
+    Session.CompressionMinSize = FMath::Max(MinSize, 0);
+    UE_LOG(LogTemp, Display, TEXT("MCP client %s negotiated framing, compression %s above %d bytes"), *Session.Description, *Result->GetStringField(TEXT("compression")), Session.CompressionMinSize);
+    return true;
+}
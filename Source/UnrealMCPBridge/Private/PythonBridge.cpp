@@ -4,9 +4,19 @@
 #include <PythonScriptPlugin/Private/PythonScriptPlugin.h>
 #include "JsonGlobals.h"
 #include "JsonObjectConverter.h"
+#include "Serialization/JsonSerializer.h"
+#include "Policies/CondensedJsonPrintPolicy.h"
 #include <FileHelpers.h>
 #include "Interfaces/IPluginManager.h"
 #include "Async/TaskGraphInterfaces.h"
+#include "Engine/Engine.h"
+#include "Engine/World.h"
+#include "GameFramework/Actor.h"
+#include "Misc/ScopeLock.h"
+#include "AssetRegistry/AssetData.h"
+#include "AssetRegistry/IAssetRegistry.h"
+#include "Editor.h"
+#include "Subsystems/ImportSubsystem.h"
 #include "Microsoft/MinimalWindowsApi.h"
 
 FString FPythonBridge::LoadFileToString(FString AbsolutePath)
@@ -49,11 +59,51 @@ void FPythonBridge::Initialize()
 		UE_LOG(LogTemp, Error, TEXT("Failed to execute Python script"));
 	}
 
+    // Track level edits so clients can ask for changes instead of the whole level
+    if (GEngine)
+    {
+        LevelActorAddedHandle = GEngine->OnLevelActorAdded().AddStatic(&FPythonBridge::OnLevelActorAdded);
+        LevelActorDeletedHandle = GEngine->OnLevelActorDeleted().AddStatic(&FPythonBridge::OnLevelActorDeleted);
+        ActorMovedHandle = GEngine->OnActorMoved().AddStatic(&FPythonBridge::OnActorMoved);
+    }
+
+    // Track deleted and reimported assets so the Python asset cache never hands out a stale one
+    if (IAssetRegistry* AssetRegistry = IAssetRegistry::Get())
+    {
+        AssetAddedHandle = AssetRegistry->OnAssetAdded().AddStatic(&FPythonBridge::OnAssetAdded);
+        AssetRemovedHandle = AssetRegistry->OnAssetRemoved().AddStatic(&FPythonBridge::OnAssetRemoved);
+        AssetRenamedHandle = AssetRegistry->OnAssetRenamed().AddStatic(&FPythonBridge::OnAssetRenamed);
+    }
+    if (GEditor)
+    {
+        AssetReimportHandle = GEditor->GetEditorSubsystem<UImportSubsystem>()->OnAssetReimport.AddStatic(&FPythonBridge::OnAssetReimport);
+        BlueprintCompiledHandle = GEditor->OnBlueprintCompiled().AddStatic(&FPythonBridge::OnBlueprintCompiled);
+    }
+
     UE_LOG(LogTemp, Display, TEXT("Python bridge initialized"));
 }
 
 void FPythonBridge::Shutdown()
 {
+    if (GEngine)
+    {
+        GEngine->OnLevelActorAdded().Remove(LevelActorAddedHandle);
+        GEngine->OnLevelActorDeleted().Remove(LevelActorDeletedHandle);
+        GEngine->OnActorMoved().Remove(ActorMovedHandle);
+    }
+    if (IAssetRegistry* AssetRegistry = IAssetRegistry::Get())
+    {
+        AssetRegistry->OnAssetAdded().Remove(AssetAddedHandle);
+        AssetRegistry->OnAssetRemoved().Remove(AssetRemovedHandle);
+        AssetRegistry->OnAssetRenamed().Remove(AssetRenamedHandle);
+    }
+    if (GEditor)
+    {
+        GEditor->GetEditorSubsystem<UImportSubsystem>()->OnAssetReimport.Remove(AssetReimportHandle);
+        GEditor->OnBlueprintCompiled().Remove(BlueprintCompiledHandle);
+    }
+
+
     // Clean up any Python resources
     FString ShutdownScript = TEXT("del mcp_bridge");
     FPythonScriptPlugin::Get()->ExecPythonCommand(*ShutdownScript);
@@ -70,18 +120,70 @@ FString FPythonBridge::ExecuteCommand(const FString& Command, TSharedPtr<FJsonOb
     return ExecutePythonScript(PythonScript);
 }
 
+FString FPythonBridge::ExecuteProfiledCommand(const FString& Command, TSharedPtr<FJsonObject> Params, TSharedPtr<FJsonObject> ProfileOptions)
+{
+    // The handler is passed to the wrapper, so the command's own parameters can't clash with the options
+    FString PythonDict = ParamsToPythonDict(Params);
+    if (!PythonDict.IsEmpty())
+    {
+        PythonDict = TEXT(", ") + PythonDict;
+    }
+    FString PythonScript = FString::Printf(TEXT("mcp_bridge._profile(mcp_bridge.%s, dict(%s)%s)"), *Command, *ParamsToPythonDict(ProfileOptions), *PythonDict);
+
+    return ExecutePythonScript(PythonScript);
+}
+
+FString FPythonBridge::BeginStreamingCommand(const FString& Command, TSharedPtr<FJsonObject> Params, FString& OutStreamId)
+{
+    // The command registers its result iterator under this id and returns the first chunk
+    OutStreamId = FString::FromInt(++LastStreamId);
+    FString PythonDict = ParamsToPythonDict(Params);
+    if (!PythonDict.IsEmpty())
+    {
+        PythonDict += TEXT(", ");
+    }
+    PythonDict += FString::Printf(TEXT("stream=\"%s\""), *OutStreamId);
+    FString PythonScript = FString::Printf(TEXT("mcp_bridge.%s(%s)"), *Command, *PythonDict);
+
+    return ExecutePythonScript(PythonScript);
+}
+
+FString FPythonBridge::ReadStream(const FString& StreamId)
+{
+    // Each chunk is its own game thread task, so the editor keeps ticking between chunks
+    return ExecutePythonScript(FString::Printf(TEXT("mcp_bridge.read_stream(\"%s\")"), *StreamId));
+}
+
+void FPythonBridge::CloseStream(const FString& StreamId)
+{
+    ExecutePythonScript(FString::Printf(TEXT("mcp_bridge.close_stream(\"%s\")"), *StreamId));
+}
+
+bool FPythonBridge::IsStreamPending(const FString& Chunk)
+{
+    // read_stream puts done first, so this can't match an item
+    return Chunk.TrimStart().StartsWith(TEXT("'{\"done\":false,"), ESearchCase::CaseSensitive);
+}
+
 FString FPythonBridge::ExecutePythonScript(const FString& PythonScript)
 {
     FPythonCommandEx PythonCommand;
 	PythonCommand.Command = *PythonScript;
 	PythonCommand.ExecutionMode = EPythonCommandExecutionMode::ExecuteStatement;
 
-    UE_LOG(LogTemp, Display, TEXT("[Exec Python] %s"), *PythonScript);
+    UE_LOG(LogTemp, Display, TEXT("[Exec Python] %s"), *TruncateForLog(PythonScript));
     FString Result;
 
     // Execute Python on main thread
     FGraphEventRef Task = FFunctionGraphTask::CreateAndDispatchWhenReady([&]()
     {
+            // Bring the change journal and asset cache up to date before the command can read them
+            FString EditorEventsScript = DrainEditorEvents();
+            if (!EditorEventsScript.IsEmpty())
+            {
+                FPythonScriptPlugin::Get()->ExecPythonCommand(*EditorEventsScript);
+            }
+
             if (FPythonScriptPlugin::Get()->ExecPythonCommandEx(PythonCommand))
             {
 				for (auto& Str : PythonCommand.LogOutput)
@@ -104,12 +206,27 @@ FString FPythonBridge::ExecutePythonScript(const FString& PythonScript)
 
     FTaskGraphInterface::Get().WaitUntilTaskCompletes(Task);
 
-    UE_LOG(LogTemp, Display, TEXT("[Result Python] %s"), *Result);
+    UE_LOG(LogTemp, Display, TEXT("[Result Python] %s"), *TruncateForLog(Result));
 
 	return Result;
     
 }
 
+FString FPythonBridge::TruncateForLog(const FString& Text)
+{
+    if (Text.Len() <= MaxLoggedChars)
+    {
+        return Text;
+    }
+    return FString::Printf(TEXT("%s... (%d characters)"), *Text.Left(MaxLoggedChars), Text.Len());
+}
+
+FString FPythonBridge::EscapePythonString(const FString& Value)
+{
+    // Backslashes first, so JSON escapes like \" survive the trip through the Python literal
+    return Value.Replace(TEXT("\\"), TEXT("\\\\")).Replace(TEXT("'"), TEXT("\\'"));
+}
+
 FString FPythonBridge::ParamsToPythonDict(TSharedPtr<FJsonObject> Params)
 {
     if (!Params.IsValid())
@@ -135,26 +252,140 @@ FString FPythonBridge::ParamsToPythonDict(TSharedPtr<FJsonObject> Params)
         {
             ValueStr = Pair.Value->AsBool() ? TEXT("True") : TEXT("False");
         }
-        else
+        else if (Pair.Value->Type == EJson::Null)
         {
-            // For complex types, convert back to JSON string
-            //TSharedRef<FJsonValueObject> JsonValueObj = MakeShared<FJsonValueObject>(Pair.Value->AsObject());
-            //FString JsonString;
-            //TSharedRef<TJsonWriter<>> JsonWriter = TJsonWriterFactory<>::Create(&JsonString);
-            //FJsonSerializer::Serialize(JsonValueObj, JsonWriter);
+            ValueStr = TEXT("None");
+        }
+        else if (Pair.Value->Type == EJson::Array)
+        {
+            // Lists go through json.loads like objects do
+            FString JsonString;
+            TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> JsonWriter = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&JsonString);
+            FJsonSerializer::Serialize(Pair.Value->AsArray(), JsonWriter);
 
-            // Convert back to JSON string
+            ValueStr = FString::Printf(TEXT("json.loads('%s')"), *EscapePythonString(JsonString));
+        }
+        else
+        {
+            // Convert back to a single line JSON string, pretty printed newlines would end the Python literal
             TSharedPtr<FJsonObject> JsonObject = Pair.Value->AsObject();
             FString JsonString;
-            TSharedRef<TJsonWriter<>> JsonWriter = TJsonWriterFactory<>::Create(&JsonString);
+            TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> JsonWriter = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&JsonString);
             FJsonSerializer::Serialize(JsonObject.ToSharedRef(), JsonWriter);
 
-
-            ValueStr = FString::Printf(TEXT("json.loads('%s')"), *JsonString.Replace(TEXT("'"), TEXT("\\'")));
+            ValueStr = FString::Printf(TEXT("json.loads('%s')"), *EscapePythonString(JsonString));
         }
 
         ParamStrings.Add(FString::Printf(TEXT("%s=%s"), *Pair.Key, *ValueStr));
     }
 
     return FString::Join(ParamStrings, TEXT(", "));
-}
\ No newline at end of file
+}
+
+void FPythonBridge::OnLevelActorAdded(AActor* Actor)
+{
+    QueueActorEvent(TEXT("added"), Actor);
+}
+
+void FPythonBridge::OnLevelActorDeleted(AActor* Actor)
+{
+    QueueActorEvent(TEXT("removed"), Actor);
+}
+
+void FPythonBridge::OnActorMoved(AActor* Actor)
+{
+    QueueActorEvent(TEXT("moved"), Actor);
+}
+
+void FPythonBridge::QueueActorEvent(const TCHAR* Kind, AActor* Actor)
+{
+    // Only the level being edited is journaled, not PIE or preview worlds
+    if (!Actor || !Actor->GetWorld() || Actor->GetWorld()->WorldType != EWorldType::Editor)
+    {
+        return;
+    }
+
+    FScopeLock Lock(&ActorEventsLock);
+    if (PendingActorEvents.Num() >= MaxPendingActorEvents)
+    {
+        PendingActorEvents.Reset();
+        bActorEventsOverflowed = true;
+    }
+    PendingActorEvents.Add(FString::Printf(TEXT("(\"%s\", \"%s\")"), Kind, *Actor->GetPathName()));
+}
+
+void FPythonBridge::OnAssetAdded(const FAssetData& AssetData)
+{
+    // The initial registry scan adds every asset in the project, only later additions are news
+    IAssetRegistry* AssetRegistry = IAssetRegistry::Get();
+    if (AssetRegistry && !AssetRegistry->IsLoadingAssets())
+    {
+        QueueAssetEvent(AssetData.GetObjectPathString());
+    }
+}
+
+void FPythonBridge::OnAssetRemoved(const FAssetData& AssetData)
+{
+    QueueAssetEvent(AssetData.GetObjectPathString());
+}
+
+void FPythonBridge::OnAssetRenamed(const FAssetData& AssetData, const FString& OldObjectPath)
+{
+    QueueAssetEvent(OldObjectPath);
+}
+
+void FPythonBridge::OnAssetReimport(UObject* Asset)
+{
+    if (Asset)
+    {
+        QueueAssetEvent(Asset->GetPathName());
+    }
+}
+
+void FPythonBridge::OnBlueprintCompiled()
+{
+    // The event doesn't say which Blueprint, so every cached Blueprint function goes
+    FScopeLock Lock(&ActorEventsLock);
+    bBlueprintsCompiled = true;
+}
+
+void FPythonBridge::QueueAssetEvent(const FString& ObjectPath)
+{
+    FScopeLock Lock(&ActorEventsLock);
+    if (PendingAssetEvents.Num() >= MaxPendingActorEvents)
+    {
+        PendingAssetEvents.Reset();
+        bAssetEventsOverflowed = true;
+    }
+    PendingAssetEvents.Add(FString::Printf(TEXT("\"%s\""), *ObjectPath));
+}
+
+FString FPythonBridge::DrainEditorEvents()
+{
+    FScopeLock Lock(&ActorEventsLock);
+    TArray<FString> Statements;
+
+    if (!PendingActorEvents.IsEmpty() || bActorEventsOverflowed)
+    {
+        Statements.Add(FString::Printf(TEXT("mcp_bridge._record_actor_events([%s], overflowed=%s)"),
+            *FString::Join(PendingActorEvents, TEXT(", ")),
+            bActorEventsOverflowed ? TEXT("True") : TEXT("False")));
+
+        PendingActorEvents.Reset();
+        bActorEventsOverflowed = false;
+    }
+
+    if (!PendingAssetEvents.IsEmpty() || bAssetEventsOverflowed || bBlueprintsCompiled)
+    {
+        Statements.Add(FString::Printf(TEXT("mcp_bridge._record_asset_events([%s], overflowed=%s, blueprints_compiled=%s)"),
+            *FString::Join(PendingAssetEvents, TEXT(", ")),
+            bAssetEventsOverflowed ? TEXT("True") : TEXT("False"),
+            bBlueprintsCompiled ? TEXT("True") : TEXT("False")));
+
+        PendingAssetEvents.Reset();
+        bAssetEventsOverflowed = false;
+        bBlueprintsCompiled = false;
+    }
+
+    return FString::Join(Statements, TEXT("\n"));
+}
@@ -0,0 +1,72 @@
+// Copyright Omar Abdelwahed 2025. All Rights Reserved.
+
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Kismet/BlueprintFunctionLibrary.h"
+#include "MCPBridgeEditorLibrary.generated.h"
+
+/**
+ * Editor helpers the Python bridge needs but the Python API doesn't expose.
+ * Available in Python as unreal.MCPBridgeEditorLibrary.
+ */
+UCLASS()
+class UNREALMCPBRIDGE_API UMCPBridgeEditorLibrary : public UBlueprintFunctionLibrary
+{
+    GENERATED_BODY()
+
+public:
+    /**
+     * Start loading assets in the background through the asset manager's streamable manager
+     * @param AssetPaths - Object paths or package names of the assets to load
+     * @return Request id to collect the assets with TakeLoadedAssets, 0 if there was nothing to load
+     */
+    UFUNCTION(BlueprintCallable, Category = "MCP Bridge")
+    static int32 RequestAsyncLoad(const TArray<FString>& AssetPaths);
+
+    /**
+     * Collect the assets of a request that finished loading since the last call.
+     * Assets that failed to load map to null. The request is released once every asset has been collected.
+     * @param RequestId - Id returned by RequestAsyncLoad
+     * @return Requested path to loaded asset
+     */
+    UFUNCTION(BlueprintCallable, Category = "MCP Bridge")
+    static TMap<FString, UObject*> TakeLoadedAssets(int32 RequestId);
+
+    /** Check if a request still has assets that haven't been collected */
+    UFUNCTION(BlueprintCallable, Category = "MCP Bridge")
+    static bool IsAsyncLoadPending(int32 RequestId);
+
+    /**
+     * Let async loading make progress while a command holds the game thread
+     * @param TimeLimitSeconds - How long to spend processing loads
+     */
+    UFUNCTION(BlueprintCallable, Category = "MCP Bridge")
+    static void ProcessAsyncLoading(float TimeLimitSeconds);
+
+    /** Cancel a request and release its handles */
+    UFUNCTION(BlueprintCallable, Category = "MCP Bridge")
+    static void ReleaseAsyncLoad(int32 RequestId);
+
+    /**
+     * Describe the input parameters of a function so call arguments can be typed from reflection.
+     * The name is matched ignoring case and underscores, so Python style names like add_score work.
+     * @param Class - Class to look the function up on, including its parents
+     * @param FunctionName - Name of the function
+     * @param bFound - Set when the function exists
+     * @return "Name:Type" per input parameter in order. Type is bool, int, float, str, name, text, enum, object, other or a struct name like Vector
+     */
+    UFUNCTION(BlueprintCallable, Category = "MCP Bridge")
+    static TArray<FString> GetFunctionParameters(UClass* Class, const FString& FunctionName, bool& bFound);
+
+    /**
+     * Start a bulk edit. Until the matching EndBulkOperation, viewports stop rendering in realtime,
+     * selection changes are batched and navigation rebuilds are held back. Calls can be nested.
+     */
+    UFUNCTION(BlueprintCallable, Category = "MCP Bridge")
+    static void BeginBulkOperation();
+
+    /** Finish a bulk edit, letting everything held back catch up once and redrawing the viewports */
+    UFUNCTION(BlueprintCallable, Category = "MCP Bridge")
+    static void EndBulkOperation();
+};
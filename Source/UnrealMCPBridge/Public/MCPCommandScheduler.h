@@ -0,0 +1,81 @@
+// Copyright Omar Abdelwahed 2025. All Rights Reserved.
+
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Dom/JsonObject.h"
+
+/**
+ * Classes of bridge commands, highest priority first
+ */
+enum class EMCPCommandClass : uint8
+{
+    /** Queries an agent waits on, such as get_selected_actors */
+    Interactive,
+    /** Single edits, such as spawn_actor */
+    Write,
+    /** Arbitrary Python or Blueprint code */
+    Code,
+    /** Bulk and procedural commands, such as create_grid */
+    Bulk,
+    Num
+};
+
+/**
+ * Decides which waiting command the socket server runs next on the game thread: the highest
+ * priority class first, within each class's limits on commands in progress and commands
+ * started per second. Only used from the server thread.
+ */
+class FMCPCommandScheduler
+{
+public:
+    FMCPCommandScheduler();
+
+    /** The class of a command, unknown commands counting as writes */
+    static EMCPCommandClass Classify(const FString& Command);
+
+    /** Start a scheduling pass, refilling the rate limits and recounting the queues */
+    void BeginPass(double Now);
+
+    /** Count a command waiting in a client's queue during this pass */
+    void NoteQueued(EMCPCommandClass Class);
+
+    /** Count a command that had to wait for its class's limits */
+    void NoteLimited(EMCPCommandClass Class);
+
+    /** Whether a command of the class may start now; if not, OutWaitSeconds is lowered to when it might */
+    bool CanStart(EMCPCommandClass Class, double& OutWaitSeconds) const;
+
+    /** A command of the class started, taking a slot and a token */
+    void Started(EMCPCommandClass Class);
+
+    /** A command of the class finished, or its stream ended */
+    void Finished(EMCPCommandClass Class);
+
+    /** Queue depths, limits and counters per class, for the server_stats command */
+    TSharedRef<FJsonObject> GetStats() const;
+
+private:
+    struct FClassState
+    {
+        /** Most commands of the class in progress at once, a stream holding its slot until it ends */
+        int32 MaxInFlight = MAX_int32;
+
+        /** Commands started per second, 0 for no limit, in bursts of up to Burst */
+        double RatePerSecond = 0.0;
+        double Burst = 1.0;
+        double Tokens = 1.0;
+
+        int32 InFlight = 0;
+        int32 Queued = 0;
+        int32 MaxQueued = 0;
+        uint64 StartedCount = 0;
+        uint64 LimitedCount = 0;
+    };
+
+    FClassState& State(EMCPCommandClass Class) { return Classes[(int32)Class]; }
+    const FClassState& State(EMCPCommandClass Class) const { return Classes[(int32)Class]; }
+
+    FClassState Classes[(int32)EMCPCommandClass::Num];
+    double LastRefill;
+};
@@ -0,0 +1,93 @@
+// Copyright Omar Abdelwahed 2025. All Rights Reserved.
+
+#pragma once
+
+#include "CoreMinimal.h"
+
+class FSocket;
+
+/**
+ * A connected MCP client, over TCP or (on Linux) a Unix domain socket.
+ * All connections are non-blocking.
+ */
+class FMCPConnection
+{
+public:
+    virtual ~FMCPConnection() {}
+
+    /** Whether data, or a hang up, is waiting to be read */
+    virtual bool HasPendingData() = 0;
+
+    /** Block until data or a hang up is waiting to be read, false if Timeout passed first */
+    virtual bool Wait(FTimespan Timeout) = 0;
+
+    /** Read whatever is waiting, false once the client has gone */
+    virtual bool Recv(uint8* Data, int32 BufferSize, int32& BytesRead) = 0;
+
+    /** Send what fits in the send buffer; on failure bWouldBlock tells a full buffer from a lost client */
+    virtual bool Send(const uint8* Data, int32 Count, int32& BytesSent, bool& bWouldBlock) = 0;
+};
+
+/**
+ * A client accepted on the TCP listener
+ */
+class FMCPSocketConnection : public FMCPConnection
+{
+public:
+    explicit FMCPSocketConnection(FSocket* InSocket);
+    virtual ~FMCPSocketConnection();
+
+    virtual bool HasPendingData() override;
+    virtual bool Wait(FTimespan Timeout) override;
+    virtual bool Recv(uint8* Data, int32 BufferSize, int32& BytesRead) override;
+    virtual bool Send(const uint8* Data, int32 Count, int32& BytesSent, bool& bWouldBlock) override;
+
+private:
+    FSocket* Socket;
+};
+
+#if PLATFORM_UNIX
+
+/**
+ * A client accepted on the Unix domain socket listener
+ */
+class FMCPUnixConnection : public FMCPConnection
+{
+public:
+    explicit FMCPUnixConnection(int InFileDescriptor);
+    virtual ~FMCPUnixConnection();
+
+    virtual bool HasPendingData() override;
+    virtual bool Wait(FTimespan Timeout) override;
+    virtual bool Recv(uint8* Data, int32 BufferSize, int32& BytesRead) override;
+    virtual bool Send(const uint8* Data, int32 Count, int32& BytesSent, bool& bWouldBlock) override;
+
+private:
+    int FileDescriptor;
+};
+
+/**
+ * Non-blocking listener on a Unix domain socket path, which skips TCP loopback for clients on the same host
+ */
+class FMCPUnixListener
+{
+public:
+    /** Listen on Path, replacing a socket file left by an earlier session; null on failure */
+    static TUniquePtr<FMCPUnixListener> Create(const FString& Path);
+
+    ~FMCPUnixListener();
+
+    /** Block until a client is waiting to be accepted, false if Timeout passed first */
+    bool Wait(FTimespan Timeout);
+
+    /** The next waiting client, or null if there is none */
+    TUniquePtr<FMCPConnection> Accept();
+
+private:
+    FMCPUnixListener(int InFileDescriptor, const FString& InPath);
+
+    int FileDescriptor;
+    FString Path;
+};
+
+#endif
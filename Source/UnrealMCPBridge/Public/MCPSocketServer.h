@@ -8,6 +8,109 @@
 #include "HAL/Runnable.h"
 #include "HAL/RunnableThread.h"
 #include "HAL/ThreadSafeBool.h"
+#include "HAL/Event.h"
+#include "Containers/Queue.h"
+#include "MCPCommandScheduler.h"
+
+class FMCPConnection;
+
+/**
+ * Runs a blocking wait on its own thread, over and over, so the server thread can sleep until there is work
+ */
+class FMCPWaitLoop : public FRunnable
+{
+public:
+    /** Step waits (with a timeout) for one event and handles it, returning false to end the loop */
+    FMCPWaitLoop(const TCHAR* ThreadName, TFunction<bool()> InStep);
+
+    /** Stops the loop and waits for its current step to finish */
+    virtual ~FMCPWaitLoop();
+
+    // FRunnable interface
+    virtual uint32 Run() override;
+    virtual void Stop() override;
+
+private:
+    TFunction<bool()> Step;
+    FThreadSafeBool bStopping;
+    FRunnableThread* Thread;
+};
+
+/**
+ * A message from a client, parsed and classified on its reader thread
+ */
+struct FMCPClientMessage
+{
+    /** Null if the message wasn't valid JSON */
+    TSharedPtr<FJsonObject> Json;
+    FString Command;
+    EMCPCommandClass Class = EMCPCommandClass::Interactive;
+
+    /** Whether it has already been counted as held back by its class's limits */
+    bool bLimited = false;
+};
+
+/**
+ * Collects the bytes a client sends and splits them into whole JSON messages,
+ * however the reads happened to cut them
+ */
+class FMCPMessageBuffer
+{
+public:
+    /** Add bytes just read from the client */
+    void Append(const uint8* InBytes, int32 Size);
+
+    /**
+     * Take the next complete message, false until one has fully arrived. Anything that can't be
+     * the start of a JSON object is handed out as it is, so it gets answered as invalid JSON.
+     */
+    bool Next(FString& OutText);
+
+    /** Bytes held for a message that hasn't fully arrived yet */
+    int32 Num() const { return Bytes.Num(); }
+
+private:
+    TArray<uint8> Bytes;
+
+    /** Scan state, so each byte is only looked at once however many reads a message takes */
+    int32 ScanOffset = 0;
+    int32 Depth = 0;
+    bool bInString = false;
+    bool bEscaped = false;
+};
+
+/**
+ * A connected client and the settings it negotiated
+ */
+struct FMCPClientSession
+{
+    TUniquePtr<FMCPConnection> Connection;
+
+    /** Where the client connected from, for the log */
+    FString Description;
+
+    /** Settings agreed by negotiate, every client starts unframed and uncompressed */
+    bool bFramed = false;
+    FName CompressionFormat = NAME_None;
+    int32 CompressionMinSize = 0;
+
+    /** Stream whose remaining chunks are still to be sent, empty when there is none, and its command's class */
+    FString StreamId;
+    EMCPCommandClass StreamClass = EMCPCommandClass::Interactive;
+
+    /** Messages read by the reader thread, waiting for the server thread */
+    TQueue<FMCPClientMessage, EQueueMode::Spsc> Inbox;
+
+    /** Set by the reader thread once the client has gone */
+    FThreadSafeBool bDisconnected;
+
+    /** Receive buffer, and the messages being pieced together from it, only used by the reader thread */
+    TArray<uint8> RecvBuffer;
+    FMCPMessageBuffer Received;
+
+    /** Waits for and reads the client's messages. Declared last, so it stops before anything it uses is destroyed */
+    TUniquePtr<FMCPWaitLoop> Reader;
+};
 
 /**
  * Socket server for MCP communications
@@ -26,10 +129,82 @@ public:
 
     // Server control
     void Start();
-    void HandleClientConnection(FSocket* ClientSocket);
-    void ProcessClientMessage(FSocket* ClientSocket, const FString& Message);
 
 private:
+    /** Hand a newly accepted client to the server thread, from a listener's thread */
+    void QueueSession(TUniquePtr<FMCPConnection> Connection, const FString& Description);
+
+    /** Take on a queued client and start its reader, or turn it away when MaxSessions are already connected */
+    void AddSession(TUniquePtr<FMCPClientSession> Session);
+
+    /** Reader step: wait for the client's next bytes and queue every message they complete for the server thread, false once the client is gone */
+    bool ReadClientMessage(FMCPClientSession& Session);
+
+    /** Parse and classify a complete message on the reader thread and queue it for the server thread */
+    void QueueClientMessage(FMCPClientSession& Session, const FString& Text);
+
+    /**
+     * The session to serve next: the one whose stream chunk or waiting command has the highest priority
+     * and is within its class's limits, taking turns among equals. INDEX_NONE if nothing can run now,
+     * in which case OutWaitSeconds is lowered to when a rate limited command may start.
+     */
+    int32 PickNextSession(double& OutWaitSeconds);
+
+    /** Serve a client: its next stream chunk, or its next queued message. False once the client is gone */
+    bool ServiceSession(FMCPClientSession& Session);
+
+    /** Handle one message, false if the client went away while we answered */
+    bool ProcessClientMessage(FMCPClientSession& Session, const FMCPClientMessage& Message);
+
+    /** Answer a server_stats message with the session count and the scheduler's queue depths and counters */
+    bool SendServerStats(FMCPClientSession& Session);
+
+    /** Send one chunk of the session's stream, closing the stream if the client is gone */
+    bool SendStreamChunk(FMCPClientSession& Session, const FString& Chunk);
+
+    /** Send a whole string as UTF-8, waiting out a full send buffer, false if the client is gone */
+    bool SendString(FMCPConnection& Connection, const FString& Data);
+
+    /** Send raw bytes, waiting out a full send buffer, false if the client is gone */
+    bool SendBytes(FMCPConnection& Connection, const uint8* Bytes, int32 Size);
+
+    /** Send a response, as a frame once the session has negotiated framing */
+    bool SendResponse(FMCPClientSession& Session, const FString& Response);
+
+    /** Answer a negotiate message, picking the first compression format the client lists that we support */
+    bool NegotiateConnection(FMCPClientSession& Session, TSharedPtr<FJsonObject> Params);
+
+    /** Codec byte at the start of each frame */
+    enum class EFrameCodec : uint8
+    {
+        None = 0,
+        Zlib = 1,
+        LZ4 = 2
+    };
+
+    /** Most clients served at once, each pooled client connection counts */
+    static constexpr int32 MaxSessions = 32;
+
+    /** Connected clients, served by priority from the server thread */
+    TArray<TUniquePtr<FMCPClientSession>> Sessions;
+
+    /** Where the next scheduling pass starts looking, so sessions of equal priority take turns */
+    int32 NextSessionIndex = 0;
+
+    FMCPCommandScheduler Scheduler;
+
+    /** Clients accepted by the listener threads, waiting for the server thread to add them */
+    TQueue<TUniquePtr<FMCPClientSession>, EQueueMode::Mpsc> AcceptedSessions;
+
+    /** Wakes the server thread when a client connects, sends a message or goes away */
+    FEvent* WorkEvent;
+
+    /** Largest message a client may send, a client going past it is disconnected */
+    static constexpr int32 MaxMessageBytes = 256 * 1024 * 1024;
+
+    /** Longest blocking wait, which bounds how long stopping the server takes */
+    static constexpr double WaitSeconds = 0.25;
+
     FSocket* ListenerSocket;
     FRunnableThread* Thread;
     FThreadSafeBool bStopping;
@@ -37,4 +212,7 @@ private:
     // Server configuration
     int32 Port;
     FString ListenAddress;
+
+    /** Unix domain socket to listen on as well, from UNREAL_MCP_SOCKET (Linux only) */
+    FString SocketPath;
 };
@@ -11,6 +11,10 @@
 
 #include "JsonGlobals.h"
 
+class AActor;
+class UObject;
+struct FAssetData;
+
 /**
  * Bridge for executing Python commands within Unreal Engine
  */
@@ -34,6 +38,37 @@ public:
      */
     static FString ExecuteCommand(const FString& Command, TSharedPtr<FJsonObject> Params);
 
+    /**
+     * Execute a command under a Python profiler, adding its busiest functions to the response
+     * @param Command - The command to execute
+     * @param Params - Parameters for the command
+     * @param ProfileOptions - The request's profile options (top, sampler, save), may be null
+     * @return JSON string with the result and a profile field
+     */
+    static FString ExecuteProfiledCommand(const FString& Command, TSharedPtr<FJsonObject> Params, TSharedPtr<FJsonObject> ProfileOptions);
+
+    /**
+     * Start a command in streaming mode. The command registers its result iterator and returns
+     * the first chunk; ReadStream fetches the rest, one game thread call per chunk
+     * @param Command - The command to execute, which must accept a stream parameter
+     * @param Params - Parameters for the command
+     * @param OutStreamId - Id to read the following chunks with
+     * @return The first chunk
+     */
+    static FString BeginStreamingCommand(const FString& Command, TSharedPtr<FJsonObject> Params, FString& OutStreamId);
+
+    /** Next chunk of a stream */
+    static FString ReadStream(const FString& StreamId);
+
+    /** Drop a stream the client went away from */
+    static void CloseStream(const FString& StreamId);
+
+    /** Whether a streamed chunk says more chunks follow; errors, which carry no done flag, end the stream */
+    static bool IsStreamPending(const FString& Chunk);
+
+    /** Shorten a message or result for the log, large payloads would flood it */
+    static FString TruncateForLog(const FString& Text);
+
 private:
     /** Execute Python script and return the result */
     static FString ExecutePythonScript(const FString& PythonScript);
@@ -41,6 +76,55 @@ private:
     /** Convert params to a Python dictionary string */
     static FString ParamsToPythonDict(TSharedPtr<FJsonObject> Params);
 
+    /** Escape a string for a single quoted Python literal */
+    static FString EscapePythonString(const FString& Value);
+
     static FString LoadFileToString(FString AbsolutePath);
 
+    /** Id of the last stream, only touched from the socket thread */
+    inline static int32 LastStreamId = 0;
+
+    /** Editor actor event handlers feeding the Python change journal */
+    static void OnLevelActorAdded(AActor* Actor);
+    static void OnLevelActorDeleted(AActor* Actor);
+    static void OnActorMoved(AActor* Actor);
+
+    /** Queue an actor event until the next command drains it */
+    static void QueueActorEvent(const TCHAR* Kind, AActor* Actor);
+
+    /** Asset event handlers invalidating the Python asset cache and bumping its asset version */
+    static void OnAssetAdded(const FAssetData& AssetData);
+    static void OnAssetRemoved(const FAssetData& AssetData);
+    static void OnAssetRenamed(const FAssetData& AssetData, const FString& OldObjectPath);
+    static void OnAssetReimport(UObject* Asset);
+    static void OnBlueprintCompiled();
+
+    /** Queue a stale asset path until the next command drains it */
+    static void QueueAssetEvent(const FString& ObjectPath);
+
+    /** Build the Python statements that hand the queued actor and asset events to the bridge */
+    static FString DrainEditorEvents();
+
+    /** Longest message or result written to the log in full */
+    static constexpr int32 MaxLoggedChars = 1024;
+
+    /** Upper bound on queued events before the journal is marked as overflowed */
+    static constexpr int32 MaxPendingActorEvents = 65536;
+
+    inline static FCriticalSection ActorEventsLock;
+    inline static TArray<FString> PendingActorEvents;
+    inline static bool bActorEventsOverflowed = false;
+    inline static TArray<FString> PendingAssetEvents;
+    inline static bool bAssetEventsOverflowed = false;
+    inline static bool bBlueprintsCompiled = false;
+
+    inline static FDelegateHandle LevelActorAddedHandle;
+    inline static FDelegateHandle LevelActorDeletedHandle;
+    inline static FDelegateHandle ActorMovedHandle;
+    inline static FDelegateHandle AssetAddedHandle;
+    inline static FDelegateHandle AssetRemovedHandle;
+    inline static FDelegateHandle AssetRenamedHandle;
+    inline static FDelegateHandle AssetReimportHandle;
+    inline static FDelegateHandle BlueprintCompiledHandle;
+
 };
@@ -39,6 +39,7 @@ public class UnrealMCPBridge : ModuleRules
 			new string[]
 			{
 				"Projects",
+				"AssetRegistry",
 				"InputCore",
 				"EditorFramework",
 				"UnrealEd",
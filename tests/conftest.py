@@ -0,0 +1,5 @@
+# The plugin's pure Python helpers live in Content/Python, which the editor puts on sys.path
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Content', 'Python'))
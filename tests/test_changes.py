@@ -0,0 +1,36 @@
+import json
+import os
+import sys
+from collections import deque
+from unittest import mock
+
+import pytest
+
+# unreal_server_init needs the editor's unreal module, only its journal is exercised here
+sys.modules.setdefault('unreal', mock.MagicMock())
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Content'))
+from unreal_server_init import MCPUnrealBridge
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    monkeypatch.setattr(MCPUnrealBridge, "_level_version", 0)
+    monkeypatch.setattr(MCPUnrealBridge, "_journal_floor", 0)
+    monkeypatch.setattr(MCPUnrealBridge, "_change_journal", deque(maxlen=10000))
+    monkeypatch.setattr(MCPUnrealBridge, "_spatial_index", None)
+    return MCPUnrealBridge
+
+
+def test_change_after_overflow(bridge):
+    bridge._record_actor_events([
+        ("removed", "/Game/Town.Town:PersistentLevel.Tree_1"),
+        ("removed", "/Game/Town.Town:PersistentLevel.Tree_2")])
+    bridge._record_actor_events([], overflowed=True)
+    version = bridge._level_version
+    bridge._record_actor_events([("removed", "/Game/Town.Town:PersistentLevel.Tree_3")])
+
+    result = json.loads(bridge.get_changes_since(version))["result"]
+
+    assert not result["full"]
+    assert result["removed"] == ["Tree_3"]
+    assert result["version"] == version + 1
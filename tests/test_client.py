@@ -0,0 +1,56 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'MCPClient'))
+client = pytest.importorskip("unreal_mcp_client")
+from mcp_reference_server import serve
+
+
+@pytest.fixture
+def server():
+    servers = serve(port=0, actors=10)
+    yield servers[0]
+    for each in servers:
+        each.shutdown()
+        each.server_close()
+
+
+def test_heartbeat_keeps_busy_connection(server, monkeypatch):
+    monkeypatch.setattr(client, "HEARTBEAT_INTERVAL", 0.0)
+    monkeypatch.setattr(client, "HEARTBEAT_TIMEOUT", 0.2)
+    connection = client.UnrealConnection("test", "127.0.0.1:%d" % server.server_address[1])
+    assert connection.connect()
+
+    # Another client's long command holds the game thread past the ping's timeout
+    with server.executor:
+        connection.heartbeat()
+        assert connection.socket is not None
+        assert connection.ping_pending
+
+    # The late reply is read before the next command's
+    response = connection.send_command("get_project_dir")
+    assert response == {"status": "success", "result": os.getcwd()}
+    assert not connection.ping_pending
+    assert connection.versions == {"level_version": 0, "asset_version": 0}
+    connection.close()
+
+
+def test_cached_result_dropped_on_asset_change(server, monkeypatch):
+    pool = client.ConnectionPool("test", "127.0.0.1:%d" % server.server_address[1], size=1)
+    monkeypatch.setattr(client, "connections", {"test": pool})
+    monkeypatch.setattr(client, "cache", client.ResponseCache(client.CACHE_TTLS, 16))
+    assert pool.connect()
+
+    first = client.send_command("find_basic_shapes")
+    assert client.send_command("find_basic_shapes") == first
+
+    # An asset imported in the editor while this client keeps it busy, so no heartbeat runs
+    monkeypatch.setattr(server.level, "ping", lambda: {"level_version": 0, "asset_version": 1})
+    monkeypatch.setattr(server.level, "find_basic_shapes", lambda: iter(["/Engine/BasicShapes/Plane"]))
+    monkeypatch.setattr(client, "CACHE_VERSIONS_MAX_AGE", 0.0)
+
+    assert client.send_command("find_basic_shapes")["result"] == ["/Engine/BasicShapes/Plane"]
+    assert client.cache.stats()["commands"]["find_basic_shapes"]["invalidated"] == 1
+    pool.close()
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+import mcp_encoding
+from mcp_encoding import register_encoder, to_json, to_json_stdlib
+
+
+class Vector:
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+
+class Rotator(Vector):
+    pass
+
+
+class Transform:
+    def __init__(self, location, rotation):
+        self.location = location
+        self.rotation = rotation
+
+
+class Actor:
+    def __init__(self, path):
+        self.path = path
+
+
+class Tags:
+    """Map-like, but neither a dict nor registered"""
+
+    def items(self):
+        return [(1, "first"), ("second", 2.5)]
+
+
+@pytest.fixture(autouse=True)
+def encoders(monkeypatch):
+    # Stand-ins for the Unreal types, registered the way the bridge registers the real ones
+    monkeypatch.setattr(mcp_encoding, "_registered", [])
+    monkeypatch.setattr(mcp_encoding, "_encoders", {})
+    register_encoder(Vector, lambda v: [v.x, v.y, v.z])
+    register_encoder(Transform, lambda t: {"location": t.location, "rotation": t.rotation})
+    register_encoder(Actor, lambda a: a.path)
+
+
+def test_registered_types_encode_alike():
+    result = {
+        "actors": [Actor("/Game/Town.Town:PersistentLevel.Tavern")],
+        "location": Vector(1.0, -2.5, 300.0),
+        # Subclasses take their base's encoder, and encoders may return further registered values
+        "transform": Transform(Vector(0.0, 0.0, 0.0), Rotator(0.0, 90.0, 0.0)),
+        "count": 3,
+        "name": "Tavern",
+        "hidden": False,
+        "owner": None
+    }
+
+    encoded = to_json(result)
+    assert encoded == to_json_stdlib(result)
+    assert json.loads(encoded) == {
+        "actors": ["/Game/Town.Town:PersistentLevel.Tavern"],
+        "location": [1.0, -2.5, 300.0],
+        "transform": {"location": [0.0, 0.0, 0.0], "rotation": [0.0, 90.0, 0.0]},
+        "count": 3,
+        "name": "Tavern",
+        "hidden": False,
+        "owner": None
+    }
+
+
+def test_unregistered_types_fall_back_alike():
+    # Maps become dicts, other iterables lists, anything else its str()
+    result = {"tags": Tags(), "slots": (Vector(1.0, 2.0, 3.0),), "missing": frozenset(), "text": Ellipsis}
+
+    encoded = to_json(result)
+    assert encoded == to_json_stdlib(result)
+    assert json.loads(encoded) == {"tags": {"1": "first", "second": 2.5}, "slots": [[1.0, 2.0, 3.0]],
+                                   "missing": [], "text": "Ellipsis"}
+
+
+def test_non_string_keys_fall_back_to_json():
+    # orjson refuses non string keys with a TypeError, the json module turns them into strings
+    result = {1: Vector(0.0, 0.0, 1.0), "2": [Actor("/Game/Town.Town:PersistentLevel.Forge")]}
+
+    encoded = to_json(result)
+    assert encoded == to_json_stdlib(result)
+    assert json.loads(encoded) == {"1": [0.0, 0.0, 1.0], "2": ["/Game/Town.Town:PersistentLevel.Forge"]}
@@ -0,0 +1,54 @@
+import math
+import random
+
+import pytest
+
+import mcp_geometry
+
+pytest.importorskip("numpy")
+
+
+def _assert_close(a, b):
+    assert len(a) == len(b)
+    for row_a, row_b in zip(a, b):
+        assert all(math.isclose(x, y, rel_tol=1e-9, abs_tol=1e-6) for x, y in zip(row_a, row_b))
+
+
+def test_grid_backends_agree():
+    args = (13, 7, 100.0, 120.0, -50.0, 25.0)
+    _assert_close(mcp_geometry._grid_positions_python(*args),
+                  mcp_geometry._grid_positions_numpy(*args).tolist())
+
+
+def test_segment_backends_agree():
+    args = (-3500.0, -3500.0, 3500.0, 2000.0, 97)
+    _assert_close(mcp_geometry._segment_positions_python(*args),
+                  mcp_geometry._segment_positions_numpy(*args).tolist())
+
+
+def test_rotated_bounds_backends_agree():
+    rng = random.Random(1)
+    count = 200
+    args = ([rng.uniform(-1e5, 1e5) for _ in range(count)],
+            [rng.uniform(-1e5, 1e5) for _ in range(count)],
+            [rng.uniform(10.0, 500.0) for _ in range(count)],
+            [rng.uniform(10.0, 500.0) for _ in range(count)],
+            [rng.uniform(0.0, 360.0) for _ in range(count)],
+            -10.0, 20.0)
+    _assert_close(mcp_geometry._rotated_bounds_python(*args),
+                  mcp_geometry._rotated_bounds_numpy(*args).tolist())
+
+
+def test_public_functions_take_either_backend(monkeypatch):
+    bounds_args = ([0.0] * 100, [10.0] * 100, [50.0] * 100, [20.0] * 100, [30.0] * 100)
+    with_numpy = (mcp_geometry.grid_positions(10, 10, 100.0, 100.0),
+                  mcp_geometry.segment_positions(0.0, 0.0, 1000.0, 0.0, 100),
+                  mcp_geometry.rotated_bounds(*bounds_args))
+
+    monkeypatch.setattr(mcp_geometry, "np", None)
+    without_numpy = (mcp_geometry.grid_positions(10, 10, 100.0, 100.0),
+                     mcp_geometry.segment_positions(0.0, 0.0, 1000.0, 0.0, 100),
+                     mcp_geometry.rotated_bounds(*bounds_args))
+
+    for a, b in zip(with_numpy, without_numpy):
+        _assert_close(a, b)
@@ -0,0 +1,93 @@
+import concurrent.futures
+import os
+import sys
+
+from mcp_layout import compile_layout, expand_district
+from mcp_town import town_layout_spec
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Benchmarks'))
+from bench_layout import synthetic_footprints
+
+
+def _building_labels(spec, plan):
+    buildings = next(district for district in spec["districts"] if district["name"] == "Buildings")
+    wanted = {placement["label"] for placement in buildings["placements"]}
+    return {placement["label"] for placement in plan["placements"]} & wanted
+
+
+def test_tiling_keeps_buildings():
+    spec = town_layout_spec()
+    footprints = synthetic_footprints(spec)
+    assert spec.get("tile_size")
+
+    untiled_spec = dict(spec)
+    del untiled_spec["tile_size"]
+
+    tiled = compile_layout(spec, footprints, seed=1)
+    untiled = compile_layout(untiled_spec, footprints, seed=1)
+
+    assert _building_labels(spec, tiled) == _building_labels(spec, untiled)
+    assert len(_building_labels(spec, untiled)) > 1
+
+
+def test_town_plan_reproducible():
+    spec = town_layout_spec()
+    footprints = synthetic_footprints(spec)
+
+    first = compile_layout(spec, footprints, seed=7)
+    assert compile_layout(spec, footprints, seed=7) == first
+    assert compile_layout(town_layout_spec(seed=7), footprints) == first
+    assert compile_layout(spec, footprints, seed=8) != first
+
+
+def _plans_with_executors(spec, footprints, seed):
+    """The plan without an executor, then with thread pools of several sizes and a process pool"""
+    plans = [compile_layout(spec, footprints, seed=seed)]
+    for workers in (1, 2, 4):
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            plans.append(compile_layout(spec, footprints, seed=seed, executor=executor))
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        plans.append(compile_layout(spec, footprints, seed=seed, executor=executor))
+    return plans
+
+
+def test_executor_gives_same_plan():
+    spec = town_layout_spec()
+    footprints = synthetic_footprints(spec)
+    del spec["tile_size"]
+
+    plans = _plans_with_executors(spec, footprints, 3)
+    assert all(plan == plans[0] for plan in plans)
+
+
+def test_tiled_plan_independent_of_workers():
+    spec = town_layout_spec()
+    footprints = synthetic_footprints(spec)
+
+    plans = _plans_with_executors(spec, footprints, 3)
+    assert all(plan == plans[0] for plan in plans)
+
+
+def _shard(spec, shard_count, shard_index):
+    """One editor's share of a spec, as execute_layout_sharded deals it out"""
+    shard = dict(spec)
+    shard["districts"] = [dict(district, index=district.get("index", district_index))
+                          for district_index, district in enumerate(spec["districts"])
+                          if district_index % shard_count == shard_index]
+    return shard
+
+
+def test_sharded_districts_expand_as_unsharded():
+    spec = town_layout_spec()
+    footprints = synthetic_footprints(spec)
+    expected = {district_index: expand_district(spec, district, district_index, footprints, 5)
+                for district_index, district in enumerate(spec["districts"])}
+
+    for shard_count in (2, 3):
+        for shard_index in range(shard_count):
+            shard = _shard(spec, shard_count, shard_index)
+            for position, district in enumerate(shard["districts"]):
+                assert expand_district(shard, district, position, footprints, 5) == expected[district["index"]]
+
+    # A single shard is the whole spec, so it plans the same
+    assert compile_layout(_shard(spec, 1, 0), footprints, seed=5) == compile_layout(spec, footprints, seed=5)
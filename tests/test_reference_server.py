@@ -0,0 +1,28 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'MCPClient'))
+from mcp_reference_server import MessageBuffer
+
+
+def test_message_split_across_reads():
+    message = json.dumps({"command": "execute_blueprint_function_batch",
+                          "params": {"args": [["a}\"{", i] for i in range(2000)]}}).encode('utf-8')
+    received = MessageBuffer()
+    messages = []
+    for start in range(0, len(message), 16384):
+        received.append(message[start:start + 16384])
+        messages.extend(received)
+
+    assert len(message) > 16384
+    assert [json.loads(text) for text in messages] == [json.loads(message)]
+
+
+def test_messages_in_one_read():
+    received = MessageBuffer()
+    received.append(b'{"command": "ping"}\n{"command": "get_pr')
+    assert [json.loads(text) for text in received] == [{"command": "ping"}]
+
+    received.append(b'oject_dir"} not json')
+    assert [text.strip() for text in received] == ['{"command": "get_project_dir"}', 'not json']
@@ -0,0 +1,19 @@
+from mcp_spatial import SpatialHashGrid, find_free_position
+
+
+def test_large_footprint_searches_small_radius():
+    # A 600x600 footprint and an obstacle overlapping its edge by 10 units
+    index = SpatialHashGrid(cell_size=500.0)
+    index.insert("obstacle", (290.0, -50.0, 0.0, 400.0, 50.0, 100.0))
+
+    position = find_free_position(index, 300.0, 300.0, 0.0, 0.0, 80.0)
+
+    assert position is not None
+    x, y = position
+    assert x * x + y * y <= 80.0 * 80.0
+    assert index.is_box_free((x - 300.0, y - 300.0, -1e9, x + 300.0, y + 300.0, 1e9))
+
+
+def test_free_point_is_kept():
+    index = SpatialHashGrid(cell_size=500.0)
+    assert find_free_position(index, 300.0, 300.0, 10.0, 20.0, 80.0) == (10.0, 20.0)